@@ -2,6 +2,36 @@
 # SISTEMA DE GESTIÓN DE RECURSOS HUMANOS Y PROYECTOS
 # ================================
 
+import argparse
+import asyncio
+import collections
+import concurrent.futures
+import csv
+import gc
+import heapq
+import itertools
+import math
+import multiprocessing
+import operator
+import os
+import sys
+import threading
+import time
+from array import array
+
+try:
+    import numpy
+except ImportError:  # NumPy es opcional: sin él la nómina columnar usa array de la biblioteca estándar
+    numpy = None
+
+from modelo import (Desarrollador, Diseñador, Empleado, Gerente, Proyecto, RegistroEmpleados, RegistroProyectos,
+                    asignar_proyectos_en_lote, calcular_estadisticas_en_paralelo, construir_empleado_desde_fila,
+                    interpretar_fila, normalizar_categoria_compensacion, tabla_compensacion)
+from persistencia import (AlmacenConDiario, AlmacenSQLite, InstantaneaBinaria, RegistroEmpleadosPersistente,
+                          RegistroProyectosPersistente, guardar_instantanea)
+from instrumentacion import Instrumentacion
+from servicio import ServicioRRHH, ejecutar_prueba_carga, mostrar_resultado_carga, servir
+
 
 # ================================
 # FUNCIONES DEL MENÚ PRINCIPAL
@@ -21,7 +51,7 @@ def mostrar_menu_principal():
     print("=" * 50)
 
 
-def crear_nuevo_empleado(lista_empleados):
+def crear_nuevo_empleado(registro_empleados):
     print("\n" + "-" * 50)
     print("   REGISTRO DE NUEVO EMPLEADO")
     print("-" * 50)
@@ -66,16 +96,15 @@ def crear_nuevo_empleado(lista_empleados):
         departamento = input("Departamento de gerencia: ").strip()
         nuevo_empleado = Gerente(nombre_completo, salario_base, departamento)
     
-    # SIN APPEND - usando concatenación
-    lista_empleados = lista_empleados + [nuevo_empleado]
+    registro_empleados = registro_empleados.agregar(nuevo_empleado)
     print("\nEmpleado registrado exitosamente")
     print(f"ID: {nuevo_empleado.obtener_id_empleado()}")
     print(f"Nombre: {nuevo_empleado.obtener_nombre_completo()}")
     print(f"Tipo: {nuevo_empleado.tipo_empleado}")
-    return lista_empleados  # Importante: retornar la lista actualizada
+    return registro_empleados  # Importante: retornar el registro actualizado
 
 
-def crear_nuevo_proyecto(lista_proyectos):
+def crear_nuevo_proyecto(registro_proyectos):
     print("\n" + "-" * 50)
     print("   CREACIÓN DE NUEVO PROYECTO")
     print("-" * 50)
@@ -97,102 +126,67 @@ def crear_nuevo_proyecto(lista_proyectos):
     
     nuevo_proyecto = Proyecto(nombre_proyecto, presupuesto_asignado)
     
-    # SIN APPEND - usando concatenación
-    lista_proyectos = lista_proyectos + [nuevo_proyecto]
+    registro_proyectos = registro_proyectos.agregar(nuevo_proyecto)
     print("\nProyecto creado exitosamente")
     print(f"Nombre: {nuevo_proyecto.nombre_proyecto}")
     print(f"ID: {nuevo_proyecto.id_proyecto}")
     print(f"Presupuesto: ${nuevo_proyecto.presupuesto_asignado:,.2f}")
-    return lista_proyectos  # Importante: retornar la lista actualizada
+    return registro_proyectos  # Importante: retornar el registro actualizado
 
 
-def asignar_proyecto_empleado(lista_empleados, lista_proyectos):
+def asignar_proyecto_empleado(registro_empleados, registro_proyectos):
     print("\n" + "-" * 50)
     print("   ASIGNACIÓN DE PROYECTO A EMPLEADO")
     print("-" * 50)
     
-    if not lista_empleados:
+    if not registro_empleados:
         print("Error: No hay empleados registrados en el sistema")
-        return lista_empleados, lista_proyectos
+        return registro_empleados, registro_proyectos
     
-    if not lista_proyectos:
+    if not registro_proyectos:
         print("Error: No hay proyectos creados en el sistema")
-        return lista_empleados, lista_proyectos
+        return registro_empleados, registro_proyectos
     
     print("\nLISTA DE EMPLEADOS DISPONIBLES")
-    for empleado in lista_empleados:
-        info_basica = empleado.obtener_informacion_empleado()
-        if hasattr(empleado, 'tipo_empleado'):
-            info_basica += f", Tipo: {empleado.tipo_empleado}"
-        print(info_basica)
-    
-    while True:
-        try:
-            id_empleado = int(input("\nIngrese ID del empleado a asignar: "))
-            empleado_seleccionado = None
-            
-            for empleado in lista_empleados:
-                if empleado.obtener_id_empleado() == id_empleado:
-                    empleado_seleccionado = empleado
-                    break
-            
-            if empleado_seleccionado:
-                break
-            else:
-                print("Error: No existe un empleado con ese ID")
-        except ValueError:
-            print("Error: Debe ingresar un número válido")
+    mostrar_primera_pagina(registro_empleados, resumir_empleado, "empleados")
+    empleado_seleccionado = seleccionar_por_id_o_nombre(registro_empleados, "empleado", "a asignar",
+                                                        resumir_empleado)
     
     print("\nLISTA DE PROYECTOS DISPONIBLES")
-    for indice, proyecto in enumerate(lista_proyectos):
-        print(f"{indice + 1}. {proyecto.obtener_informacion_proyecto()}")
-    
-    while True:
-        try:
-            seleccion = int(input("\nSeleccione el número del proyecto a asignar: "))
-            if 1 <= seleccion <= len(lista_proyectos):
-                proyecto_seleccionado = lista_proyectos[seleccion - 1]
-                break
-            else:
-                print(f"Error: Debe seleccionar un número entre 1 y {len(lista_proyectos)}")
-        except ValueError:
-            print("Error: Debe ingresar un número válido")
-    
-    try:
-        empleado_seleccionado.asignar_proyecto_empleado(proyecto_seleccionado)
+    mostrar_primera_pagina(registro_proyectos, Proyecto.obtener_informacion_proyecto, "proyectos")
+    proyecto_seleccionado = seleccionar_por_id_o_nombre(registro_proyectos, "proyecto", "a asignar",
+                                                        Proyecto.obtener_informacion_proyecto)
+    
+    # Por el lote: si falla el guardado se deshace también el enlace en memoria
+    (resultado,) = asignar_proyectos_en_lote(
+        registro_empleados, registro_proyectos,
+        [(empleado_seleccionado.id_empleado, proyecto_seleccionado.id_proyecto)], todo_o_nada=True)
+    if resultado.aplicada:
+        print(f"Proyecto '{proyecto_seleccionado.nombre_proyecto}' asignado a "
+              f"{empleado_seleccionado.nombre_completo}")
         print("Asignación realizada exitosamente")
-    except ValueError as error:
-        print(f"Error en asignación: {error}")
+    else:
+        print(f"Error en asignación: {resultado.motivo}")
     
-    return lista_empleados, lista_proyectos
+    return registro_empleados, registro_proyectos
 
 
-def validar_factibilidad_proyecto(lista_proyectos):
+def validar_factibilidad_proyecto(registro_proyectos):
     print("\n" + "-" * 50)
     print("   VALIDACIÓN DE FACTIBILIDAD DE PROYECTO")
     print("-" * 50)
     
-    if not lista_proyectos:
+    if not registro_proyectos:
         print("Error: No hay proyectos creados en el sistema")
         return
     
     print("\nLISTA DE PROYECTOS DISPONIBLES")
-    for indice, proyecto in enumerate(lista_proyectos):
-        print(f"{indice + 1}. {proyecto.obtener_informacion_proyecto()}")
-    
-    while True:
-        try:
-            seleccion = int(input("\nSeleccione el número del proyecto a validar: "))
-            if 1 <= seleccion <= len(lista_proyectos):
-                proyecto_seleccionado = lista_proyectos[seleccion - 1]
-                break
-            else:
-                print(f"Error: Debe seleccionar un número entre 1 y {len(lista_proyectos)}")
-        except ValueError:
-            print("Error: Debe ingresar un número válido")
+    mostrar_primera_pagina(registro_proyectos, Proyecto.obtener_informacion_proyecto, "proyectos")
+    proyecto_seleccionado = seleccionar_por_id_o_nombre(registro_proyectos, "proyecto", "a validar",
+                                                        Proyecto.obtener_informacion_proyecto)
     
     costo_total = proyecto_seleccionado.calcular_costo_total_proyecto()
-    es_factible = proyecto_seleccionado.verificar_factibilidad_proyecto()
+    margen = proyecto_seleccionado.calcular_margen_proyecto()
     
     print("\nRESULTADO DE VALIDACIÓN")
     print(f"Proyecto: {proyecto_seleccionado.nombre_proyecto}")
@@ -200,276 +194,774 @@ def validar_factibilidad_proyecto(lista_proyectos):
     print(f"Costo total calculado: ${costo_total:,.2f}")
     print(f"Empleados asignados: {len(proyecto_seleccionado.lista_empleados_asignados)}")
     
-    if es_factible:
-        margen = proyecto_seleccionado.presupuesto_asignado - costo_total
+    if margen >= 0:
         print("RESULTADO: El proyecto ES FACTIBLE económicamente")
         print(f"Margen disponible: ${margen:,.2f}")
     else:
-        deficit = costo_total - proyecto_seleccionado.presupuesto_asignado
         print("RESULTADO: El proyecto NO ES FACTIBLE económicamente")
-        print(f"Deficit presupuestario: ${deficit:,.2f}")
+        print(f"Deficit presupuestario: ${-margen:,.2f}")
 
 
-def generar_reporte_general(lista_empleados, lista_proyectos):
+def generar_reporte_general(registro_empleados, registro_proyectos, procesos=1):
+    estadisticas = calcular_estadisticas_en_paralelo(registro_empleados, registro_proyectos, procesos)
+    
     print("\n" + "=" * 60)
     print("           REPORTE GENERAL DEL SISTEMA")
     print("=" * 60)
     
     print("\nESTADÍSTICAS DE EMPLEADOS")
-    print(f"Total de empleados registrados: {len(lista_empleados)}")
+    print(f"Total de empleados registrados: {estadisticas.total_empleados}")
     
-    if lista_empleados:
-        desarrolladores = [e for e in lista_empleados if isinstance(e, Desarrollador)]
-        diseñadores = [e for e in lista_empleados if isinstance(e, Diseñador)]
-        gerentes = [e for e in lista_empleados if isinstance(e, Gerente)]
-        
-        print(f"  Desarrolladores: {len(desarrolladores)}")
-        print(f"  Diseñadores: {len(diseñadores)}")
-        print(f"  Gerentes: {len(gerentes)}")
-        
-        empleados_con_proyectos = [e for e in lista_empleados if e.obtener_cantidad_proyectos() > 0]
-        print(f"Empleados con proyectos asignados: {len(empleados_con_proyectos)}")
+    if estadisticas.total_empleados:
+        print(f"  Desarrolladores: {estadisticas.total_desarrolladores}")
+        print(f"  Diseñadores: {estadisticas.total_diseñadores}")
+        print(f"  Gerentes: {estadisticas.total_gerentes}")
+        print(f"Empleados con proyectos asignados: {estadisticas.empleados_con_proyectos}")
     
     print("\nESTADÍSTICAS DE PROYECTOS")
-    print(f"Total de proyectos creados: {len(lista_proyectos)}")
+    print(f"Total de proyectos creados: {estadisticas.total_proyectos}")
     
-    if lista_proyectos:
-        proyectos_factibles = [p for p in lista_proyectos if p.verificar_factibilidad_proyecto()]
-        proyectos_no_factibles = [p for p in lista_proyectos if not p.verificar_factibilidad_proyecto()]
-        
-        print(f"  Proyectos factibles: {len(proyectos_factibles)}")
-        print(f"  Proyectos no factibles: {len(proyectos_no_factibles)}")
-        
-        proyectos_sin_empleados = [p for p in lista_proyectos if len(p.lista_empleados_asignados) == 0]
-        print(f"Proyectos sin empleados asignados: {len(proyectos_sin_empleados)}")
+    if estadisticas.total_proyectos:
+        print(f"  Proyectos factibles: {estadisticas.proyectos_factibles}")
+        print(f"  Proyectos no factibles: {estadisticas.proyectos_no_factibles}")
+        print(f"Proyectos sin empleados asignados: {estadisticas.proyectos_sin_empleados}")
+        print(f"Costo total de proyectos: ${estadisticas.costo_total_proyectos:,.2f}")
     
     print("\n" + "=" * 60)
 
 
-def mostrar_informacion_empleados(lista_empleados):
+def mostrar_informacion_empleados(registro_empleados):
     print("\n" + "=" * 60)
     print("       INFORMACIÓN DETALLADA DE EMPLEADOS")
     print("=" * 60)
     
-    if not lista_empleados:
+    if not registro_empleados:
         print("No hay empleados registrados en el sistema")
         return
     
-    for empleado in lista_empleados:
-        print("\n" + "-" * 50)
-        print(empleado.obtener_informacion_completa())
-        print("-" * 50)
+    tipo_empleado = input("Filtrar por tipo (Desarrollador/Diseñador/Gerente, Enter para todos): ").strip() or None
+    while True:
+        try:
+            id_desde = int(input("ID desde (Enter para el primero): ").strip() or 1)
+            id_hasta = input("ID hasta (Enter para el último): ").strip()
+            id_hasta = int(id_hasta) if id_hasta else None
+            break
+        except ValueError:
+            print("Error: Debe ingresar un número válido")
+    ruta_salida = input("Archivo de salida (Enter para mostrar en pantalla): ").strip()
+    
+    empleados = seleccionar_empleados(registro_empleados, tipo_empleado, id_desde, id_hasta)
+    if ruta_salida:
+        with open(ruta_salida, "w", encoding="utf-8") as archivo:
+            cantidad = escribir_en_bloques(renderizar_empleados(empleados), archivo)
+        print(f"{cantidad} empleados escritos en {ruta_salida}")
+        return
+    
+    # En pantalla se muestra una página a la vez; solo se formatean los empleados mostrados
+    pagina = 0
+    while True:
+        cantidad = escribir_en_bloques(
+            renderizar_empleados(itertools.islice(empleados, TAMANO_PAGINA_LISTADO)), sys.stdout)
+        pagina += 1
+        if cantidad == 0 and pagina == 1:
+            print("No hay empleados que coincidan con el filtro")
+        if cantidad < TAMANO_PAGINA_LISTADO:
+            break
+        if input(f"\nPágina {pagina}. Enter para continuar, 'q' para terminar: ").strip().lower() == "q":
+            break
 
 
 # ================================
-# DEFINICIÓN DE CLASES DEL SISTEMA
+# LISTADOS CON BUFFER
 # ================================
 
-class Empleado:
-    contador_id_empleado = 1
-    
-    def __init__(self, nombre_completo, salario_base):
-        self.id_empleado = Empleado.contador_id_empleado
-        Empleado.contador_id_empleado += 1
-        self.nombre_completo = nombre_completo
-        self.salario_base = salario_base
-        self.lista_proyectos = []
-        self.activo = True
-    
-    def obtener_id_empleado(self):
-        return self.id_empleado
-    
-    def obtener_nombre_completo(self):
-        return self.nombre_completo
-    
-    def calcular_salario_total(self):
-        return self.salario_base
-    
-    def asignar_proyecto_empleado(self, proyecto):
-        for proyecto_existente in self.lista_proyectos:
-            if proyecto_existente.nombre_proyecto == proyecto.nombre_proyecto:
-                raise ValueError("El empleado ya está asignado a este proyecto")
-        
-        if len(self.lista_proyectos) >= 3:
-            raise ValueError("Límite máximo de 3 proyectos alcanzado")
-        
-        # SIN APPEND - usando concatenación
-        self.lista_proyectos = self.lista_proyectos + [proyecto]
-        proyecto.agregar_empleado_proyecto(self)
-        print(f"Proyecto '{proyecto.nombre_proyecto}' asignado a {self.nombre_completo}")
-    
-    def obtener_cantidad_proyectos(self):
-        return len(self.lista_proyectos)
-    
-    def obtener_informacion_empleado(self):
-        return (f"ID: {self.id_empleado}, Nombre: {self.nombre_completo}, "
-                f"Proyectos: {self.obtener_cantidad_proyectos()}")
-    
-    def obtener_informacion_completa(self):
-        info = f"ID: {self.id_empleado}\n"
-        info += f"Nombre completo: {self.nombre_completo}\n"
-        info += f"Salario base: ${self.salario_base:,.2f}\n"
-        info += f"Salario total: ${self.calcular_salario_total():,.2f}\n"
-        info += f"Proyectos asignados: {self.obtener_cantidad_proyectos()}\n"
+TAMANO_PAGINA_LISTADO = 20
+MAXIMO_COINCIDENCIAS_BUSQUEDA = 10
+TAMANO_BUFFER_LISTADO = 1 << 16
+
+
+def seleccionar_empleados(registro_empleados, tipo_empleado=None, id_desde=1, id_hasta=None):
+    # Genera los empleados del filtro. Si el rango de IDs es menor que el
+    # registro se consulta el índice por ID en lugar de recorrer todo el registro
+    if id_hasta is not None and id_hasta - id_desde < len(registro_empleados):
+        candidatos = (registro_empleados.buscar_por_id(id_empleado) for id_empleado in range(id_desde, id_hasta + 1))
+    elif tipo_empleado:
+        candidatos = registro_empleados.empleados_de_tipo(tipo_empleado)
+    else:
+        candidatos = iter(registro_empleados)
+    tipo_normalizado = tipo_empleado.lower() if tipo_empleado else None
+    for empleado in candidatos:
+        if empleado is None or empleado.obtener_id_empleado() < id_desde:
+            continue
+        if id_hasta is not None and empleado.obtener_id_empleado() > id_hasta:
+            continue
+        if tipo_normalizado and getattr(empleado, "tipo_empleado", "").lower() != tipo_normalizado:
+            continue
+        yield empleado
+
+
+def renderizar_empleados(empleados):
+    # Genera el texto de cada empleado con el mismo formato del listado original
+    separador = "-" * 50
+    for empleado in empleados:
+        yield f"\n{separador}\n{''.join(empleado.generar_lineas_informacion())}\n{separador}\n"
+
+
+def resumir_empleado(empleado):
+    info_basica = empleado.obtener_informacion_empleado()
+    if hasattr(empleado, 'tipo_empleado'):
+        info_basica += f", Tipo: {empleado.tipo_empleado}"
+    return info_basica
+
+
+def renderizar_resumen_empleados(empleados):
+    for empleado in empleados:
+        yield resumir_empleado(empleado) + "\n"
+
+
+def mostrar_primera_pagina(registro, resumir, descripcion_plural):
+    # Los menús de selección muestran solo una página; el resto se encuentra por nombre
+    mostrados = escribir_en_bloques(
+        (resumir(elemento) + "\n" for elemento in itertools.islice(registro, TAMANO_PAGINA_LISTADO)), sys.stdout)
+    if len(registro) > mostrados:
+        print(f"... y {len(registro) - mostrados} {descripcion_plural} más (escriba parte del nombre para buscar)")
+
+
+def seleccionar_por_id_o_nombre(registro, descripcion, accion, resumir):
+    # Acepta un ID o parte del nombre; con varias coincidencias se muestran y se vuelve a preguntar
+    while True:
+        consulta = input(f"\nIngrese ID o nombre del {descripcion} {accion}: ").strip()
+        if consulta.isdigit():
+            elemento = registro.buscar_por_id(int(consulta))
+            if elemento:
+                return elemento
+            print(f"Error: No existe un {descripcion} con ese ID")
+            continue
+        if not consulta:
+            print("Error: Debe ingresar un ID o un nombre")
+            continue
         
-        if self.lista_proyectos:
-            info += "Proyectos:\n"
-            for proyecto in self.lista_proyectos:
-                info += f"  - {proyecto.nombre_proyecto}\n"
+        coincidencias = registro.buscar_por_nombre(consulta, MAXIMO_COINCIDENCIAS_BUSQUEDA)
+        if not coincidencias:
+            print(f"Error: Ningún {descripcion} coincide con '{consulta}'")
+        elif len(coincidencias) == 1:
+            print(f"Seleccionado: {resumir(coincidencias[0])}")
+            return coincidencias[0]
         else:
-            info += "Proyectos: Ninguno asignado\n"
-            
-        return info
-
-
-class Desarrollador(Empleado):
-    def __init__(self, nombre_completo, salario_base, lenguajes_programacion, nivel_experiencia):
-        super().__init__(nombre_completo, salario_base)
-        self.lenguajes_programacion = [lenguaje.strip() for lenguaje in lenguajes_programacion]
-        self.nivel_experiencia = nivel_experiencia
-        self.tipo_empleado = "Desarrollador"
-    
-    def calcular_salario_total(self):
-        salario_calculado = self.salario_base
-        if self.nivel_experiencia.lower() == "senior":
-            salario_calculado *= 1.25
-        elif self.nivel_experiencia.lower() == "semisenior":
-            salario_calculado *= 1.15
-        return salario_calculado
-    
-    def obtener_porcentaje_bonificacion(self):
-        if self.nivel_experiencia.lower() == "senior":
-            return 25
-        elif self.nivel_experiencia.lower() == "semisenior":
-            return 15
-        return 0
-    
-    def obtener_informacion_completa(self):
-        info = super().obtener_informacion_completa()
-        info += f"Tipo de empleado: {self.tipo_empleado}\n"
-        info += f"Nivel de experiencia: {self.nivel_experiencia}\n"
-        info += f"Lenguajes: {', '.join(self.lenguajes_programacion)}\n"
-        info += f"Bonificación aplicada: {self.obtener_porcentaje_bonificacion()}%\n"
-        return info
-
-
-class Diseñador(Empleado):
-    def __init__(self, nombre_completo, salario_base, herramientas_diseno, especialidad_diseno):
-        super().__init__(nombre_completo, salario_base)
-        self.herramientas_diseno = [herramienta.strip() for herramienta in herramientas_diseno]
-        self.especialidad_diseno = especialidad_diseno
-        self.tipo_empleado = "Diseñador"
-    
-    def calcular_salario_total(self):
-        salario_calculado = self.salario_base
-        if self.especialidad_diseno.lower() in ["ui", "ux"]:
-            salario_calculado *= 1.20
-        return salario_calculado
-    
-    def obtener_informacion_completa(self):
-        info = super().obtener_informacion_completa()
-        info += f"Tipo de empleado: {self.tipo_empleado}\n"
-        info += f"Especialidad: {self.especialidad_diseno}\n"
-        info += f"Herramientas: {', '.join(self.herramientas_diseno)}\n"
-        
-        if self.especialidad_diseno.lower() in ["ui", "ux"]:
-            info += "Bonificación aplicada: 20%\n"
+            print(f"Coincidencias (ingrese el ID del {descripcion} elegido):")
+            escribir_en_bloques((resumir(elemento) + "\n" for elemento in coincidencias), sys.stdout)
+
+
+def escribir_en_bloques(registros, destino, tamano_buffer=TAMANO_BUFFER_LISTADO):
+    # Junta los registros formateados y los escribe en bloques de
+    # tamano_buffer caracteres. Retorna la cantidad de registros escritos
+    buffer = []
+    tamano_actual = 0
+    cantidad = 0
+    for registro in registros:
+        buffer.append(registro)
+        tamano_actual += len(registro)
+        cantidad += 1
+        if tamano_actual >= tamano_buffer:
+            destino.write("".join(buffer))
+            buffer = []
+            tamano_actual = 0
+    if buffer:
+        destino.write("".join(buffer))
+    destino.flush()
+    return cantidad
+
+
+# ================================
+# IMPORTACIÓN MASIVA DE EMPLEADOS
+# ================================
+
+# Solo se guardan los primeros rechazos para que la memoria no crezca con el archivo
+MAXIMO_RECHAZOS_REPORTADOS = 1000
+
+# Empleados que se agregan al registro de una vez durante una importación
+TAMANO_LOTE_IMPORTACION = 10000
+
+
+def decodificar_lineas(archivo, errores):
+    # Una línea que no es UTF-8 se anota en errores y se entrega vacía
+    for numero_linea, linea in enumerate(archivo, start=1):
+        try:
+            yield linea.decode("utf-8-sig" if numero_linea == 1 else "utf-8")
+        except UnicodeDecodeError as error:
+            errores.append((numero_linea, error))
+            yield "\n"
+
+
+def leer_filas_archivo(ruta_archivo):
+    # Recorre el archivo fila por fila sin cargarlo completo en memoria
+    errores = []
+    with open(ruta_archivo, "rb") as archivo:
+        lineas = decodificar_lineas(archivo, errores)
+        if ruta_archivo.lower().endswith(".jsonl"):
+            for numero_linea, linea in enumerate(lineas, start=1):
+                yield from errores
+                errores.clear()
+                if linea.strip():
+                    yield numero_linea, linea
         else:
-            info += "Bonificación aplicada: 0%\n"
-        return info
+            lector = csv.DictReader(lineas)
+            for fila in lector:
+                yield from errores
+                errores.clear()
+                yield lector.line_num, fila
+        yield from errores
 
 
-class Gerente(Empleado):
-    def __init__(self, nombre_completo, salario_base, departamento_gerencia):
-        super().__init__(nombre_completo, salario_base)
-        self.departamento_gerencia = departamento_gerencia
-        self.tipo_empleado = "Gerente"
-    
-    def calcular_salario_total(self):
-        return self.salario_base * 1.35
-    
-    def obtener_informacion_completa(self):
-        info = super().obtener_informacion_completa()
-        info += f"Tipo de empleado: {self.tipo_empleado}\n"
-        info += f"Departamento: {self.departamento_gerencia}\n"
-        info += "Bonificación aplicada: 35%\n"
-        return info
+def importar_empleados_desde_archivo(ruta_archivo, registro_empleados):
+    # Las filas inválidas se informan con su número de línea y no consumen IDs de empleado
+    lote = []
+    total_importados = 0
+    rechazos = []
+    total_rechazados = 0
+    inicio = time.perf_counter()
 
+    for numero_linea, fila in leer_filas_archivo(ruta_archivo):
+        try:
+            lote.append(construir_empleado_desde_fila(interpretar_fila(fila)))
+        except ValueError as error:
+            total_rechazados += 1
+            if len(rechazos) < MAXIMO_RECHAZOS_REPORTADOS:
+                rechazos.append((numero_linea, str(error)))
+            continue
+        if len(lote) == TAMANO_LOTE_IMPORTACION:
+            registro_empleados = registro_empleados.extender(lote)
+            total_importados += len(lote)
+            lote = []
 
-class Proyecto:
-    contador_id_proyecto = 1
-    
-    def __init__(self, nombre_proyecto, presupuesto_asignado):
-        self.id_proyecto = Proyecto.contador_id_proyecto
-        Proyecto.contador_id_proyecto += 1
-        self.nombre_proyecto = nombre_proyecto
-        self.presupuesto_asignado = presupuesto_asignado
-        self.lista_empleados_asignados = []
-        self.estado_proyecto = "Planificación"
-    
-    def agregar_empleado_proyecto(self, empleado):
-        # SIN APPEND - usando concatenación
-        self.lista_empleados_asignados = self.lista_empleados_asignados + [empleado]
-    
-    def calcular_costo_total_proyecto(self):
-        costo_total = 0
-        for empleado in self.lista_empleados_asignados:
-            costo_total += empleado.calcular_salario_total()
-        return costo_total
-    
-    def verificar_factibilidad_proyecto(self):
-        costo_total = self.calcular_costo_total_proyecto()
-        return costo_total <= self.presupuesto_asignado
-    
-    def obtener_informacion_proyecto(self):
-        return (f"ID: {self.id_proyecto}, Nombre: {self.nombre_proyecto}, "
-                f"Empleados: {len(self.lista_empleados_asignados)}, "
-                f"Presupuesto: ${self.presupuesto_asignado:,.2f}")
+    registro_empleados = registro_empleados.extender(lote)
+    total_importados += len(lote)
+
+    segundos = time.perf_counter() - inicio
+    total_filas = total_importados + total_rechazados
+    resumen = {
+        "importados": total_importados,
+        "rechazados": total_rechazados,
+        "rechazos": rechazos,
+        "segundos": segundos,
+        "filas_por_segundo": total_filas / segundos if segundos > 0 else 0.0,
+    }
+    return registro_empleados, resumen  # Importante: retornar el registro actualizado
+
+
+def mostrar_resumen_importacion(resumen):
+    print("\n" + "-" * 50)
+    print("   RESUMEN DE IMPORTACIÓN")
+    print("-" * 50)
+    print(f"Empleados importados: {resumen['importados']}")
+    print(f"Filas rechazadas: {resumen['rechazados']}")
+    for numero_linea, mensaje in resumen["rechazos"]:
+        print(f"  Línea {numero_linea}: {mensaje}")
+    if resumen["rechazados"] > len(resumen["rechazos"]):
+        print(f"  ... y {resumen['rechazados'] - len(resumen['rechazos'])} rechazos más")
+    print(f"Tiempo: {resumen['segundos']:.2f} s ({resumen['filas_por_segundo']:,.0f} filas/s)")
+
+
+# ================================
+# SELECCIÓN DE EQUIPOS CON PRESUPUESTO
+# ================================
+
+# Hasta este tamaño de grupo se busca el óptimo con ramificación y acotamiento
+TAMANO_MAXIMO_EXACTO = 60
+
+SeleccionEquipo = collections.namedtuple("SeleccionEquipo",
+                                         ["empleados", "costo_total", "valor_total", "es_optimo"])
+
+
+def valorar_candidato(empleado):
+    # Puntaje por defecto: el multiplicador salarial refleja la experiencia y cada habilidad suma
+    habilidades, _ = empleado.obtener_perfil_habilidades()
+    return empleado.calcular_salario_total() / empleado.salario_base + 0.1 * len(habilidades)
+
+
+def ordenar_por_densidad(costos, valores):
+    return sorted(range(len(costos)), key=lambda posicion: valores[posicion] / costos[posicion], reverse=True)
+
+
+def calcular_cota_fraccional(costos, valores, orden, desde, presupuesto):
+    # Máximo valor alcanzable si se pudiera tomar una fracción del último candidato
+    valor = 0.0
+    for posicion in orden[desde:]:
+        if costos[posicion] <= presupuesto:
+            presupuesto -= costos[posicion]
+            valor += valores[posicion]
+        else:
+            return valor + valores[posicion] * presupuesto / costos[posicion]
+    return valor
+
+
+def seleccionar_voraz(costos, valores, presupuesto):
+    # Toma por orden de valor/costo todo lo que entra; el mejor candidato
+    # individual se compara al final, lo que garantiza al menos la mitad del óptimo
+    seleccion = []
+    valor = 0.0
+    espacio = presupuesto
+    for posicion in ordenar_por_densidad(costos, valores):
+        if costos[posicion] <= espacio:
+            espacio -= costos[posicion]
+            valor += valores[posicion]
+            seleccion.append(posicion)
+    mejor_individual = max((posicion for posicion in range(len(costos)) if costos[posicion] <= presupuesto),
+                           key=valores.__getitem__, default=None)
+    if mejor_individual is not None and valores[mejor_individual] > valor:
+        return [mejor_individual], valores[mejor_individual]
+    return seleccion, valor
+
+
+def seleccionar_exacto(costos, valores, presupuesto, instante_limite):
+    # Ramificación y acotamiento desde la solución voraz; al agotar el tiempo retorna la mejor hallada
+    orden = ordenar_por_densidad(costos, valores)
+    mejor_seleccion, mejor_valor = seleccionar_voraz(costos, valores, presupuesto)
+    seleccion = []
+    nodos_visitados = 0
+    tiempo_agotado = False
+
+    def explorar(desde, espacio, valor):
+        nonlocal mejor_seleccion, mejor_valor, nodos_visitados, tiempo_agotado
+        if valor > mejor_valor:
+            mejor_seleccion, mejor_valor = list(seleccion), valor
+        if desde == len(orden) or tiempo_agotado:
+            return
+        nodos_visitados += 1
+        if nodos_visitados % 4096 == 0 and time.perf_counter() > instante_limite:
+            tiempo_agotado = True
+            return
+        if valor + calcular_cota_fraccional(costos, valores, orden, desde, espacio) <= mejor_valor:
+            return
+        posicion = orden[desde]
+        if costos[posicion] <= espacio:
+            seleccion.append(posicion)
+            explorar(desde + 1, espacio - costos[posicion], valor + valores[posicion])
+            seleccion.pop()
+        explorar(desde + 1, espacio, valor)
+
+    explorar(0, presupuesto, 0.0)
+    return mejor_seleccion, mejor_valor, not tiempo_agotado
+
+
+def seleccionar_equipo(proyecto, candidatos, valorar=valorar_candidato, limite_segundos=1.0,
+                       tamano_maximo_exacto=TAMANO_MAXIMO_EXACTO):
+    # Equipo de mayor valor dentro del margen del proyecto; se aplica con asignar_proyectos_en_lote
+    instante_limite = time.perf_counter() + limite_segundos
+    elegibles = {}
+    for empleado in candidatos:
+        if (empleado.obtener_cantidad_proyectos() < empleado.limite_proyectos
+                and not empleado.tiene_proyecto(proyecto)):
+            elegibles[empleado.obtener_id_empleado()] = empleado
+    elegibles = list(elegibles.values())
+    presupuesto = proyecto.calcular_margen_proyecto()
+    if not elegibles or presupuesto <= 0:
+        return SeleccionEquipo([], 0.0, 0.0, True)
+
+    costos = [empleado.calcular_salario_total() for empleado in elegibles]
+    valores = [valorar(empleado) for empleado in elegibles]
+    if len(elegibles) <= tamano_maximo_exacto:
+        seleccion, valor_total, es_optimo = seleccionar_exacto(costos, valores, presupuesto, instante_limite)
+    else:
+        seleccion, valor_total = seleccionar_voraz(costos, valores, presupuesto)
+        es_optimo = False
+    seleccion.sort()
+    return SeleccionEquipo([elegibles[posicion] for posicion in seleccion],
+                           sum(costos[posicion] for posicion in seleccion), valor_total, es_optimo)
+
+
+# ================================
+# PLANIFICACIÓN GLOBAL DE ASIGNACIONES
+# ================================
+
+# Plan completo; proyectos_no_factibles son pares (id_proyecto, motivo)
+PlanAsignacion = collections.namedtuple("PlanAsignacion",
+                                        ["pares", "proyectos_no_factibles", "ids_empleados_sin_proyecto"])
+
+# Cada proyecto conserva al menos un centavo de margen para que el redondeo
+# del costo acumulado no lo deje fuera de presupuesto por una fracción
+HOLGURA_PRESUPUESTO = 0.01
+
+
+def planificar_asignaciones(empleados, proyectos):
+    # Por rondas: en cada una los más baratos eligen primero el proyecto con más margen
+    proyectos_no_factibles = []
+    monticulo = []
+    for proyecto in proyectos:
+        margen = proyecto.calcular_margen_proyecto()
+        if margen < 0:
+            proyectos_no_factibles.append((proyecto.id_proyecto,
+                                           f"El costo actual excede el presupuesto en ${-margen:,.2f}"))
+        else:
+            monticulo.append((HOLGURA_PRESUPUESTO - margen, proyecto.id_proyecto, proyecto))
+    heapq.heapify(monticulo)
+
+    candidatos = sorted((empleado.calcular_salario_total(), empleado.id_empleado, empleado)
+                        for empleado in empleados
+                        if empleado.activo and len(empleado.ids_proyectos_asignados) < empleado.limite_proyectos)
+    sin_proyecto = [candidato for candidato in candidatos if not candidato[2].ids_proyectos_asignados]
+    pares = []
+    proyectos_por_empleado = {}
+    ids_proyectos_en_plan = set()
+
+    while candidatos:
+        siguientes = []
+        for costo, id_empleado, empleado in candidatos:
+            # Si el proyecto con más margen no alcanza, tampoco alcanza para los siguientes, más caros
+            if not monticulo or -monticulo[0][0] < costo:
+                break
+            ids_en_lote = proyectos_por_empleado.get(id_empleado, ())
+            apartados = []
+            elegido = None
+            while monticulo and -monticulo[0][0] >= costo:
+                entrada = heapq.heappop(monticulo)
+                if empleado.obtener_motivo_rechazo(entrada[2], ids_en_lote) is None:
+                    elegido = entrada
+                    break
+                apartados.append(entrada)
+            for entrada in apartados:
+                heapq.heappush(monticulo, entrada)
+            if elegido is None:
+                continue
+
+            margen_negativo, id_proyecto, proyecto = elegido
+            heapq.heappush(monticulo, (margen_negativo + costo, id_proyecto, proyecto))
+            ids_en_lote += (id_proyecto,)
+            proyectos_por_empleado[id_empleado] = ids_en_lote
+            pares.append((id_empleado, id_proyecto))
+            ids_proyectos_en_plan.add(id_proyecto)
+            if len(empleado.ids_proyectos_asignados) + len(ids_en_lote) < empleado.limite_proyectos:
+                siguientes.append((costo, id_empleado, empleado))
+        candidatos = siguientes
+
+    for _, id_proyecto, proyecto in sorted(monticulo, key=lambda entrada: entrada[1]):
+        if not proyecto.ids_empleados_asignados and id_proyecto not in ids_proyectos_en_plan:
+            proyectos_no_factibles.append((id_proyecto, "Ningún empleado disponible entra en el presupuesto"))
+    ids_empleados_sin_proyecto = [id_empleado for _, id_empleado, empleado in sin_proyecto
+                                  if id_empleado not in proyectos_por_empleado]
+    return PlanAsignacion(pares, proyectos_no_factibles, ids_empleados_sin_proyecto)
+
+
+def asignar_todos_los_proyectos(registro_empleados, registro_proyectos):
+    # Planifica y aplica el plan con las reglas de asignar_proyectos_en_lote; el
+    # lote es todo o nada, así un plan que las reglas rechacen no queda a medias
+    plan = planificar_asignaciones(registro_empleados, registro_proyectos)
+    resultados = asignar_proyectos_en_lote(registro_empleados, registro_proyectos, plan.pares, todo_o_nada=True)
+    return plan, resultados
+
+
+# ================================
+# NÓMINA COLUMNAR
+# ================================
+
+class NominaColumnar:
+    # Columnas tipadas: el multiplicador de cada empleado ya viene de su regla
+    def __init__(self):
+        self.ids_empleado = array("q")
+        self.salarios_base = array("d")
+        self.multiplicadores = array("d")
+    
+    @classmethod
+    def desde_empleados(cls, empleados):
+        nomina = cls()
+        for empleado in empleados:
+            nomina.agregar_empleado(empleado)
+        return nomina
+    
+    def agregar_empleado(self, empleado):
+        self.ids_empleado.append(empleado.obtener_id_empleado())
+        self.salarios_base.append(empleado.salario_base)
+        self.multiplicadores.append(empleado.regla_compensacion.multiplicador)
+    
+    def __len__(self):
+        return len(self.ids_empleado)
+    
+    def calcular_salarios_totales(self):
+        if numpy is not None:
+            salarios = numpy.frombuffer(self.salarios_base, dtype=numpy.float64)
+            return salarios * numpy.frombuffer(self.multiplicadores, dtype=numpy.float64)
+        return array("d", map(operator.mul, self.salarios_base, self.multiplicadores))
+    
+    def calcular_total_nomina(self):
+        if numpy is not None:
+            return float(self.calcular_salarios_totales().sum())
+        return math.fsum(self.calcular_salarios_totales())
+
+
+# ================================
+# ESCENARIOS SALARIALES
+# ================================
+
+# Resultado de un escenario; los proyectos se informan como (id_proyecto, margen en el escenario)
+ResultadoEscenario = collections.namedtuple("ResultadoEscenario",
+                                            ["nombre", "empleados_afectados", "diferencia_costo_total",
+                                             "proyectos_no_factibles", "proyectos_recuperados"])
+
+# Escenarios y grupos que heredan los procesos de evaluar_escenarios al crearse con fork
+datos_escenarios_paralelo = None
+
+
+def obtener_grupo_salarial(empleado):
+    # (tipo de empleado, categoría normalizada), la misma clave con la que la
+    # tabla de compensación resuelve la regla del empleado
+    return (getattr(empleado, "tipo_empleado", "Empleado"),
+            normalizar_categoria_compensacion(empleado.obtener_categoria_compensacion()))
+
+
+class EscenarioSalarial:
+    # Solo guarda lo que cambia; los empleados reales nunca se modifican
+    def __init__(self, nombre, multiplicadores_por_categoria=None, factores_salario_base=None, salarios_base=None):
+        self.nombre = nombre
+        self.multiplicadores_por_categoria = {(tipo, normalizar_categoria_compensacion(categoria)): multiplicador
+                                              for (tipo, categoria), multiplicador
+                                              in dict(multiplicadores_por_categoria or {}).items()}
+        self.factores_salario_base = dict(factores_salario_base or {})
+        self.salarios_base = dict(salarios_base or {})
+    
+    def afecta_grupo(self, tipo, categoria):
+        return (tipo, categoria) in self.multiplicadores_por_categoria or tipo in self.factores_salario_base
+    
+    def calcular_salario_total(self, empleado):
+        grupo = obtener_grupo_salarial(empleado)
+        salario_base = self.salarios_base.get(empleado.id_empleado, empleado.salario_base)
+        salario_base *= self.factores_salario_base.get(grupo[0], 1.0)
+        return salario_base * self.multiplicadores_por_categoria.get(grupo,
+                                                                     empleado.regla_compensacion.multiplicador)
+
+
+class GruposSalariales:
+    # Empleados con proyectos por (tipo, categoría), compartidos entre escenarios
+    def __init__(self, registro_empleados):
+        self.registro_empleados = registro_empleados
+        self.empleados_por_grupo = collections.defaultdict(list)
+        for empleado in registro_empleados:
+            if empleado.lista_proyectos:
+                self.empleados_por_grupo[obtener_grupo_salarial(empleado)].append(empleado)
+    
+    def obtener_afectados(self, escenario):
+        for (tipo, categoria), empleados in self.empleados_por_grupo.items():
+            if escenario.afecta_grupo(tipo, categoria):
+                yield from empleados
+        for id_empleado in escenario.salarios_base:
+            empleado = self.registro_empleados.buscar_por_id(id_empleado)
+            # Los de un grupo afectado ya se recorrieron arriba
+            if (empleado is not None and empleado.lista_proyectos
+                    and not escenario.afecta_grupo(*obtener_grupo_salarial(empleado))):
+                yield empleado
+
+
+def evaluar_escenario(escenario, grupos):
+    # Solo se recalculan los empleados afectados y los proyectos en los que
+    # trabajan; el costo en el escenario es el acumulado real más la diferencia
+    diferencias_por_proyecto = collections.defaultdict(float)
+    proyectos_por_id = {}
+    empleados_afectados = 0
+    for empleado in grupos.obtener_afectados(escenario):
+        empleados_afectados += 1
+        diferencia = escenario.calcular_salario_total(empleado) - empleado.calcular_salario_total()
+        for proyecto in empleado.lista_proyectos:
+            diferencias_por_proyecto[proyecto.id_proyecto] += diferencia
+            proyectos_por_id[proyecto.id_proyecto] = proyecto
+    
+    proyectos_no_factibles = []
+    proyectos_recuperados = []
+    for id_proyecto, diferencia in sorted(diferencias_por_proyecto.items()):
+        margen = proyectos_por_id[id_proyecto].calcular_margen_proyecto()
+        margen_escenario = margen - diferencia
+        if margen >= 0 > margen_escenario:
+            proyectos_no_factibles.append((id_proyecto, margen_escenario))
+        elif margen_escenario >= 0 > margen:
+            proyectos_recuperados.append((id_proyecto, margen_escenario))
+    return ResultadoEscenario(escenario.nombre, empleados_afectados, math.fsum(diferencias_por_proyecto.values()),
+                              proyectos_no_factibles, proyectos_recuperados)
+
+
+def evaluar_escenario_heredado(posicion):
+    # Se ejecuta en un proceso hijo sobre los grupos y escenarios heredados
+    escenarios, grupos = datos_escenarios_paralelo
+    return evaluar_escenario(escenarios[posicion], grupos)
+
+
+def evaluar_escenarios(escenarios, registro_empleados, procesos=None):
+    # Los hijos heredan los grupos por fork; el llamador debe tomar bloqueo_estado
+    global datos_escenarios_paralelo
+    escenarios = list(escenarios)
+    grupos = GruposSalariales(registro_empleados)
+    procesos = min(procesos or os.cpu_count() or 1, len(escenarios))
+    if procesos <= 1 or "fork" not in multiprocessing.get_all_start_methods():
+        return [evaluar_escenario(escenario, grupos) for escenario in escenarios]
+    
+    datos_escenarios_paralelo = (escenarios, grupos)
+    gc.freeze()
+    try:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=procesos,
+                                                    mp_context=multiprocessing.get_context("fork")) as ejecutor:
+            return list(ejecutor.map(evaluar_escenario_heredado, range(len(escenarios))))
+    finally:
+        gc.unfreeze()
+        datos_escenarios_paralelo = None
 
 
 # ================================
 # PROGRAMA PRINCIPAL
 # ================================
 
+# Mide las acciones del menú de este módulo con --metricas
+instrumentacion = Instrumentacion(sys.modules[__name__])
+
+
+def cerrar_y_guardar_instantanea(ruta_archivo, registro_empleados, registro_proyectos, almacen):
+    # Se materializa todo y se cierra la instantánea abierta antes de reemplazar el archivo
+    empleados = list(registro_empleados)
+    proyectos = list(registro_proyectos)
+    if almacen is not None:
+        almacen.cerrar()
+    guardar_instantanea(ruta_archivo, empleados, proyectos)
+    print(f"Instantánea guardada en {ruta_archivo}")
+
+
 def main():
-    lista_empleados = []
-    lista_proyectos = []
+    parser = argparse.ArgumentParser(description="Sistema de gestión de RRHH y proyectos")
+    parser.add_argument("--importar", metavar="ARCHIVO",
+                        help="importa empleados desde un archivo CSV o JSONL antes de abrir el menú")
+    parser.add_argument("--metricas", metavar="ARCHIVO",
+                        help="mide las acciones del menú y los métodos más usados y al terminar guarda las "
+                             "métricas en ARCHIVO (.json: instantánea JSON; otra extensión: texto de Prometheus)")
+    parser.add_argument("--metricas-memoria", action="store_true",
+                        help="con --metricas, registra también los bytes netos de cada operación (más lento)")
+    parser.add_argument("--servir", type=int, metavar="PUERTO",
+                        help="atiende el servicio HTTP en 127.0.0.1:PUERTO en lugar del menú")
+    parser.add_argument("--carga", type=int, metavar="PUERTO",
+                        help="ejecuta la prueba de carga contra un servicio local en PUERTO y termina")
+    almacenamiento = parser.add_mutually_exclusive_group()
+    almacenamiento.add_argument("--base-datos", metavar="ARCHIVO",
+                                help="guarda y carga los datos en una base de datos SQLite")
+    almacenamiento.add_argument("--instantanea", metavar="ARCHIVO",
+                                help="restaura los datos desde una instantánea binaria y la guarda al salir")
+    almacenamiento.add_argument("--diario", metavar="BASE",
+                                help="registra cada cambio en BASE.diario y compacta en BASE.instantanea")
+    parser.add_argument("--verificar-costos", action="store_true",
+                        help="compara cada costo acumulado de proyecto con un recálculo completo")
+    parser.add_argument("--procesos-reporte", type=int, default=1, metavar="N",
+                        help="calcula el reporte general en N procesos (por defecto %(default)s: sin paralelismo)")
+    parser.add_argument("--reglas-compensacion", metavar="ARCHIVO",
+                        help="carga las bonificaciones por tipo y categoría desde un archivo JSON "
+                             "en lugar de las reglas predeterminadas")
+    parser.add_argument("--limite-proyectos", type=int, default=Empleado.limite_proyectos, metavar="N",
+                        help="máximo de proyectos simultáneos por empleado (por defecto %(default)s)")
+    argumentos = parser.parse_args()
+    Proyecto.verificar_consistencia_costos = argumentos.verificar_costos
+    if argumentos.limite_proyectos < 1:
+        parser.error("--limite-proyectos debe ser al menos 1")
+    Empleado.limite_proyectos = argumentos.limite_proyectos
+    if argumentos.procesos_reporte < 1:
+        parser.error("--procesos-reporte debe ser al menos 1")
+    if argumentos.metricas_memoria and not argumentos.metricas:
+        parser.error("--metricas-memoria requiere --metricas")
+    if argumentos.reglas_compensacion:
+        try:
+            tabla_compensacion.cargar_archivo(argumentos.reglas_compensacion)
+        except (OSError, ValueError) as error:
+            parser.error(f"--reglas-compensacion: {error}")
+    
+    if not argumentos.metricas:
+        return ejecutar_programa(argumentos)
+    instrumentacion.activar(argumentos.metricas_memoria)
+    try:
+        return ejecutar_programa(argumentos)
+    finally:
+        instrumentacion.desactivar()
+        instrumentacion.exportar(argumentos.metricas)
+        print(f"Métricas guardadas en {argumentos.metricas}")
+
+
+def ejecutar_programa(argumentos):
+    # Las mediciones de rendimiento están en mediciones.py
+    if argumentos.carga is not None:
+        latencias, segundos, errores = asyncio.run(ejecutar_prueba_carga(puerto=argumentos.carga))
+        mostrar_resultado_carga(latencias, segundos, errores)
+        return 0 if errores == 0 else 1
+    
+    almacen = None
+    bloqueo_estado = threading.RLock()
+    if argumentos.base_datos:
+        almacen = AlmacenSQLite(argumentos.base_datos)
+    elif argumentos.instantanea and os.path.exists(argumentos.instantanea):
+        almacen = InstantaneaBinaria(argumentos.instantanea)
+    elif argumentos.diario:
+        almacen = AlmacenConDiario(argumentos.diario)
+        bloqueo_estado = almacen.bloqueo_estado
+    
+    if almacen is not None:
+        registro_empleados = RegistroEmpleadosPersistente(almacen)
+        registro_proyectos = RegistroProyectosPersistente(almacen)
+    else:
+        registro_empleados = RegistroEmpleados()
+        registro_proyectos = RegistroProyectos()
     
     print("BIENVENIDO AL SISTEMA DE GESTIÓN DE RRHH Y PROYECTOS")
     print("Sistema inicializado correctamente")
     
+    if argumentos.importar:
+        with bloqueo_estado:
+            registro_empleados, resumen = importar_empleados_desde_archivo(argumentos.importar, registro_empleados)
+        mostrar_resumen_importacion(resumen)
+    
+    if argumentos.servir is not None:
+        servicio = ServicioRRHH(registro_empleados, registro_proyectos, bloqueo_estado)
+        print(f"Servicio HTTP en http://127.0.0.1:{argumentos.servir} (Ctrl+C para detener)")
+        try:
+            asyncio.run(servir(servicio, puerto=argumentos.servir))
+        except KeyboardInterrupt:
+            print("\nServicio detenido")
+        finally:
+            servicio.cerrar()
+        if argumentos.instantanea:
+            cerrar_y_guardar_instantanea(argumentos.instantanea, registro_empleados, registro_proyectos, almacen)
+        elif almacen is not None:
+            almacen.cerrar()
+        return 0
+    
     while True:
         try:
             mostrar_menu_principal()
             opcion = input("Seleccione una opción del menú (1-7): ").strip()
             
-            if opcion == "1":
-                lista_empleados = crear_nuevo_empleado(lista_empleados)
-            elif opcion == "2":
-                lista_proyectos = crear_nuevo_proyecto(lista_proyectos)
-            elif opcion == "3":
-                lista_empleados, lista_proyectos = asignar_proyecto_empleado(lista_empleados, lista_proyectos)
-            elif opcion == "4":
-                validar_factibilidad_proyecto(lista_proyectos)
-            elif opcion == "5":
-                generar_reporte_general(lista_empleados, lista_proyectos)
-            elif opcion == "6":
-                mostrar_informacion_empleados(lista_empleados)
-            elif opcion == "7":
-                print("\n" + "=" * 50)
-                print("   GRACIAS POR USAR EL SISTEMA DE GESTIÓN")
-                print("           ¡HASTA PRONTO!")
-                print("=" * 50)
-                break
-            else:
-                print("Error: Opción no válida. Seleccione 1-7")
+            # La compactación del diario espera a que termine la operación en curso
+            with bloqueo_estado:
+                if opcion == "1":
+                    registro_empleados = crear_nuevo_empleado(registro_empleados)
+                elif opcion == "2":
+                    registro_proyectos = crear_nuevo_proyecto(registro_proyectos)
+                elif opcion == "3":
+                    registro_empleados, registro_proyectos = asignar_proyecto_empleado(registro_empleados, registro_proyectos)
+                elif opcion == "4":
+                    validar_factibilidad_proyecto(registro_proyectos)
+                elif opcion == "5":
+                    generar_reporte_general(registro_empleados, registro_proyectos, argumentos.procesos_reporte)
+                elif opcion == "6":
+                    mostrar_informacion_empleados(registro_empleados)
+                elif opcion == "7":
+                    if argumentos.instantanea:
+                        cerrar_y_guardar_instantanea(argumentos.instantanea, registro_empleados,
+                                                     registro_proyectos, almacen)
+                        almacen = None
+                    print("\n" + "=" * 50)
+                    print("   GRACIAS POR USAR EL SISTEMA DE GESTIÓN")
+                    print("           ¡HASTA PRONTO!")
+                    print("=" * 50)
+                    break
+                else:
+                    print("Error: Opción no válida. Seleccione 1-7")
                 
         except KeyboardInterrupt:
             print("\nOperación cancelada por el usuario")
             break
         except Exception as error:
             print(f"Error inesperado: {error}")
-
+    
+    if almacen is not None:
+        almacen.cerrar()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
@@ -464,50 +464,80 @@ def mostrarInformacionEmpleados(listaEmpleados):
 
 # ---------------------- PROGRAMA PRINCIPAL ----------------------
 
-# Inicialización de listas principales
-listaCompletaEmpleados = []
-listaCompletaProyectos = []
+# Presupuesto de tiempo para importar el módulo. Importarlo no tiene efectos
+# secundarios: las clases se pueden usar desde otros programas o procesos y
+# el menú solo se inicia con main()
+PRESUPUESTO_IMPORTACION_MS = 20
 
-print("BIENVENIDO AL SISTEMA DE GESTIÓN DE RRHH Y PROYECTOS")
-print("Sistema inicializado correctamente")
+def medirTiempoImportacion(repeticiones=5):
+    # Importa el módulo en intérpretes nuevos y retorna el mejor tiempo en milisegundos
+    import subprocess
+    import sys
+    codigo = ("import importlib.util, sys, time\n"
+              "inicio = time.perf_counter()\n"
+              "especificacion = importlib.util.spec_from_file_location('rrhh', sys.argv[1])\n"
+              "especificacion.loader.exec_module(importlib.util.module_from_spec(especificacion))\n"
+              "print((time.perf_counter() - inicio) * 1000)")
+    tiempos = []
+    for _ in range(repeticiones):
+        resultado = subprocess.run([sys.executable, "-c", codigo, __file__],
+                                   capture_output=True, text=True, check=True)
+        tiempos.append(float(resultado.stdout))
+    return min(tiempos)
 
-# Bucle principal del sistema
-while True:
-    try:
-        mostrarMenuPrincipal()
-        opcionSeleccionada = input("Seleccione una opción del menú (1-7): ").strip()
+def main():
+    # Inicialización de listas principales
+    listaCompletaEmpleados = []
+    listaCompletaProyectos = []
+
+    print("BIENVENIDO AL SISTEMA DE GESTIÓN DE RRHH Y PROYECTOS")
+    print("Sistema inicializado correctamente")
+
+    # Bucle principal del sistema
+    while True:
+        try:
+            mostrarMenuPrincipal()
+            opcionSeleccionada = input("Seleccione una opción del menú (1-7): ").strip()
         
-        if opcionSeleccionada == "1":
-            crearNuevoEmpleado(listaCompletaEmpleados)
+            if opcionSeleccionada == "1":
+                crearNuevoEmpleado(listaCompletaEmpleados)
             
-        elif opcionSeleccionada == "2":
-            crearNuevoProyecto(listaCompletaProyectos)
+            elif opcionSeleccionada == "2":
+                crearNuevoProyecto(listaCompletaProyectos)
             
-        elif opcionSeleccionada == "3":
-            asignarProyectoEmpleado(listaCompletaEmpleados, listaCompletaProyectos)
+            elif opcionSeleccionada == "3":
+                asignarProyectoEmpleado(listaCompletaEmpleados, listaCompletaProyectos)
             
-        elif opcionSeleccionada == "4":
-            validarFactibilidadProyecto(listaCompletaProyectos)
+            elif opcionSeleccionada == "4":
+                validarFactibilidadProyecto(listaCompletaProyectos)
             
-        elif opcionSeleccionada == "5":
-            generarReporteGeneral(listaCompletaEmpleados, listaCompletaProyectos)
+            elif opcionSeleccionada == "5":
+                generarReporteGeneral(listaCompletaEmpleados, listaCompletaProyectos)
             
-        elif opcionSeleccionada == "6":
-            mostrarInformacionEmpleados(listaCompletaEmpleados)
+            elif opcionSeleccionada == "6":
+                mostrarInformacionEmpleados(listaCompletaEmpleados)
             
-        elif opcionSeleccionada == "7":
-            print("\n" + "="*50)
-            print("   GRACIAS POR USAR EL SISTEMA DE GESTIÓN")
-            print("           ¡HASTA PRONTO!")
-            print("="*50)
-            break
+            elif opcionSeleccionada == "7":
+                print("\n" + "="*50)
+                print("   GRACIAS POR USAR EL SISTEMA DE GESTIÓN")
+                print("           ¡HASTA PRONTO!")
+                print("="*50)
+                break
             
-        else:
-            print("Error: Opción no válida. Por favor seleccione una opción entre 1 y 7")
+            else:
+                print("Error: Opción no válida. Por favor seleccione una opción entre 1 y 7")
             
-    except KeyboardInterrupt:
-        print("\n\nOperación cancelada por el usuario")
-        break
-    except Exception as error:
-        print(f"\nError inesperado: {error}")
-        print("Por favor, contacte al administrador del sistema")
\ No newline at end of file
+        except KeyboardInterrupt:
+            print("\n\nOperación cancelada por el usuario")
+            break
+        except Exception as error:
+            print(f"\nError inesperado: {error}")
+            print("Por favor, contacte al administrador del sistema")
+
+if __name__ == "__main__":
+    import sys
+    if "--medir-importacion" in sys.argv:
+        tiempoImportacion = medirTiempoImportacion()
+        print(f"Tiempo de importación: {tiempoImportacion:.2f} ms (presupuesto: {PRESUPUESTO_IMPORTACION_MS} ms)")
+        sys.exit(0 if tiempoImportacion <= PRESUPUESTO_IMPORTACION_MS else 1)
+    main()
\ No newline at end of file
@@ -0,0 +1,249 @@
+# ================================
+# INSTRUMENTACIÓN DEL SISTEMA DE RRHH Y PROYECTOS
+# ================================
+
+# Métricas de latencia opcionales de las acciones del menú y de los cálculos del modelo
+
+import bisect
+import builtins
+import functools
+import json
+import math
+import os
+import threading
+import time
+import tracemalloc
+
+from modelo import Empleado, Proyecto
+
+
+# ================================
+# INSTRUMENTACIÓN
+# ================================
+
+# Intervalos fijos del histograma, en ns: serie 1-2-5 de 100 ns a 10 s
+LIMITES_LATENCIA_NS = tuple(base * 10**exponente for exponente in range(2, 10) for base in (1, 2, 5)) + (10**10,)
+PERCENTILES_INSTRUMENTACION = (50, 90, 99)
+VERSION_METRICAS = 1
+ACCIONES_MENU_INSTRUMENTADAS = ("crear_nuevo_empleado", "crear_nuevo_proyecto", "asignar_proyecto_empleado",
+                                "validar_factibilidad_proyecto", "generar_reporte_general",
+                                "mostrar_informacion_empleados")
+
+
+class MetricaOperacion:
+    __slots__ = ("nombre", "llamadas", "errores", "nanosegundos_totales", "nanosegundos_maximo", "bytes_netos",
+                 "intervalos")
+    
+    def __init__(self, nombre):
+        self.nombre = nombre
+        self.llamadas = 0
+        self.errores = 0
+        self.nanosegundos_totales = 0
+        self.nanosegundos_maximo = 0
+        # Solo con medición de memoria: bytes que las llamadas dejaron asignados
+        # según tracemalloc (negativo si liberaron más de lo que reservaron)
+        self.bytes_netos = 0
+        # Un contador por intervalo; el último es el de más de 10 s
+        self.intervalos = [0] * (len(LIMITES_LATENCIA_NS) + 1)
+    
+    def registrar(self, nanosegundos, bytes_asignados, fallo):
+        self.llamadas += 1
+        self.errores += fallo
+        self.nanosegundos_totales += nanosegundos
+        if nanosegundos > self.nanosegundos_maximo:
+            self.nanosegundos_maximo = nanosegundos
+        self.bytes_netos += bytes_asignados
+        self.intervalos[bisect.bisect_left(LIMITES_LATENCIA_NS, nanosegundos)] += 1
+    
+    def estimar_percentil(self, percentil):
+        # En segundos. Igual que histogram_quantile de Prometheus: interpolación
+        # lineal dentro del intervalo que contiene el rango pedido, sin pasar del máximo observado
+        rango = percentil / 100 * self.llamadas
+        acumulado = 0
+        for posicion, cantidad in enumerate(self.intervalos):
+            if cantidad and acumulado + cantidad >= rango:
+                inferior = LIMITES_LATENCIA_NS[posicion - 1] if posicion else 0
+                superior = min(LIMITES_LATENCIA_NS[posicion] if posicion < len(LIMITES_LATENCIA_NS) else math.inf,
+                               self.nanosegundos_maximo)
+                return (inferior + max(0, superior - inferior) * (rango - acumulado) / cantidad) / 1e9
+            acumulado += cantidad
+        return 0.0
+    
+    def resumir(self, con_memoria):
+        resumen = {"llamadas": self.llamadas, "errores": self.errores,
+                   "segundos_totales": self.nanosegundos_totales / 1e9,
+                   "segundos_promedio": self.nanosegundos_totales / 1e9 / max(1, self.llamadas),
+                   "segundos_maximo": self.nanosegundos_maximo / 1e9,
+                   "percentiles_segundos": {f"p{percentil}": self.estimar_percentil(percentil)
+                                            for percentil in PERCENTILES_INSTRUMENTACION}}
+        if con_memoria:
+            resumen["bytes_netos"] = self.bytes_netos
+        return resumen
+
+
+def obtener_operaciones_instrumentadas(modulo_menu):
+    # (dueño, atributo, nombre de la métrica, descuenta la espera de input())
+    operaciones = []
+    if modulo_menu is not None:
+        operaciones += [(modulo_menu, nombre, f"menu.{nombre}", True) for nombre in ACCIONES_MENU_INSTRUMENTADAS]
+    operaciones.append((Empleado, "calcular_salario_total", "Empleado.calcular_salario_total", False))
+    operaciones.append((Proyecto, "calcular_costo_total_proyecto", "Proyecto.calcular_costo_total_proyecto", False))
+    operaciones.append((Empleado, "asignar_proyecto_empleado", "Empleado.asignar_proyecto_empleado", False))
+    return operaciones
+
+
+class Instrumentacion:
+    # Inactiva no agrega envoltorios; desactivar() restaura los originales.
+    # modulo_menu es el módulo cuyas acciones del menú e input() se miden
+    
+    def __init__(self, modulo_menu=None):
+        self.modulo_menu = modulo_menu
+        self.metricas = {}
+        self.originales = []
+        self.medir_memoria = False
+        self.inicio_tracemalloc = False
+        self.bloqueo = threading.Lock()
+        # Tiempo que cada hilo pasó esperando en input(); las acciones del menú
+        # lo descuentan para medir solo el trabajo del sistema
+        self.esperas = threading.local()
+    
+    @property
+    def activa(self):
+        return bool(self.originales)
+    
+    def obtener_metrica(self, nombre):
+        if nombre not in self.metricas:
+            self.metricas[nombre] = MetricaOperacion(nombre)
+        return self.metricas[nombre]
+    
+    def envolver(self, nombre, funcion, descontar_espera):
+        metrica = self.obtener_metrica(nombre)
+        bloqueo = self.bloqueo
+        esperas = self.esperas
+        reloj = time.perf_counter_ns
+        medir_memoria = self.medir_memoria
+        
+        @functools.wraps(funcion)
+        def medida(*args, **kwargs):
+            espera_inicial = getattr(esperas, "nanosegundos", 0) if descontar_espera else 0
+            memoria = tracemalloc.get_traced_memory()[0] if medir_memoria else 0
+            inicio = reloj()
+            fallo = True
+            try:
+                resultado = funcion(*args, **kwargs)
+                fallo = False
+                return resultado
+            finally:
+                nanosegundos = reloj() - inicio
+                if medir_memoria:
+                    memoria = tracemalloc.get_traced_memory()[0] - memoria
+                if descontar_espera:
+                    nanosegundos -= getattr(esperas, "nanosegundos", 0) - espera_inicial
+                with bloqueo:
+                    metrica.registrar(nanosegundos, memoria, fallo)
+        return medida
+    
+    def envolver_entrada(self):
+        # input() del módulo: mide la espera del usuario como su propia métrica
+        metrica = self.obtener_metrica("entrada_usuario")
+        esperas = self.esperas
+        
+        def input_medido(*args):
+            inicio = time.perf_counter_ns()
+            try:
+                return builtins.input(*args)
+            finally:
+                nanosegundos = time.perf_counter_ns() - inicio
+                esperas.nanosegundos = getattr(esperas, "nanosegundos", 0) + nanosegundos
+                with self.bloqueo:
+                    metrica.registrar(nanosegundos, 0, False)
+        return input_medido
+    
+    def activar(self, medir_memoria=False):
+        # medir_memoria usa tracemalloc, que hace más lento todo el programa
+        # mientras está activo; por eso se pide aparte
+        if self.activa:
+            return self
+        self.medir_memoria = medir_memoria
+        if medir_memoria and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.inicio_tracemalloc = True
+        for propietario, atributo, nombre, descontar_espera in obtener_operaciones_instrumentadas(self.modulo_menu):
+            original = vars(propietario)[atributo]
+            self.originales.append((propietario, atributo, original))
+            setattr(propietario, atributo, self.envolver(nombre, original, descontar_espera))
+        # El input() del módulo tapa al de builtins; None indica que al desactivar se borra
+        if self.modulo_menu is not None:
+            self.originales.append((self.modulo_menu, "input", None))
+            self.modulo_menu.input = self.envolver_entrada()
+        return self
+    
+    def desactivar(self):
+        for propietario, atributo, original in reversed(self.originales):
+            if original is None:
+                delattr(propietario, atributo)
+            else:
+                setattr(propietario, atributo, original)
+        self.originales.clear()
+        if self.inicio_tracemalloc:
+            tracemalloc.stop()
+            self.inicio_tracemalloc = False
+    
+    def reiniciar(self):
+        with self.bloqueo:
+            self.metricas = {nombre: MetricaOperacion(nombre) for nombre in self.metricas}
+        # Los envoltorios guardan su métrica; se vuelven a crear para que apunten a las nuevas
+        if self.activa:
+            medir_memoria = self.medir_memoria
+            self.desactivar()
+            self.activar(medir_memoria)
+    
+    def obtener_instantanea(self):
+        with self.bloqueo:
+            return {"version": VERSION_METRICAS, "fecha": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                    "operaciones": {nombre: metrica.resumir(self.medir_memoria)
+                                    for nombre, metrica in sorted(self.metricas.items())}}
+    
+    def generar_texto_prometheus(self):
+        # Formato de texto de Prometheus
+        with self.bloqueo:
+            metricas = [self.metricas[nombre] for nombre in sorted(self.metricas)]
+            lineas = ["# HELP rrhh_operacion_segundos Latencia de cada operación instrumentada",
+                      "# TYPE rrhh_operacion_segundos histogram"]
+            for metrica in metricas:
+                etiqueta = f'operacion="{metrica.nombre}"'
+                acumulado = 0
+                for limite, cantidad in zip(LIMITES_LATENCIA_NS, metrica.intervalos):
+                    acumulado += cantidad
+                    lineas.append(f'rrhh_operacion_segundos_bucket{{{etiqueta},le="{limite / 1e9:g}"}} {acumulado}')
+                lineas.append(f'rrhh_operacion_segundos_bucket{{{etiqueta},le="+Inf"}} {metrica.llamadas}')
+                lineas.append(f"rrhh_operacion_segundos_sum{{{etiqueta}}} {metrica.nanosegundos_totales / 1e9:.9f}")
+                lineas.append(f"rrhh_operacion_segundos_count{{{etiqueta}}} {metrica.llamadas}")
+            lineas += ["# HELP rrhh_operacion_errores_total Llamadas que terminaron con una excepción",
+                       "# TYPE rrhh_operacion_errores_total counter"]
+            lineas += [f'rrhh_operacion_errores_total{{operacion="{metrica.nombre}"}} {metrica.errores}'
+                       for metrica in metricas]
+            if self.medir_memoria:
+                lineas += ["# HELP rrhh_operacion_bytes_netos Bytes que las llamadas dejaron asignados",
+                           "# TYPE rrhh_operacion_bytes_netos gauge"]
+                lineas += [f'rrhh_operacion_bytes_netos{{operacion="{metrica.nombre}"}} {metrica.bytes_netos}'
+                           for metrica in metricas]
+            lineas += ["# HELP rrhh_operacion_percentil_segundos Percentil de latencia estimado del histograma",
+                       "# TYPE rrhh_operacion_percentil_segundos gauge"]
+            for metrica in metricas:
+                for percentil in PERCENTILES_INSTRUMENTACION:
+                    lineas.append(f'rrhh_operacion_percentil_segundos{{operacion="{metrica.nombre}",'
+                                  f'percentil="{percentil / 100:g}"}} {metrica.estimar_percentil(percentil):.9f}')
+        return "\n".join(lineas) + "\n"
+    
+    def exportar(self, ruta_archivo):
+        # .json: instantánea JSON; cualquier otra extensión: texto de Prometheus.
+        # Se reemplaza el archivo de una vez para que un recolector nunca lea uno a medias
+        if ruta_archivo.lower().endswith(".json"):
+            contenido = json.dumps(self.obtener_instantanea(), ensure_ascii=False, indent=2) + "\n"
+        else:
+            contenido = self.generar_texto_prometheus()
+        ruta_temporal = ruta_archivo + ".tmp"
+        with open(ruta_temporal, "w", encoding="utf-8") as archivo:
+            archivo.write(contenido)
+        os.replace(ruta_temporal, ruta_archivo)
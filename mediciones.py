@@ -0,0 +1,1220 @@
+# ================================
+# MEDICIONES DE RENDIMIENTO DEL SISTEMA DE RRHH
+# ================================
+
+# Uso: python mediciones.py MEDICION [--salida-json ARCHIVO] [--comparar ARCHIVO]
+# Cada medición imprime sus resultados y termina con código 1 si no cumple su objetivo
+
+import argparse
+import asyncio
+import contextlib
+import gc
+import importlib.util
+import itertools
+import json
+import math
+import os
+import random
+import sys
+import threading
+import time
+import tracemalloc
+from array import array
+
+RUTA_PROGRAMA = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             "PROYECTO T1 T3 FINAL FINALLLLLLLLLLLLLLLL H.py")
+
+
+def cargar_programa(ruta_archivo=RUTA_PROGRAMA):
+    # El nombre del archivo del programa no es un identificador válido: se carga
+    # por ruta y se registra como "rrhh" para que los procesos hijos lo encuentren
+    especificacion = importlib.util.spec_from_file_location("rrhh", ruta_archivo)
+    modulo = importlib.util.module_from_spec(especificacion)
+    sys.modules["rrhh"] = modulo
+    especificacion.loader.exec_module(modulo)
+    return modulo
+
+
+rrhh = cargar_programa()
+from modelo import (AsignadorIds, Desarrollador, Diseñador, Empleado, Gerente, IndiceHabilidades,
+                    IndiceNombres, PalabrasOrdenadas, Proyecto, REGLAS_COMPENSACION_PREDETERMINADAS,
+                    RegistroEmpleados, RegistroProyectos, ResultadoAsignacion, asignar_proyectos_en_lote,
+                    calcular_estadisticas_en_paralelo, calcular_estadisticas_sistema, normalizar_texto,
+                    obtener_claves_habilidad, tabla_compensacion)
+from persistencia import (AlmacenSQLite, InstantaneaBinaria, RegistroEmpleadosPersistente,
+                          RegistroProyectosPersistente, guardar_instantanea, obtener_campos_instantanea)
+from servicio import ServicioRRHH, ejecutar_prueba_carga, mostrar_resultado_carga
+from rrhh import (EscenarioSalarial, GruposSalariales, NominaColumnar, asignar_todos_los_proyectos,
+                  calcular_cota_fraccional, escribir_en_bloques, evaluar_escenario, evaluar_escenarios,
+                  generar_reporte_general, instrumentacion, numpy, ordenar_por_densidad,
+                  planificar_asignaciones, renderizar_empleados, seleccionar_empleados, seleccionar_equipo)
+
+
+def medir_escalado_inserciones(tamanos=(10**3, 10**4, 10**5, 10**6), tolerancia=3.0):
+    # Comprueba que el costo por inserción en registros y proyectos se mantenga
+    # constante al crecer la cantidad de registros (costo total lineal)
+    print("\n" + "-" * 50)
+    print("   ESCALADO DE INSERCIONES")
+    print("-" * 50)
+    
+    costos_por_registro = []
+    for cantidad in tamanos:
+        empleados = [Gerente("Empleado de prueba", 1000.0, "General") for _ in range(cantidad)]
+        registro = RegistroEmpleados()
+        proyecto = Proyecto("Proyecto de prueba", 1.0)
+        
+        inicio = time.perf_counter()
+        for empleado in empleados:
+            registro.agregar(empleado)
+            proyecto.agregar_empleado_proyecto(empleado)
+        segundos = time.perf_counter() - inicio
+        
+        costos_por_registro.append(segundos / cantidad)
+        print(f"{cantidad:>10,} registros: {segundos:8.3f} s ({segundos / cantidad * 1e6:.3f} µs/registro)")
+    
+    es_lineal = max(costos_por_registro) <= tolerancia * min(costos_por_registro)
+    if es_lineal:
+        print("RESULTADO: El costo de inserción escala linealmente")
+    else:
+        print("RESULTADO: El costo por registro crece con el tamaño (escalado NO lineal)")
+    return es_lineal
+
+
+def generar_empleados_prueba(cantidad):
+    # Plantilla determinista con todos los tipos y categorías de bonificación
+    plantillas = [
+        lambda i: Desarrollador(f"Desarrollador {i}", 1000.0 + i % 997, ["Python"], "Senior"),
+        lambda i: Desarrollador(f"Desarrollador {i}", 1100.0 + i % 991, ["Java"], "SemiSenior"),
+        lambda i: Desarrollador(f"Desarrollador {i}", 900.0 + i % 983, ["Go"], "Junior"),
+        lambda i: Diseñador(f"Diseñador {i}", 1200.0 + i % 977, ["Figma"], "UX"),
+        lambda i: Diseñador(f"Diseñador {i}", 950.0 + i % 971, ["Photoshop"], "Gráfico"),
+        lambda i: Gerente(f"Gerente {i}", 2000.0 + i % 967, "Operaciones"),
+    ]
+    return [plantillas[i % len(plantillas)](i) for i in range(cantidad)]
+
+
+class EmpleadoConDiccionario:
+    # Representación anterior a __slots__: los mismos campos en un __dict__ por instancia
+    pass
+
+
+def copiar_valor(valor):
+    # Copia profunda que no reutiliza objetos del original; antes cada empleado
+    # guardaba su propia copia de los textos categóricos
+    if isinstance(valor, bool):
+        return valor
+    if isinstance(valor, str):
+        return "".join(list(valor))
+    if isinstance(valor, list):
+        return [copiar_valor(elemento) for elemento in valor]
+    if isinstance(valor, set):
+        return {copiar_valor(elemento) for elemento in valor}
+    if isinstance(valor, float):
+        return valor * 1.0
+    if isinstance(valor, int):
+        return valor + 0
+    return valor
+
+
+def copiar_a_diccionario(empleado):
+    copia = EmpleadoConDiccionario()
+    for clase in type(empleado).__mro__:
+        for atributo in getattr(clase, "__slots__", ()):
+            setattr(copia, atributo.lstrip("_"), copiar_valor(getattr(empleado, atributo)))
+    copia.tipo_empleado = copiar_valor(empleado.tipo_empleado)
+    return copia
+
+
+def medir_bytes_por_elemento(construir, cantidad):
+    tracemalloc.start()
+    inicio = tracemalloc.get_traced_memory()[0]
+    elementos = construir()
+    total = tracemalloc.get_traced_memory()[0] - inicio
+    tracemalloc.stop()
+    del elementos
+    return total / cantidad
+
+
+def medir_memoria_empleados(cantidad=10**5):
+    print("\n" + "-" * 50)
+    print("   MEMORIA POR EMPLEADO")
+    print("-" * 50)
+    
+    empleados = generar_empleados_prueba(cantidad)
+    bytes_con_slots = medir_bytes_por_elemento(lambda: generar_empleados_prueba(cantidad), cantidad)
+    bytes_con_diccionario = medir_bytes_por_elemento(
+        lambda: [copiar_a_diccionario(empleado) for empleado in empleados], cantidad)
+    
+    print(f"Empleados medidos: {cantidad:,}")
+    print(f"Con __dict__ por instancia: {bytes_con_diccionario:,.0f} bytes/empleado")
+    print(f"Con __slots__ e internado: {bytes_con_slots:,.0f} bytes/empleado")
+    print(f"Reducción: {100 * (1 - bytes_con_slots / bytes_con_diccionario):.1f}%")
+    return bytes_con_slots < bytes_con_diccionario
+
+
+def generar_estado_prueba(cantidad_empleados, empleados_por_proyecto=100):
+    # Cada empleado queda en un solo proyecto para que los equipos sean independientes
+    registro_empleados = RegistroEmpleados().extender(generar_empleados_prueba(cantidad_empleados))
+    registro_proyectos = RegistroProyectos()
+    proyecto = None
+    for posicion, empleado in enumerate(registro_empleados):
+        if posicion % empleados_por_proyecto == 0:
+            proyecto = Proyecto(f"Proyecto {posicion // empleados_por_proyecto}", 150000.0)
+            registro_proyectos.agregar(proyecto)
+        empleado.enlazar_proyecto(proyecto)
+    return registro_empleados, registro_proyectos
+
+
+def describir_empleado(empleado):
+    tipo, campo_a, campo_b = obtener_campos_instantanea(empleado)
+    return (type(empleado), empleado.obtener_id_empleado(), empleado.nombre_completo, empleado.salario_base,
+            empleado.activo, campo_a, campo_b, [proyecto.id_proyecto for proyecto in empleado.lista_proyectos])
+
+
+def describir_proyecto(proyecto):
+    return (proyecto.id_proyecto, proyecto.nombre_proyecto, proyecto.presupuesto_asignado, proyecto.estado_proyecto,
+            [empleado.obtener_id_empleado() for empleado in proyecto.lista_empleados_asignados],
+            proyecto.calcular_costo_total_proyecto())
+
+
+def medir_instantanea(cantidad=10**6, ruta_archivo="instantanea_prueba.rrhh"):
+    print("\n" + "-" * 50)
+    print("   INSTANTÁNEA BINARIA VS RECONSTRUCCIÓN")
+    print("-" * 50)
+    
+    inicio = time.perf_counter()
+    registro_empleados, registro_proyectos = generar_estado_prueba(cantidad)
+    segundos_reconstruccion = time.perf_counter() - inicio
+    
+    inicio = time.perf_counter()
+    guardar_instantanea(ruta_archivo, registro_empleados, registro_proyectos)
+    segundos_guardado = time.perf_counter() - inicio
+    
+    inicio = time.perf_counter()
+    instantanea = InstantaneaBinaria(ruta_archivo)
+    empleados_restaurados = RegistroEmpleadosPersistente(instantanea)
+    proyectos_restaurados = RegistroProyectosPersistente(instantanea)
+    empleados_restaurados.buscar_por_id(registro_empleados[len(registro_empleados) // 2].obtener_id_empleado())
+    segundos_apertura = time.perf_counter() - inicio
+    
+    coincide = (len(empleados_restaurados) == len(registro_empleados)
+                and len(proyectos_restaurados) == len(registro_proyectos)
+                and all(describir_empleado(original) == describir_empleado(restaurado)
+                        for original, restaurado in zip(registro_empleados, empleados_restaurados))
+                and all(describir_proyecto(original) == describir_proyecto(restaurado)
+                        for original, restaurado in zip(registro_proyectos, proyectos_restaurados)))
+    instantanea.cerrar()
+    
+    print(f"Empleados: {cantidad:,}, tamaño del archivo: {os.path.getsize(ruta_archivo) / 2**20:,.1f} MB")
+    os.remove(ruta_archivo)
+    print(f"Reconstrucción desde cero: {segundos_reconstruccion:.3f} s")
+    print(f"Guardado de la instantánea: {segundos_guardado:.3f} s")
+    print(f"Apertura y primera consulta: {segundos_apertura * 1000:.2f} ms")
+    if coincide:
+        print("RESULTADO: Todos los empleados y proyectos se restauran exactamente")
+    else:
+        print("RESULTADO: La instantánea NO restaura los datos exactamente")
+    return coincide
+
+
+def medir_nomina_columnar(tamanos=(10**5, 10**6)):
+    print("\n" + "-" * 50)
+    print("   NÓMINA: OBJETOS VS COLUMNAR")
+    print("-" * 50)
+    print(f"Motor columnar: {'NumPy' if numpy is not None else 'array (sin NumPy)'}")
+    
+    coinciden = True
+    for cantidad in tamanos:
+        empleados = generar_empleados_prueba(cantidad)
+        nomina = NominaColumnar.desde_empleados(empleados)
+        
+        inicio = time.perf_counter()
+        salarios_objetos = [empleado.calcular_salario_total() for empleado in empleados]
+        segundos_objetos = time.perf_counter() - inicio
+        
+        inicio = time.perf_counter()
+        salarios_columnar = nomina.calcular_salarios_totales()
+        segundos_columnar = time.perf_counter() - inicio
+        
+        coinciden = coinciden and list(salarios_columnar) == salarios_objetos
+        print(f"{cantidad:>10,} empleados: objetos {segundos_objetos:.3f} s, "
+              f"columnar {segundos_columnar:.3f} s ({segundos_objetos / segundos_columnar:.1f}x)")
+    
+    if coinciden:
+        print("RESULTADO: Los salarios columnares coinciden exactamente con los de cada clase")
+    else:
+        print("RESULTADO: Los salarios columnares NO coinciden con los de cada clase")
+    return coinciden
+
+
+def generar_pares_prueba(cantidad_pares, cantidad_empleados=30000, cantidad_proyectos=20):
+    # Pares deterministas con repeticiones y empleados que superan el límite
+    registro_empleados = RegistroEmpleados().extender(generar_empleados_prueba(cantidad_empleados))
+    registro_proyectos = RegistroProyectos().extender(
+        Proyecto(f"Proyecto {posicion}", 150000.0) for posicion in range(cantidad_proyectos))
+    pares = [(registro_empleados[(posicion * 7919) % cantidad_empleados].obtener_id_empleado(),
+              registro_proyectos[posicion * posicion * 31 % 997 % cantidad_proyectos].id_proyecto)
+             for posicion in range(cantidad_pares)]
+    return registro_empleados, registro_proyectos, pares
+
+
+def asignar_par_por_par(registro_empleados, registro_proyectos, pares):
+    # Lo que hace la opción 3 del menú para cada par, sin los mensajes en pantalla
+    motivos = []
+    with open(os.devnull, "w", encoding="utf-8") as descarte, contextlib.redirect_stdout(descarte):
+        for id_empleado, id_proyecto in pares:
+            empleado = registro_empleados.buscar_por_id(id_empleado)
+            proyecto = registro_proyectos.buscar_por_id(id_proyecto)
+            try:
+                empleado.asignar_proyecto_empleado(proyecto)
+                registro_empleados.registrar_asignacion(empleado, proyecto)
+                motivos.append(None)
+            except ValueError as error:
+                motivos.append(str(error))
+    return motivos
+
+
+def medir_asignacion_lote(cantidad_pares=10**5, ruta_base_datos="asignacion_prueba.db"):
+    print("\n" + "-" * 50)
+    print("   ASIGNACIÓN EN LOTE VS PAR POR PAR")
+    print("-" * 50)
+    
+    coincide = True
+    for con_base_datos in (False, True):
+        segundos = []
+        motivos = []
+        equipos = []
+        for asignar in (asignar_proyectos_en_lote, asignar_par_por_par):
+            registro_empleados, registro_proyectos, pares = generar_pares_prueba(cantidad_pares)
+            almacen = None
+            if con_base_datos:
+                almacen = AlmacenSQLite(ruta_base_datos)
+                registro_empleados = RegistroEmpleadosPersistente(almacen).extender(registro_empleados)
+                registro_proyectos = RegistroProyectosPersistente(almacen).extender(registro_proyectos)
+            
+            inicio = time.perf_counter()
+            resultado = asignar(registro_empleados, registro_proyectos, pares)
+            segundos.append(time.perf_counter() - inicio)
+            
+            motivos.append([elemento.motivo if isinstance(elemento, ResultadoAsignacion) else elemento
+                            for elemento in resultado])
+            equipos.append([[empleado.nombre_completo for empleado in proyecto.lista_empleados_asignados]
+                            for proyecto in registro_proyectos])
+            coincide = coincide and all(proyecto.verificar_consistencia_costo() for proyecto in registro_proyectos)
+            if almacen is not None:
+                coincide = coincide and almacen.conexion.execute(
+                    "SELECT COUNT(*) FROM asignaciones").fetchone()[0] == motivos[-1].count(None)
+                almacen.cerrar()
+                for sufijo in ("", "-wal", "-shm"):
+                    if os.path.exists(ruta_base_datos + sufijo):
+                        os.remove(ruta_base_datos + sufijo)
+        
+        coincide = coincide and motivos[0] == motivos[1] and equipos[0] == equipos[1]
+        aplicadas = motivos[0].count(None)
+        print(f"{'SQLite' if con_base_datos else 'En memoria'}: {cantidad_pares:,} pares, "
+              f"{aplicadas:,} aplicados, {cantidad_pares - aplicadas:,} rechazados")
+        print(f"  En lote: {segundos[0]:.3f} s ({cantidad_pares / segundos[0]:,.0f} pares/s)")
+        print(f"  Par por par: {segundos[1]:.3f} s ({cantidad_pares / segundos[1]:,.0f} pares/s)")
+    
+    if coincide:
+        print("RESULTADO: El lote acepta y rechaza exactamente los mismos pares que la asignación individual")
+    else:
+        print("RESULTADO: El lote NO coincide con la asignación individual")
+    return coincide
+
+
+NOMBRES_PRUEBA = ["María", "José", "Juan", "Ana", "Luis", "Carmen", "Carlos", "Lucía", "Jorge", "Marta",
+                  "Pedro", "Sofía", "Andrés", "Elena", "Miguel", "Laura", "Javier", "Paula", "Diego", "Valeria",
+                  "Fernando", "Camila", "Ricardo", "Isabel", "Raúl", "Mariana", "Mario", "Teresa", "Óscar", "Rosa"]
+APELLIDOS_PRUEBA = ["González", "Rodríguez", "Pérez", "López", "Martínez", "Sánchez", "Ramírez", "Torres",
+                    "Flores", "Rivera", "Gómez", "Díaz", "Cruz", "Morales", "Reyes", "Gutiérrez", "Ortiz",
+                    "Chávez", "Ruiz", "Jiménez", "Hernández", "Mendoza", "Castillo", "Vargas", "Romero",
+                    "Herrera", "Medina", "Aguilar", "Castro", "Núñez", "Vega", "Rojas", "Molina", "Silva",
+                    "Delgado", "Ramos", "Campos", "Guerrero", "Fuentes", "Ríos"]
+
+
+def generar_nombres_prueba(cantidad):
+    # Nombre y dos apellidos deterministas, con tildes y nombres que comparten prefijo
+    return [f"{NOMBRES_PRUEBA[posicion % len(NOMBRES_PRUEBA)]} "
+            f"{APELLIDOS_PRUEBA[posicion * 7 % len(APELLIDOS_PRUEBA)]} "
+            f"{APELLIDOS_PRUEBA[posicion * 13 // len(NOMBRES_PRUEBA) % len(APELLIDOS_PRUEBA)]}"
+            for posicion in range(cantidad)]
+
+
+def medir_busqueda_nombres(cantidad=10**6, repeticiones=200):
+    print("\n" + "-" * 50)
+    print("   BÚSQUEDA POR NOMBRE")
+    print("-" * 50)
+    
+    nombres = generar_nombres_prueba(cantidad)
+    indice = IndiceNombres()
+    inicio = time.perf_counter()
+    indice.agregar_varios(enumerate(nombres, start=1))
+    segundos_construccion = time.perf_counter() - inicio
+    
+    # Sin esto la recolección completa pendiente de la carga cae dentro de las altas
+    gc.collect()
+    inicio = time.perf_counter()
+    for posicion in range(1000):
+        indice.agregar(cantidad + posicion + 1, f"Empleado Nuevo{posicion} Apellido{posicion}")
+    segundos_incremental = (time.perf_counter() - inicio) / 1000
+    
+    # Vocabulario grande: el alta de palabras nuevas no debe crecer con él
+    vocabulario = PalabrasOrdenadas(f"palabra{posicion:07d}" for posicion in range(0, 2 * 10**6, 2))
+    inicio = time.perf_counter()
+    for posicion in range(1, 20001, 2):
+        vocabulario.agregar(f"palabra{posicion * 97 % (2 * 10**6):07d}")
+    segundos_palabra_nueva = (time.perf_counter() - inicio) / 10000
+    vocabulario_ordenado = list(vocabulario)
+    es_correcto = vocabulario_ordenado == sorted(vocabulario_ordenado) and len(vocabulario_ordenado) == 10**6 + 10000
+    
+    print(f"Nombres indexados: {cantidad:,}")
+    print(f"Construcción inicial: {segundos_construccion:.2f} s")
+    print(f"Alta incremental: {segundos_incremental * 1e6:.1f} µs/nombre")
+    print(f"Palabra nueva en un vocabulario de 10^6: {segundos_palabra_nueva * 1e6:.1f} µs")
+    
+    # Cada consulta trae la forma en que cada palabra debe aparecer en los nombres encontrados
+    consultas = ["maria", "mar", "gonzalez", "gonz", "jose nunez", "mari gonz", "ana rios",
+                 "gonzales", "rodrigues lopes", "nuevo5"]
+    maximo_segundos = 0.0
+    for consulta in consultas:
+        # La primera consulta cuenta igual que las demás: el índice no construye nada al consultar
+        inicio = time.perf_counter()
+        indice.buscar(consulta)
+        segundos_primera = time.perf_counter() - inicio
+        inicio = time.perf_counter()
+        for _ in range(repeticiones):
+            ids_encontrados = indice.buscar(consulta)
+        segundos = (time.perf_counter() - inicio) / repeticiones
+        maximo_segundos = max(maximo_segundos, segundos, segundos_primera)
+        
+        palabras_validas = [set(indice.palabras_candidatas(palabra)) for palabra in normalizar_texto(consulta).split()]
+        for id_encontrado in ids_encontrados:
+            nombre = nombres[id_encontrado - 1] if id_encontrado <= cantidad else None
+            if nombre is not None:
+                palabras_nombre = set(normalizar_texto(nombre).split())
+                es_correcto = es_correcto and all(palabras_nombre & validas for validas in palabras_validas)
+        es_correcto = es_correcto and len(ids_encontrados) == len(set(ids_encontrados)) > 0
+        print(f"  '{consulta}': {len(ids_encontrados)} resultados en {segundos * 1000:.3f} ms "
+              f"(primera vez {segundos_primera * 1000:.3f} ms)")
+    
+    if es_correcto and maximo_segundos < 1e-3:
+        print("RESULTADO: Todas las consultas responden en menos de 1 ms con resultados válidos")
+    else:
+        print("RESULTADO: Alguna consulta supera 1 ms o devuelve resultados inválidos")
+    return es_correcto and maximo_segundos < 1e-3
+
+
+LENGUAJES_PRUEBA = ["Python", "Java", "Go", "Rust", "JavaScript", "C#", "Kotlin", "Ruby"]
+HERRAMIENTAS_PRUEBA = ["Figma", "Photoshop", "Illustrator", "Sketch", "Blender"]
+
+
+def generar_perfiles_prueba(cantidad):
+    # Perfiles deterministas para el índice. La cantidad de desarrolladores que
+    # saben Haskell no depende del tamaño, para medir una consulta de resultado fijo
+    paso_haskell = cantidad // 1000
+    perfiles = []
+    for posicion in range(cantidad):
+        if posicion % 3 == 0:
+            habilidades = [LENGUAJES_PRUEBA[posicion % 8], LENGUAJES_PRUEBA[(posicion * 3 + 1) % 8]]
+            if posicion % paso_haskell == 0:
+                habilidades.append("Haskell")
+            perfil = (Desarrollador, habilidades, ["Junior", "SemiSenior", "Senior"][posicion // 3 % 3])
+        elif posicion % 3 == 1:
+            perfil = (Diseñador, [HERRAMIENTAS_PRUEBA[posicion % 5]], ["UI", "UX", "Gráfico"][posicion // 3 % 3])
+        else:
+            perfil = (Gerente, [], "Operaciones")
+        perfiles.append((posicion + 1, *perfil, posicion % 4, 3))
+    return perfiles
+
+
+def medir_indice_habilidades(tamanos=(10**5, 10**6), repeticiones=20):
+    print("\n" + "-" * 50)
+    print("   ÍNDICE DE HABILIDADES VS RECORRIDO COMPLETO")
+    print("-" * 50)
+    
+    consultas = [
+        ("Haskell Senior disponibles", [("habilidad", "haskell"), ("nivel", "senior")], True),
+        ("Python Senior disponibles", [("habilidad", "Python"), ("nivel", "Senior")], True),
+        ("Diseñadores UX con Figma", [("tipo", "Diseñador"), ("especialidad", "UX"), ("habilidad", "figma")], False),
+    ]
+    coinciden = True
+    for cantidad in tamanos:
+        perfiles = generar_perfiles_prueba(cantidad)
+        indice = IndiceHabilidades()
+        inicio = time.perf_counter()
+        for perfil in perfiles:
+            indice.agregar(*perfil)
+        segundos_construccion = time.perf_counter() - inicio
+        print(f"{cantidad:,} empleados (índice construido en {segundos_construccion:.2f} s):")
+        
+        # El recorrido compara contra claves ya normalizadas: es el mejor caso sin índice
+        claves_por_empleado = [(id_empleado, obtener_claves_habilidad(clase, habilidades, categoria),
+                                cantidad_proyectos < limite)
+                               for id_empleado, clase, habilidades, categoria, cantidad_proyectos, limite in perfiles]
+        for descripcion, claves, solo_disponibles in consultas:
+            inicio = time.perf_counter()
+            for _ in range(repeticiones):
+                ids_indice = indice.buscar(claves, solo_disponibles)
+            segundos_indice = (time.perf_counter() - inicio) / repeticiones
+            
+            claves_normalizadas = {(categoria, normalizar_texto(valor)) for categoria, valor in claves}
+            inicio = time.perf_counter()
+            ids_recorrido = [id_empleado for id_empleado, claves_empleado, disponible in claves_por_empleado
+                             if claves_normalizadas <= claves_empleado and (disponible or not solo_disponibles)]
+            segundos_recorrido = time.perf_counter() - inicio
+            
+            coinciden = coinciden and ids_indice == ids_recorrido
+            print(f"  {descripcion}: {len(ids_indice):,} resultados, índice {segundos_indice * 1000:.3f} ms, "
+                  f"recorrido {segundos_recorrido * 1000:.1f} ms")
+        
+        # Una asignación que completa el cupo saca al empleado de los disponibles
+        id_completo = indice.buscar(consultas[0][1], True)[0]
+        indice.actualizar_capacidad(id_completo, 3, 3)
+        coinciden = coinciden and id_completo not in indice.buscar(consultas[0][1], True)
+    
+    if coinciden:
+        print("RESULTADO: El índice devuelve exactamente los mismos empleados que el recorrido completo")
+    else:
+        print("RESULTADO: El índice NO coincide con el recorrido completo")
+    return coinciden
+
+
+def valorar_candidato_prueba(empleado):
+    # Puntajes deterministas con más dispersión que valorar_candidato
+    return 1 + empleado.obtener_id_empleado() * 7919 % 101 / 25
+
+
+def resolver_fuerza_bruta(costos, valores, presupuesto):
+    mejor_valor = 0.0
+    for tamano in range(1, len(costos) + 1):
+        for combinacion in itertools.combinations(range(len(costos)), tamano):
+            if sum(costos[posicion] for posicion in combinacion) <= presupuesto:
+                mejor_valor = max(mejor_valor, sum(valores[posicion] for posicion in combinacion))
+    return mejor_valor
+
+
+def medir_seleccion_equipo(tamanos_exactos=(15, 30, 45, 60), tamanos_grandes=(10**3, 10**4, 10**5)):
+    print("\n" + "-" * 50)
+    print("   SELECCIÓN DE EQUIPO: CALIDAD VS TIEMPO")
+    print("-" * 50)
+    
+    es_correcto = True
+    print("Grupos chicos (óptimo por ramificación y acotamiento vs voraz):")
+    for cantidad in tamanos_exactos:
+        candidatos = generar_empleados_prueba(cantidad)
+        costos = [empleado.calcular_salario_total() for empleado in candidatos]
+        valores = [valorar_candidato_prueba(empleado) for empleado in candidatos]
+        proyecto = Proyecto("Proyecto de prueba", 0.3 * sum(costos))
+        
+        inicio = time.perf_counter()
+        exacta = seleccionar_equipo(proyecto, candidatos, valorar_candidato_prueba, limite_segundos=10.0)
+        segundos_exacta = time.perf_counter() - inicio
+        inicio = time.perf_counter()
+        voraz = seleccionar_equipo(proyecto, candidatos, valorar_candidato_prueba, tamano_maximo_exacto=0)
+        segundos_voraz = time.perf_counter() - inicio
+        
+        es_correcto = es_correcto and exacta.costo_total <= proyecto.presupuesto_asignado and exacta.es_optimo
+        if cantidad <= 20:
+            es_correcto = es_correcto and math.isclose(
+                exacta.valor_total, resolver_fuerza_bruta(costos, valores, proyecto.presupuesto_asignado))
+        print(f"{cantidad:>8} candidatos: óptimo {exacta.valor_total:.2f} en {segundos_exacta * 1000:.1f} ms, "
+              f"voraz {voraz.valor_total:.2f} ({100 * voraz.valor_total / exacta.valor_total:.1f}%) "
+              f"en {segundos_voraz * 1000:.2f} ms")
+    
+    print("Grupos grandes (voraz vs cota superior fraccional):")
+    for cantidad in tamanos_grandes:
+        candidatos = generar_empleados_prueba(cantidad)
+        costos = [empleado.calcular_salario_total() for empleado in candidatos]
+        valores = [valorar_candidato_prueba(empleado) for empleado in candidatos]
+        proyecto = Proyecto("Proyecto de prueba", 0.05 * sum(costos))
+        
+        inicio = time.perf_counter()
+        voraz = seleccionar_equipo(proyecto, candidatos, valorar_candidato_prueba)
+        segundos_voraz = time.perf_counter() - inicio
+        cota = calcular_cota_fraccional(costos, valores, ordenar_por_densidad(costos, valores), 0,
+                                        proyecto.presupuesto_asignado)
+        
+        es_correcto = es_correcto and voraz.costo_total <= proyecto.presupuesto_asignado
+        print(f"{cantidad:>8,} candidatos: {len(voraz.empleados):,} elegidos, valor {voraz.valor_total:,.2f} "
+              f"(>= {100 * voraz.valor_total / cota:.3f}% del óptimo) en {segundos_voraz * 1000:.1f} ms")
+    
+    # Con valor casi proporcional al costo la cota fraccional poda poco: es el caso difícil
+    print("Límite de tiempo (ramificación y acotamiento forzada, 300 candidatos con valor ~ costo):")
+    candidatos = generar_empleados_prueba(300)
+    costos = [empleado.calcular_salario_total() for empleado in candidatos]
+    valores = [costo / 1000 + posicion % 7 / 100 for posicion, costo in enumerate(costos)]
+    valor_por_id = {empleado.obtener_id_empleado(): valor for empleado, valor in zip(candidatos, valores)}
+    valorar_correlacionado = lambda empleado: valor_por_id[empleado.obtener_id_empleado()]
+    proyecto = Proyecto("Proyecto de prueba", 0.3 * sum(costos))
+    cota = calcular_cota_fraccional(costos, valores, ordenar_por_densidad(costos, valores), 0,
+                                    proyecto.presupuesto_asignado)
+    for limite_segundos in (0.01, 0.1, 1.0):
+        inicio = time.perf_counter()
+        seleccion = seleccionar_equipo(proyecto, candidatos, valorar_correlacionado, limite_segundos,
+                                       tamano_maximo_exacto=300)
+        segundos = time.perf_counter() - inicio
+        es_correcto = es_correcto and segundos < limite_segundos + 0.5
+        print(f"  límite {limite_segundos:>5} s: valor {seleccion.valor_total:.4f} "
+              f"(>= {100 * seleccion.valor_total / cota:.4f}% del óptimo), {segundos:.3f} s, "
+              f"{'óptimo demostrado' if seleccion.es_optimo else 'sin demostrar'}")
+    
+    if es_correcto:
+        print("RESULTADO: Todos los equipos respetan el presupuesto y el óptimo coincide con la fuerza bruta")
+    else:
+        print("RESULTADO: Algún equipo excede el presupuesto, no es óptimo o no respeta el límite de tiempo")
+    return es_correcto
+
+
+def generar_proyectos_prueba(cantidad):
+    # Presupuestos deterministas entre 10.000 y 89.920; uno de cada mil no alcanza para nadie
+    return [Proyecto(f"Proyecto {posicion}", 500.0 if posicion % 1000 == 999 else 10000.0 + posicion * 7919 % 1000 * 80)
+            for posicion in range(cantidad)]
+
+
+def medir_planificacion_global(cantidad_empleados=10**5, cantidad_proyectos=10**4):
+    print("\n" + "-" * 50)
+    print("   PLANIFICACIÓN GLOBAL DE ASIGNACIONES")
+    print("-" * 50)
+    
+    registro_empleados = RegistroEmpleados().extender(generar_empleados_prueba(cantidad_empleados))
+    registro_proyectos = RegistroProyectos().extender(generar_proyectos_prueba(cantidad_proyectos))
+    # Un proyecto que ya excede su presupuesto antes de planificar
+    registro_proyectos[0].presupuesto_asignado = 100.0
+    registro_empleados[0].enlazar_proyecto(registro_proyectos[0])
+    
+    inicio = time.perf_counter()
+    plan = planificar_asignaciones(registro_empleados, registro_proyectos)
+    segundos_plan = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    resultados = asignar_proyectos_en_lote(registro_empleados, registro_proyectos, plan.pares, todo_o_nada=True)
+    segundos_aplicacion = time.perf_counter() - inicio
+    
+    presupuesto_total = sum(proyecto.presupuesto_asignado for proyecto in registro_proyectos)
+    costo_total = sum(proyecto.calcular_costo_total_proyecto() for proyecto in registro_proyectos)
+    ids_no_factibles = {id_proyecto for id_proyecto, _ in plan.proyectos_no_factibles}
+    es_correcto = (all(resultado.aplicada for resultado in resultados)
+                   and all(proyecto.verificar_factibilidad_proyecto() for proyecto in registro_proyectos
+                           if proyecto.id_proyecto not in ids_no_factibles)
+                   and all(empleado.obtener_cantidad_proyectos() <= empleado.limite_proyectos
+                           for empleado in registro_empleados))
+    
+    print(f"{cantidad_empleados:,} empleados, {cantidad_proyectos:,} proyectos")
+    print(f"Plan: {len(plan.pares):,} asignaciones en {segundos_plan:.2f} s, "
+          f"aplicadas en {segundos_aplicacion:.2f} s")
+    print(f"Empleados sin proyecto: {len(plan.ids_empleados_sin_proyecto):,}; "
+          f"uso del presupuesto total: {100 * costo_total / presupuesto_total:.2f}%")
+    print(f"Proyectos no factibles: {len(plan.proyectos_no_factibles)}")
+    for id_proyecto, motivo in plan.proyectos_no_factibles[:3]:
+        print(f"  - Proyecto {id_proyecto}: {motivo}")
+    
+    if es_correcto:
+        print("RESULTADO: Todo el plan se aplicó y los proyectos factibles respetan su presupuesto")
+    else:
+        print("RESULTADO: El plan viola alguna regla de asignación o algún presupuesto")
+    return es_correcto
+
+
+def evaluar_escenario_completo(escenario, proyectos):
+    # Referencia: recalcula el costo de todos los proyectos con el escenario
+    proyectos_no_factibles = []
+    for proyecto in proyectos:
+        costo_escenario = sum(escenario.calcular_salario_total(empleado)
+                              for empleado in proyecto.lista_empleados_asignados)
+        if proyecto.verificar_factibilidad_proyecto() and costo_escenario > proyecto.presupuesto_asignado:
+            proyectos_no_factibles.append(proyecto.id_proyecto)
+    return proyectos_no_factibles
+
+
+def generar_escenarios_prueba(cantidad, ids_empleados):
+    # Variantes de bonificación SemiSenior, aumentos a gerentes y aumentos puntuales
+    escenarios = []
+    for posicion in range(cantidad):
+        if posicion % 3 == 0:
+            escenarios.append(EscenarioSalarial(f"SemiSenior {16 + posicion}%",
+                                                {("Desarrollador", "SemiSenior"): 1.16 + posicion / 100}))
+        elif posicion % 3 == 1:
+            escenarios.append(EscenarioSalarial(f"Gerentes +{posicion}%",
+                                                factores_salario_base={"Gerente": 1 + posicion / 100}))
+        else:
+            escenarios.append(EscenarioSalarial(f"Aumentos puntuales {posicion}",
+                                                salarios_base={id_empleado: 4000.0
+                                                               for id_empleado in ids_empleados[posicion::997]}))
+    return escenarios
+
+
+def medir_escenarios_salariales(cantidad_empleados=10**5, cantidad_proyectos=10**4, cantidad_escenarios=24):
+    print("\n" + "-" * 50)
+    print("   ESCENARIOS SALARIALES")
+    print("-" * 50)
+    
+    registro_empleados = RegistroEmpleados().extender(generar_empleados_prueba(cantidad_empleados))
+    registro_proyectos = RegistroProyectos().extender(generar_proyectos_prueba(cantidad_proyectos))
+    asignar_todos_los_proyectos(registro_empleados, registro_proyectos)
+    costo_antes = math.fsum(proyecto.calcular_costo_total_proyecto() for proyecto in registro_proyectos)
+    escenarios = generar_escenarios_prueba(cantidad_escenarios,
+                                           [empleado.id_empleado for empleado in registro_empleados])
+    
+    inicio = time.perf_counter()
+    completos = [evaluar_escenario_completo(escenario, registro_proyectos) for escenario in escenarios]
+    segundos_completo = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    grupos = GruposSalariales(registro_empleados)
+    segundos_grupos = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    resultados = [evaluar_escenario(escenario, grupos) for escenario in escenarios]
+    segundos_incremental = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    resultados_en_procesos = evaluar_escenarios(escenarios, registro_empleados)
+    segundos_procesos = time.perf_counter() - inicio
+    
+    costo_despues = math.fsum(proyecto.calcular_costo_total_proyecto() for proyecto in registro_proyectos)
+    es_correcto = (costo_antes == costo_despues and resultados == resultados_en_procesos
+                   and all([id_proyecto for id_proyecto, _ in resultado.proyectos_no_factibles] == completo
+                           for resultado, completo in zip(resultados, completos)))
+    
+    print(f"{cantidad_empleados:,} empleados, {cantidad_proyectos:,} proyectos, {cantidad_escenarios} escenarios")
+    for resultado in resultados[:3]:
+        print(f"  {resultado.nombre}: {resultado.empleados_afectados:,} empleados afectados, "
+              f"costo {resultado.diferencia_costo_total:+,.2f}, "
+              f"{len(resultado.proyectos_no_factibles):,} proyectos dejan de ser factibles")
+    print(f"Recálculo completo por escenario:  {segundos_completo * 1000 / cantidad_escenarios:8.1f} ms")
+    print(f"Solo afectados por escenario:      {segundos_incremental * 1000 / cantidad_escenarios:8.1f} ms "
+          f"(agrupación compartida: {segundos_grupos * 1000:.0f} ms una vez)")
+    print(f"Todos los escenarios en procesos:  {segundos_procesos * 1000:8.1f} ms en total "
+          f"({min(os.cpu_count() or 1, cantidad_escenarios)} procesos)")
+    
+    if es_correcto:
+        print("RESULTADO: Coincide con el recálculo completo y los empleados reales no cambiaron")
+    else:
+        print("RESULTADO: Los escenarios difieren del recálculo completo o modificaron los datos reales")
+    return es_correcto
+
+
+def medir_reporte_paralelo(cantidad_empleados=10**6, cantidad_proyectos=10**5, procesos_maximos=None):
+    print("\n" + "-" * 50)
+    print("   REPORTE GENERAL EN PARALELO")
+    print("-" * 50)
+    
+    procesos_maximos = procesos_maximos or os.cpu_count() or 1
+    registro_empleados = RegistroEmpleados().extender(generar_empleados_prueba(cantidad_empleados))
+    registro_proyectos = RegistroProyectos().extender(generar_proyectos_prueba(cantidad_proyectos))
+    # Cada empleado en uno o dos proyectos; los de presupuesto chico quedan no factibles
+    for posicion, empleado in enumerate(registro_empleados):
+        empleado.enlazar_proyecto(registro_proyectos[posicion % cantidad_proyectos])
+        segundo_proyecto = registro_proyectos[(posicion * 7 + 1) % cantidad_proyectos]
+        if posicion % 3 == 0 and not empleado.tiene_proyecto(segundo_proyecto):
+            empleado.enlazar_proyecto(segundo_proyecto)
+    
+    cantidades_procesos = [1]
+    while cantidades_procesos[-1] * 2 <= max(2, procesos_maximos):
+        cantidades_procesos.append(cantidades_procesos[-1] * 2)
+    if procesos_maximos > cantidades_procesos[-1]:
+        cantidades_procesos.append(procesos_maximos)
+    
+    es_correcto = True
+    print(f"{cantidad_empleados:,} empleados, {cantidad_proyectos:,} proyectos, {os.cpu_count()} núcleos")
+    for verificar_costos in (False, True):
+        Proyecto.verificar_consistencia_costos = verificar_costos
+        print("Con recálculo de costos (--verificar-costos):" if verificar_costos else "Con costos acumulados:")
+        inicio = time.perf_counter()
+        serial = calcular_estadisticas_sistema(registro_empleados, registro_proyectos)
+        segundos_serial = time.perf_counter() - inicio
+        for procesos in cantidades_procesos:
+            if procesos == 1:
+                segundos = segundos_serial
+                paralelo = serial
+            else:
+                inicio = time.perf_counter()
+                paralelo = calcular_estadisticas_en_paralelo(registro_empleados, registro_proyectos, procesos)
+                segundos = time.perf_counter() - inicio
+            es_correcto = es_correcto and vars(paralelo) == vars(serial)
+            print(f"  {procesos:>3} proceso(s): {segundos:6.2f} s ({segundos_serial / segundos:.2f}x)")
+    Proyecto.verificar_consistencia_costos = False
+    
+    if es_correcto:
+        print("RESULTADO: El reporte paralelo es idéntico al serial con cada cantidad de procesos")
+    else:
+        print("RESULTADO: El reporte paralelo difiere del serial")
+    return es_correcto
+
+
+def medir_servicio(cantidad_empleados=10**4, cantidad_proyectos=10**3, conexiones=32, solicitudes_por_conexion=300):
+    print("\n" + "-" * 50)
+    print("   SERVICIO HTTP: PRUEBA DE CARGA")
+    print("-" * 50)
+    
+    registro_empleados = RegistroEmpleados().extender(generar_empleados_prueba(cantidad_empleados))
+    registro_proyectos = RegistroProyectos().extender(generar_proyectos_prueba(cantidad_proyectos))
+    asignar_todos_los_proyectos(registro_empleados, registro_proyectos)
+    
+    async def probar(proporcion_escrituras):
+        # Servidor y cliente comparten el bucle; el servidor escucha en un puerto libre.
+        # Cada prueba usa su propio servicio porque el bloqueo queda ligado a su bucle
+        servicio = ServicioRRHH(registro_empleados, registro_proyectos)
+        servidor = await asyncio.start_server(servicio.atender_conexion, "127.0.0.1", 0)
+        try:
+            async with servidor:
+                return await ejecutar_prueba_carga(puerto=servidor.sockets[0].getsockname()[1],
+                                                   conexiones=conexiones,
+                                                   solicitudes_por_conexion=solicitudes_por_conexion,
+                                                   proporcion_escrituras=proporcion_escrituras)
+        finally:
+            servicio.cerrar()
+    
+    es_correcto = True
+    print(f"{cantidad_empleados:,} empleados, {cantidad_proyectos:,} proyectos, {conexiones} conexiones")
+    for proporcion_escrituras in (0.0, 0.1, 0.5):
+        print(f"Con {proporcion_escrituras:.0%} de escrituras:")
+        latencias, segundos, errores = asyncio.run(probar(proporcion_escrituras))
+        mostrar_resultado_carga(latencias, segundos, errores)
+        es_correcto = es_correcto and errores == 0
+    
+    # Las escrituras concurrentes no deben romper los invariantes de las asignaciones
+    es_correcto = es_correcto and all(
+        empleado.obtener_cantidad_proyectos() <= empleado.limite_proyectos
+        and len(empleado.ids_proyectos_asignados) == empleado.obtener_cantidad_proyectos()
+        for empleado in registro_empleados) and all(
+        proyecto.verificar_consistencia_costo() for proyecto in registro_proyectos)
+    
+    if es_correcto:
+        print("RESULTADO: Sin errores del servidor y con las asignaciones consistentes")
+    else:
+        print("RESULTADO: Hubo errores del servidor o asignaciones inconsistentes")
+    return es_correcto
+
+
+class ContadorSinBloqueo:
+    # Réplica del contador anterior: leer, sumar y escribir sin sincronización
+    siguiente = 1
+    
+    def obtener_id(self):
+        id_nuevo = ContadorSinBloqueo.siguiente
+        ContadorSinBloqueo.siguiente = max(ContadorSinBloqueo.siguiente, id_nuevo + 1)
+        return id_nuevo
+
+
+class ContadorConBloqueo:
+    # Alternativa descartada: un bloqueo global alrededor de cada ID
+    def __init__(self):
+        self.siguiente = 1
+        self.bloqueo = threading.Lock()
+    
+    def obtener_id(self):
+        with self.bloqueo:
+            id_nuevo = self.siguiente
+            self.siguiente += 1
+        return id_nuevo
+
+
+def obtener_ids_en_hilos(trabajo, hilos):
+    # Ejecuta trabajo() en cada hilo a la vez y junta los IDs que devuelve cada uno
+    resultados = [None] * hilos
+    barrera = threading.Barrier(hilos)
+    
+    def ejecutar(posicion):
+        barrera.wait()
+        resultados[posicion] = trabajo()
+    
+    # Cambios de hilo frecuentes para que las carreras aparezcan en poco tiempo
+    intervalo_anterior = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        inicio = time.perf_counter()
+        trabajadores = [threading.Thread(target=ejecutar, args=(posicion,)) for posicion in range(hilos)]
+        for trabajador in trabajadores:
+            trabajador.start()
+        for trabajador in trabajadores:
+            trabajador.join()
+        segundos = time.perf_counter() - inicio
+    finally:
+        sys.setswitchinterval(intervalo_anterior)
+    ids = array("q")
+    for parcial in resultados:
+        ids.extend(parcial)
+    return ids, segundos
+
+
+def contar_repetidos(ids):
+    return len(ids) - len(set(ids))
+
+
+def medir_asignador_ids(cantidad_ids=4 * 10**6, cantidad_empleados=2 * 10**6, hilos=16):
+    print("\n" + "-" * 50)
+    print("   ASIGNACIÓN DE IDS DESDE VARIOS HILOS")
+    print("-" * 50)
+    
+    por_hilo = cantidad_ids // hilos
+    print(f"{cantidad_ids:,} IDs pedidos desde {hilos} hilos:")
+    estrategias = [("Contador sin bloqueo (anterior)", ContadorSinBloqueo()),
+                   ("Bloqueo global por ID", ContadorConBloqueo()),
+                   ("Bloques por hilo", AsignadorIds())]
+    es_correcto = True
+    for descripcion, asignador in estrategias:
+        ids, segundos = obtener_ids_en_hilos(
+            lambda: array("q", (asignador.obtener_id() for _ in range(por_hilo))), hilos)
+        repetidos = contar_repetidos(ids)
+        print(f"  {descripcion:<32} {segundos:6.2f} s, {repetidos:,} IDs repetidos")
+        if isinstance(asignador, AsignadorIds):
+            es_correcto = es_correcto and repetidos == 0
+    
+    # Prueba de estrés con empleados reales, uno de cada tipo por vuelta
+    por_hilo = cantidad_empleados // hilos
+    constructores = [lambda i: Desarrollador(f"Estrés {i}", 1000.0, ["Python"], "Senior"),
+                     lambda i: Diseñador(f"Estrés {i}", 1000.0, ["Figma"], "UX"),
+                     lambda i: Gerente(f"Estrés {i}", 1000.0, "Operaciones")]
+    ids, segundos = obtener_ids_en_hilos(
+        lambda: array("q", (constructores[i % 3](i).id_empleado for i in range(por_hilo))), hilos)
+    repetidos = contar_repetidos(ids)
+    es_correcto = es_correcto and repetidos == 0 and len(ids) == por_hilo * hilos
+    print(f"{len(ids):,} empleados creados desde {hilos} hilos en {segundos:.2f} s: {repetidos:,} IDs repetidos")
+    
+    if es_correcto:
+        print("RESULTADO: El asignador por bloques no repitió ningún ID")
+    else:
+        print("RESULTADO: El asignador por bloques repitió IDs")
+    return es_correcto
+
+
+ESPECIALIDADES_PRUEBA = ["UX", "UI", "Gráfico", "Motion", "Editorial"]
+DEPARTAMENTOS_PRUEBA = ["Operaciones", "Ventas", "Tecnología", "Finanzas", "Recursos Humanos"]
+# Rango de salario base de cada nivel o tipo en la plantilla sintética
+RANGOS_SALARIO_PRUEBA = {"Junior": (900, 1500), "SemiSenior": (1400, 2300), "Senior": (2200, 3600),
+                         "Diseñador": (1000, 2600), "Gerente": (2500, 5000)}
+VERSION_RESULTADOS_RENDIMIENTO = 1
+DURACION_MINIMA_INTENTO = 0.1
+
+
+def generar_especificaciones_sinteticas(cantidad, azar):
+    # (clase, argumentos) de una plantilla realista: 50% desarrolladores (40%
+    # Junior, 35% SemiSenior, 25% Senior), 30% diseñadores y 20% gerentes
+    especificaciones = []
+    for _ in range(cantidad):
+        nombre = f"{azar.choice(NOMBRES_PRUEBA)} {azar.choice(APELLIDOS_PRUEBA)} {azar.choice(APELLIDOS_PRUEBA)}"
+        tirada = azar.random()
+        if tirada < 0.5:
+            nivel = azar.choices(("Junior", "SemiSenior", "Senior"), (40, 35, 25))[0]
+            especificaciones.append((Desarrollador, (nombre, round(azar.uniform(*RANGOS_SALARIO_PRUEBA[nivel]), 2),
+                                                     azar.sample(LENGUAJES_PRUEBA, azar.randint(1, 3)), nivel)))
+        elif tirada < 0.8:
+            especificaciones.append((Diseñador, (nombre, round(azar.uniform(*RANGOS_SALARIO_PRUEBA["Diseñador"]), 2),
+                                                 azar.sample(HERRAMIENTAS_PRUEBA, azar.randint(1, 2)),
+                                                 azar.choice(ESPECIALIDADES_PRUEBA))))
+        else:
+            especificaciones.append((Gerente, (nombre, round(azar.uniform(*RANGOS_SALARIO_PRUEBA["Gerente"]), 2),
+                                               azar.choice(DEPARTAMENTOS_PRUEBA))))
+    return especificaciones
+
+
+def generar_portafolio_sintetico(cantidad_empleados, azar):
+    # Un proyecto cada 10 empleados; con 1 a 3 proyectos por empleado quedan
+    # unos 20 empleados por proyecto y el presupuesto deja parte no factible
+    cantidad_proyectos = max(1, cantidad_empleados // 10)
+    proyectos = [(f"Proyecto {posicion}", round(20 * 2300 * azar.uniform(0.7, 1.5), 2))
+                 for posicion in range(cantidad_proyectos)]
+    asignaciones = [azar.sample(range(cantidad_proyectos), min(cantidad_proyectos, azar.randint(1, 3)))
+                    for _ in range(cantidad_empleados)]
+    return proyectos, asignaciones
+
+
+def medir_operacion(resultados, nombre, operaciones, funcion, repeticiones=1, calibrar=True):
+    # Guarda el mejor de varios intentos; el mínimo es el menos afectado por
+    # ruido. Si la función se puede repetir, cada intento la llama las veces
+    # necesarias para durar al menos DURACION_MINIMA_INTENTO. Como timeit, el
+    # recolector de ciclos queda apagado mientras se mide
+    gc.collect()
+    recolector_activo = gc.isenabled()
+    gc.disable()
+    try:
+        mejor = medir_intentos(funcion, repeticiones, calibrar)
+    finally:
+        if recolector_activo:
+            gc.enable()
+    resultados[nombre] = {"operaciones": operaciones, "segundos": mejor,
+                          "ns_por_operacion": mejor * 1e9 / max(1, operaciones)}
+
+
+def medir_intentos(funcion, repeticiones, calibrar):
+    vueltas = 1
+    if calibrar:
+        while True:
+            inicio = time.perf_counter()
+            for _ in range(vueltas):
+                funcion()
+            if time.perf_counter() - inicio >= DURACION_MINIMA_INTENTO:
+                break
+            vueltas *= 2
+    mejor = math.inf
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        for _ in range(vueltas):
+            funcion()
+        mejor = min(mejor, (time.perf_counter() - inicio) / vueltas)
+    return mejor
+
+
+def medir_suite_en_tamano(cantidad, semilla):
+    azar = random.Random(semilla)
+    especificaciones = generar_especificaciones_sinteticas(cantidad, azar)
+    datos_proyectos, asignaciones = generar_portafolio_sintetico(cantidad, azar)
+    # Los tamaños chicos se repiten más para que el ruido pese menos; cada
+    # intento de asignación necesita registros nuevos, por eso se repite menos
+    repeticiones = max(3, min(7, 10**5 // cantidad))
+    repeticiones_asignacion = max(1, min(9, 10**5 // cantidad))
+    resultados = {}
+    
+    estado = {}
+    
+    def crear_empleados():
+        estado["empleados"] = RegistroEmpleados().extender([clase(*argumentos)
+                                                            for clase, argumentos in especificaciones])
+    
+    def asignar_proyectos():
+        asignar_par_por_par(estado["empleados"], estado["proyectos"], estado["pares"])
+    
+    medir_operacion(resultados, "creacion_empleados", cantidad, crear_empleados, repeticiones)
+    mejor_asignacion = None
+    for _ in range(repeticiones_asignacion):
+        # Cada intento asigna sobre registros nuevos
+        crear_empleados()
+        estado["proyectos"] = RegistroProyectos().extender(Proyecto(nombre, presupuesto)
+                                                           for nombre, presupuesto in datos_proyectos)
+        empleados, proyectos = estado["empleados"], estado["proyectos"]
+        estado["pares"] = [(empleados[posicion].id_empleado, proyectos[posicion_proyecto].id_proyecto)
+                           for posicion, posiciones_proyecto in enumerate(asignaciones)
+                           for posicion_proyecto in posiciones_proyecto]
+        intento = {}
+        medir_operacion(intento, "asignar_proyecto_empleado", len(estado["pares"]), asignar_proyectos,
+                        calibrar=False)
+        if mejor_asignacion is None or intento["asignar_proyecto_empleado"]["segundos"] < mejor_asignacion["segundos"]:
+            mejor_asignacion = intento["asignar_proyecto_empleado"]
+    resultados["asignar_proyecto_empleado"] = mejor_asignacion
+    
+    empleados, proyectos = estado["empleados"], estado["proyectos"]
+    medir_operacion(resultados, "calcular_costo_total_proyecto", len(proyectos),
+                    lambda: [proyecto.calcular_costo_total_proyecto() for proyecto in proyectos], repeticiones)
+    medir_operacion(resultados, "verificar_factibilidad_proyecto", len(proyectos),
+                    lambda: [proyecto.verificar_factibilidad_proyecto() for proyecto in proyectos], repeticiones)
+    with open(os.devnull, "w", encoding="utf-8") as descarte:
+        with contextlib.redirect_stdout(descarte):
+            medir_operacion(resultados, "generar_reporte_general", cantidad + len(proyectos),
+                            lambda: generar_reporte_general(empleados, proyectos), repeticiones)
+        # Lo mismo que mostrar_informacion_empleados con un archivo de salida, sin filtros
+        medir_operacion(resultados, "mostrar_informacion_empleados", cantidad,
+                        lambda: escribir_en_bloques(renderizar_empleados(seleccionar_empleados(empleados)), descarte),
+                        repeticiones)
+    return resultados
+
+
+def comparar_resultados_rendimiento(actuales, referencia, tolerancia):
+    # Retorna (tamaño, operación, ns de referencia, ns actuales) de cada
+    # operación que quedó más lenta que la referencia por encima de la tolerancia
+    regresiones = []
+    for tamano, operaciones in actuales["resultados"].items():
+        for nombre, medicion in operaciones.items():
+            anterior = referencia["resultados"].get(tamano, {}).get(nombre)
+            if anterior and medicion["ns_por_operacion"] > anterior["ns_por_operacion"] * (1 + tolerancia):
+                regresiones.append((tamano, nombre, anterior["ns_por_operacion"], medicion["ns_por_operacion"]))
+    return regresiones
+
+
+def medir_suite_rendimiento(tamanos=(10**3, 10**4, 10**5, 10**6), semilla=2024, ruta_salida=None,
+                            ruta_referencia=None, tolerancia=0.25):
+    print("\n" + "-" * 50)
+    print("   SUITE DE RENDIMIENTO")
+    print("-" * 50)
+    
+    actuales = {"version": VERSION_RESULTADOS_RENDIMIENTO, "semilla": semilla,
+                "fecha": time.strftime("%Y-%m-%dT%H:%M:%S"), "python": sys.version.split()[0],
+                "plataforma": sys.platform, "resultados": {}}
+    for cantidad in tamanos:
+        resultados = medir_suite_en_tamano(cantidad, semilla)
+        actuales["resultados"][str(cantidad)] = resultados
+        print(f"{cantidad:,} empleados:")
+        for nombre, medicion in resultados.items():
+            print(f"  {nombre:<32} {medicion['segundos']:8.3f} s {medicion['ns_por_operacion']:10,.0f} ns/op")
+        gc.collect()
+    
+    if ruta_salida:
+        with open(ruta_salida, "w", encoding="utf-8") as archivo:
+            json.dump(actuales, archivo, ensure_ascii=False, indent=2)
+        print(f"Resultados guardados en {ruta_salida}")
+    
+    if not ruta_referencia:
+        return True
+    with open(ruta_referencia, encoding="utf-8") as archivo:
+        referencia = json.load(archivo)
+    if referencia.get("version") != VERSION_RESULTADOS_RENDIMIENTO:
+        print(f"Error: {ruta_referencia} tiene otra versión de resultados")
+        return False
+    regresiones = comparar_resultados_rendimiento(actuales, referencia, tolerancia)
+    for tamano, nombre, anterior, actual in regresiones:
+        print(f"  REGRESIÓN {nombre} con {int(tamano):,}: {anterior:,.0f} -> {actual:,.0f} ns/op "
+              f"({actual / anterior - 1:+.0%})")
+    if regresiones:
+        print(f"RESULTADO: {len(regresiones)} operación(es) más lenta(s) que {ruta_referencia} "
+              f"(tolerancia {tolerancia:.0%})")
+    else:
+        print(f"RESULTADO: Sin regresiones respecto de {ruta_referencia} (tolerancia {tolerancia:.0%})")
+    return not regresiones
+
+
+def calcular_salario_con_ramas(empleado):
+    # Reglas anteriores a la tabla: comparaciones de textos en cada llamada
+    salario_calculado = empleado.salario_base
+    if isinstance(empleado, Desarrollador):
+        if empleado.nivel_experiencia.lower() == "senior":
+            salario_calculado *= 1.25
+        elif empleado.nivel_experiencia.lower() == "semisenior":
+            salario_calculado *= 1.15
+    elif isinstance(empleado, Diseñador):
+        if empleado.especialidad_diseno.lower() in ["ui", "ux"]:
+            salario_calculado *= 1.20
+    elif isinstance(empleado, Gerente):
+        salario_calculado *= 1.35
+    return salario_calculado
+
+
+def medir_reglas_compensacion(cantidad=10**6, repeticiones=5, semilla=2024):
+    print("\n" + "-" * 50)
+    print("   REGLAS DE COMPENSACIÓN EN TABLA")
+    print("-" * 50)
+    
+    azar = random.Random(semilla)
+    especificaciones = generar_especificaciones_sinteticas(cantidad, azar)
+    inicio = time.perf_counter()
+    empleados = [clase(*argumentos) for clase, argumentos in especificaciones]
+    segundos_creacion = time.perf_counter() - inicio
+    
+    resultados = {}
+    medir_operacion(resultados, "ramas", cantidad,
+                    lambda: [calcular_salario_con_ramas(empleado) for empleado in empleados], repeticiones)
+    medir_operacion(resultados, "tabla", cantidad,
+                    lambda: [empleado.calcular_salario_total() for empleado in empleados], repeticiones)
+    iguales = all(empleado.calcular_salario_total() == calcular_salario_con_ramas(empleado)
+                  for empleado in empleados)
+    
+    print(f"{cantidad:,} empleados creados en {segundos_creacion:.2f} s (la regla se resuelve al crearlos)")
+    print(f"Salario con comparaciones de textos: {resultados['ramas']['ns_por_operacion']:6.0f} ns/empleado")
+    print(f"Salario con la regla resuelta:       {resultados['tabla']['ns_por_operacion']:6.0f} ns/empleado")
+    print(f"Mismos salarios que las reglas anteriores: {'sí' if iguales else 'no'}")
+    
+    # Un cambio de reglas no necesita tocar el código: se compila otra tabla
+    # y los empleados nuevos la usan; los ya creados conservan su regla, con
+    # el salario y el porcentaje mostrado de acuerdo
+    configuracion = json.loads(json.dumps(REGLAS_COMPENSACION_PREDETERMINADAS))
+    configuracion["reglas"][0]["bonificacion"] = 30
+    anterior = Desarrollador("Prueba Reglas", 1000.0, ["Python"], "Senior")
+    tabla_compensacion.compilar(configuracion)
+    try:
+        senior = Desarrollador("Prueba Reglas", 1000.0, ["Python"], "Senior")
+        print(f"Con el senior al 30%: salario total {senior.calcular_salario_total():,.2f} "
+              f"sobre una base de 1,000.00")
+        cambio_aplicado = (math.isclose(senior.calcular_salario_total(), 1300.0)
+                           and senior.obtener_porcentaje_bonificacion() == 30)
+        regla_conservada = (math.isclose(anterior.calcular_salario_total(), 1250.0)
+                            and anterior.obtener_porcentaje_bonificacion() == 25)
+        print(f"El senior creado antes del cambio sigue con "
+              f"{anterior.obtener_porcentaje_bonificacion()}%: {anterior.calcular_salario_total():,.2f}")
+    finally:
+        tabla_compensacion.compilar(REGLAS_COMPENSACION_PREDETERMINADAS)
+    return iguales and cambio_aplicado and regla_conservada
+
+
+def medir_instrumentacion(cantidad=10**5, repeticiones=5, semilla=2024):
+    print("\n" + "-" * 50)
+    print("   COSTO DE LA INSTRUMENTACIÓN")
+    print("-" * 50)
+    
+    azar = random.Random(semilla)
+    empleados = RegistroEmpleados().extender([clase(*argumentos) for clase, argumentos
+                                              in generar_especificaciones_sinteticas(cantidad, azar)])
+    proyectos = RegistroProyectos().extender(Proyecto(f"Proyecto {posicion}", 10**6) for posicion in range(1000))
+    for posicion, empleado in enumerate(empleados):
+        empleado.enlazar_proyecto(proyectos[posicion % len(proyectos)])
+    original = vars(Empleado)["calcular_salario_total"]
+    
+    def medir_salarios():
+        resultados = {}
+        medir_operacion(resultados, "salarios", cantidad,
+                        lambda: [empleado.calcular_salario_total() for empleado in empleados], repeticiones)
+        return resultados["salarios"]["ns_por_operacion"]
+    
+    antes = medir_salarios()
+    instrumentacion.activar()
+    try:
+        activa = medir_salarios()
+        with open(os.devnull, "w", encoding="utf-8") as descarte:
+            with contextlib.redirect_stdout(descarte):
+                # Por el módulo: la instrumentación reemplaza la acción del menú en rrhh
+                rrhh.generar_reporte_general(empleados, proyectos)
+        resumen = instrumentacion.obtener_instantanea()["operaciones"]
+    finally:
+        instrumentacion.desactivar()
+    instrumentacion.activar(medir_memoria=True)
+    try:
+        con_memoria = medir_salarios()
+    finally:
+        instrumentacion.desactivar()
+    despues = medir_salarios()
+    restaurada = vars(Empleado)["calcular_salario_total"] is original
+    
+    print(f"calcular_salario_total sin instrumentar:  {antes:8.0f} ns/llamada")
+    print(f"calcular_salario_total instrumentado:     {activa:8.0f} ns/llamada")
+    print(f"  ... midiendo también la memoria:          {con_memoria:8.0f} ns/llamada")
+    print(f"calcular_salario_total tras desactivar:   {despues:8.0f} ns/llamada")
+    print(f"Métodos originales restaurados: {'sí' if restaurada else 'no'}")
+    for nombre in ("Empleado.calcular_salario_total", "Proyecto.calcular_costo_total_proyecto",
+                   "menu.generar_reporte_general"):
+        metrica = resumen[nombre]
+        percentiles = ", ".join(f"{clave} {segundos * 1e6:,.1f} us"
+                                for clave, segundos in metrica["percentiles_segundos"].items())
+        print(f"  {nombre}: {metrica['llamadas']:,} llamadas, {percentiles}")
+    instrumentacion.reiniciar()
+    return restaurada
+
+
+# ================================
+# PROGRAMA PRINCIPAL
+# ================================
+
+MEDICIONES = {
+    "escalado": medir_escalado_inserciones,
+    "nomina": medir_nomina_columnar,
+    "memoria": medir_memoria_empleados,
+    "instantanea": medir_instantanea,
+    "asignacion": medir_asignacion_lote,
+    "busqueda": medir_busqueda_nombres,
+    "habilidades": medir_indice_habilidades,
+    "equipo": medir_seleccion_equipo,
+    "planificacion": medir_planificacion_global,
+    "escenarios": medir_escenarios_salariales,
+    "reporte": medir_reporte_paralelo,
+    "servicio": medir_servicio,
+    "ids": medir_asignador_ids,
+    "compensacion": medir_reglas_compensacion,
+    "instrumentacion": medir_instrumentacion,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mediciones de rendimiento del sistema de RRHH")
+    parser.add_argument("medicion", choices=list(MEDICIONES) + ["suite"],
+                        help="medición a ejecutar; suite corre la carga sintética en varios tamaños")
+    parser.add_argument("--salida-json", metavar="ARCHIVO",
+                        help="con suite, guarda los resultados en ARCHIVO")
+    parser.add_argument("--comparar", metavar="ARCHIVO",
+                        help="con suite, marca las regresiones respecto de los resultados en ARCHIVO")
+    parser.add_argument("--tolerancia", type=float, default=0.25, metavar="FRACCION",
+                        help="con --comparar, cuánto más lenta puede ser una operación (por defecto 0.25)")
+    argumentos = parser.parse_args()
+    if argumentos.medicion == "suite":
+        correcto = medir_suite_rendimiento(ruta_salida=argumentos.salida_json,
+                                           ruta_referencia=argumentos.comparar,
+                                           tolerancia=argumentos.tolerancia)
+    else:
+        correcto = MEDICIONES[argumentos.medicion]()
+    return 0 if correcto else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,1099 @@
+# ================================
+# MODELO DEL SISTEMA DE RRHH Y PROYECTOS
+# ================================
+
+# Empleados, proyectos, sus registros y las operaciones que comparten el programa, la persistencia y el servicio
+
+import abc
+import bisect
+import collections
+import concurrent.futures
+import gc
+import itertools
+import json
+import math
+import multiprocessing
+import sys
+import threading
+import unicodedata
+import weakref
+from array import array
+
+
+# ================================
+# REGLAS DE COMPENSACIÓN
+# ================================
+
+# Mismo formato que --reglas-compensacion; una regla sin "categorias" vale para todo su tipo
+VERSION_REGLAS_COMPENSACION = 1
+REGLAS_COMPENSACION_PREDETERMINADAS = {
+    "version": VERSION_REGLAS_COMPENSACION,
+    "reglas": [
+        {"tipo": "Desarrollador", "categorias": ["senior"], "bonificacion": 25},
+        {"tipo": "Desarrollador", "categorias": ["semisenior"], "bonificacion": 15},
+        {"tipo": "Diseñador", "categorias": ["ui", "ux"], "bonificacion": 20},
+        {"tipo": "Gerente", "bonificacion": 35},
+    ],
+}
+TIPOS_CON_REGLAS_COMPENSACION = ("Desarrollador", "Diseñador", "Gerente")
+
+
+def normalizar_categoria_compensacion(categoria):
+    return categoria.lower() if categoria else ""
+
+
+class ReglaCompensacion:
+    # Cada empleado guarda la suya aunque después se cargue otra tabla
+    __slots__ = ("codigo", "porcentaje", "multiplicador")
+    
+    def __init__(self, codigo, porcentaje):
+        self.codigo = codigo
+        self.porcentaje = porcentaje
+        self.multiplicador = 1 + porcentaje / 100
+
+
+REGLA_SIN_BONIFICACION = ReglaCompensacion(0, 0)
+
+
+class TablaCompensacion:
+    # (tipo, categoría normalizada) -> regla, resuelta al crear el empleado o cambiar su categoría
+    def __init__(self, configuracion=REGLAS_COMPENSACION_PREDETERMINADAS):
+        self.compilar(configuracion)
+    
+    def compilar(self, configuracion):
+        # Se valida todo antes de reemplazar la tabla actual
+        if not isinstance(configuracion, dict) or configuracion.get("version") != VERSION_REGLAS_COMPENSACION:
+            raise ValueError(f'se esperaba un objeto con "version": {VERSION_REGLAS_COMPENSACION}')
+        reglas = configuracion.get("reglas")
+        if not isinstance(reglas, list):
+            raise ValueError('"reglas" debe ser una lista')
+        
+        codigos = {}
+        codigos_por_defecto = {}
+        reglas_compiladas = [REGLA_SIN_BONIFICACION]
+        for codigo, regla in enumerate(reglas, start=1):
+            if not isinstance(regla, dict):
+                raise ValueError(f"regla {codigo}: debe ser un objeto")
+            tipo = regla.get("tipo")
+            if tipo not in TIPOS_CON_REGLAS_COMPENSACION:
+                raise ValueError(f"regla {codigo}: tipo de empleado desconocido {tipo!r}")
+            bonificacion = regla.get("bonificacion")
+            if isinstance(bonificacion, bool) or not isinstance(bonificacion, (int, float)) or not bonificacion > -100:
+                raise ValueError(f'regla {codigo}: "bonificacion" debe ser un porcentaje mayor que -100')
+            categorias = regla.get("categorias")
+            if categorias is None:
+                if tipo in codigos_por_defecto:
+                    raise ValueError(f"regla {codigo}: {tipo} ya tiene una regla sin categorías")
+                codigos_por_defecto[tipo] = codigo
+            else:
+                if (not isinstance(categorias, list) or not categorias
+                        or not all(isinstance(categoria, str) and categoria.strip() for categoria in categorias)):
+                    raise ValueError(f'regla {codigo}: "categorias" debe ser una lista de textos')
+                for categoria in categorias:
+                    clave = (tipo, normalizar_categoria_compensacion(categoria))
+                    if clave in codigos:
+                        raise ValueError(f"regla {codigo}: la categoría {categoria!r} de {tipo} ya tiene regla")
+                    codigos[clave] = codigo
+            reglas_compiladas.append(ReglaCompensacion(codigo, bonificacion))
+        
+        self.codigos = codigos
+        self.codigos_por_defecto = codigos_por_defecto
+        self.reglas = reglas_compiladas
+        # Los textos categóricos están internados y se repiten mucho: cada par
+        # (tipo, categoría sin normalizar) se resuelve una sola vez
+        self.reglas_resueltas = {}
+    
+    def cargar_archivo(self, ruta_archivo):
+        with open(ruta_archivo, encoding="utf-8") as archivo:
+            try:
+                configuracion = json.load(archivo)
+            except json.JSONDecodeError as error:
+                raise ValueError(f"JSON inválido: {error}") from error
+        self.compilar(configuracion)
+    
+    def obtener_regla(self, tipo, categoria):
+        clave = (tipo, categoria)
+        regla = self.reglas_resueltas.get(clave)
+        if regla is None:
+            codigo = self.codigos.get((tipo, normalizar_categoria_compensacion(categoria)),
+                                      self.codigos_por_defecto.get(tipo, 0))
+            regla = self.reglas_resueltas[clave] = self.reglas[codigo]
+        return regla
+
+
+# Se carga antes de crear empleados: los ya creados conservan la regla que resolvieron
+tabla_compensacion = TablaCompensacion()
+
+
+# ================================
+# DEFINICIÓN DE CLASES DEL SISTEMA
+# ================================
+
+SIN_PROYECTOS = frozenset()
+
+
+class AsignadorIds:
+    # Cada hilo consume su propio bloque de IDs; el bloqueo solo se toma al reservar otro
+    def __init__(self, siguiente=1, tamano_bloque=1024):
+        # siguiente es el primer ID sin reservar; es lo que se persiste
+        self.siguiente = siguiente
+        self.minimo = siguiente
+        self.tamano_bloque = tamano_bloque
+        self.bloqueo = threading.Lock()
+        self.bloques_por_hilo = threading.local()
+    
+    def obtener_id(self):
+        for id_nuevo in getattr(self.bloques_por_hilo, "ids", ()):
+            # Un bloque reservado antes de restaurar datos guardados puede quedar por debajo de ellos
+            if id_nuevo >= self.minimo:
+                return id_nuevo
+        with self.bloqueo:
+            inicio = self.siguiente
+            self.siguiente = inicio + self.tamano_bloque
+        self.bloques_por_hilo.ids = iter(range(inicio + 1, inicio + self.tamano_bloque))
+        return inicio
+    
+    def avanzar_hasta(self, siguiente):
+        # Al restaurar registros guardados los IDs nuevos continúan después de
+        # ellos; la comparación previa evita el bloqueo en el caso común
+        if siguiente > self.minimo:
+            with self.bloqueo:
+                self.minimo = max(self.minimo, siguiente)
+                self.siguiente = max(self.siguiente, siguiente)
+
+
+class Empleado:
+    # __slots__ evita un __dict__ por instancia; los textos categóricos se
+    # internan para que todos los empleados compartan la misma cadena
+    __slots__ = ("id_empleado", "nombre_completo", "lista_proyectos", "ids_proyectos_asignados",
+                 "_salario_base", "_activo", "regla_compensacion")
+    asignador_ids = AsignadorIds()
+    # observador(empleado, campo) tras cambiar salario, categoría o activo; los usan los almacenes
+    observadores_cambios = []
+    # Atributo con setter que cambia la categoría del índice de habilidades
+    atributo_categoria = None
+    # Política de capacidad: máximo de proyectos simultáneos. Se configura con
+    # --limite-proyectos y una subclase puede redefinirlo para su tipo de empleado
+    limite_proyectos = 3
+    
+    def __init__(self, nombre_completo, salario_base, id_empleado=None):
+        # id_empleado solo se indica al restaurar un empleado ya registrado
+        if id_empleado is None:
+            id_empleado = Empleado.asignador_ids.obtener_id()
+        else:
+            Empleado.asignador_ids.avanzar_hasta(id_empleado + 1)
+        self.id_empleado = id_empleado
+        self.nombre_completo = nombre_completo
+        # Lista en orden de asignación y conjunto de IDs; sin proyectos se comparte un frozenset vacío
+        self.lista_proyectos = []
+        self.ids_proyectos_asignados = SIN_PROYECTOS
+        # Las subclases la resuelven con tabla_compensacion al fijar su categoría
+        self.regla_compensacion = REGLA_SIN_BONIFICACION
+        # Un empleado nuevo no tiene proyectos ni observadores interesados: los
+        # datos se asignan directo, sin pasar por los setters que notifican
+        self._salario_base = salario_base
+        self._activo = True
+    
+    @property
+    def salario_base(self):
+        return self._salario_base
+    
+    @salario_base.setter
+    def salario_base(self, valor):
+        self.cambiar_dato_salarial("_salario_base", valor)
+    
+    @property
+    def activo(self):
+        return self._activo
+    
+    @activo.setter
+    def activo(self, valor):
+        self._activo = valor
+        self.notificar_cambio("activo")
+    
+    def notificar_cambio(self, campo):
+        # Sobre una copia: un observador débil puede quitarse durante el recorrido
+        for observador in tuple(Empleado.observadores_cambios):
+            observador(self, campo)
+    
+    def cambiar_dato_salarial(self, atributo, valor, resolver_regla=False):
+        # Ajusta el costo de cada proyecto asignado; resolver_regla: el campo es la categoría
+        salario_anterior = self.calcular_salario_total() if self.lista_proyectos else None
+        setattr(self, atributo, valor)
+        if resolver_regla:
+            self.resolver_compensacion()
+        if salario_anterior is not None:
+            diferencia = self.calcular_salario_total() - salario_anterior
+            for proyecto in self.lista_proyectos:
+                proyecto.ajustar_costo_total_proyecto(diferencia)
+        self.notificar_cambio(atributo.lstrip("_"))
+    
+    def obtener_id_empleado(self):
+        return self.id_empleado
+    
+    def obtener_nombre_completo(self):
+        return self.nombre_completo
+    
+    def calcular_salario_total(self):
+        return self._salario_base * self.regla_compensacion.multiplicador
+    
+    def obtener_categoria_compensacion(self):
+        # Valor que elige la regla de compensación dentro del tipo; None: solo la del tipo
+        return None
+    
+    def resolver_compensacion(self):
+        self.regla_compensacion = tabla_compensacion.obtener_regla(getattr(self, "tipo_empleado", None),
+                                                                   self.obtener_categoria_compensacion())
+    
+    def obtener_porcentaje_bonificacion(self):
+        return self.regla_compensacion.porcentaje
+    
+    def obtener_perfil_habilidades(self):
+        # (habilidades, valor de la categoría nombre_categoria) para el índice de habilidades
+        return [], None
+    
+    def asignar_proyecto_empleado(self, proyecto):
+        motivo = self.obtener_motivo_rechazo(proyecto)
+        if motivo is not None:
+            raise ValueError(motivo)
+        
+        self.enlazar_proyecto(proyecto)
+        print(f"Proyecto '{proyecto.nombre_proyecto}' asignado a {self.nombre_completo}")
+    
+    def obtener_motivo_rechazo(self, proyecto, ids_en_lote=()):
+        # None si la asignación es válida. ids_en_lote son los proyectos ya
+        # aceptados para este empleado en un lote que todavía no se aplicó
+        if proyecto.id_proyecto in self.ids_proyectos_asignados or proyecto.id_proyecto in ids_en_lote:
+            return "El empleado ya está asignado a este proyecto"
+        if len(self.ids_proyectos_asignados) + len(ids_en_lote) >= self.limite_proyectos:
+            return f"Límite máximo de {self.limite_proyectos} proyectos alcanzado"
+        return None
+    
+    def tiene_proyecto(self, proyecto):
+        return proyecto.id_proyecto in self.ids_proyectos_asignados
+    
+    def enlazar_proyecto(self, proyecto):
+        # Registra la asignación en ambos lados sin validar ni imprimir;
+        # se usa al restaurar asignaciones que ya fueron validadas
+        self.lista_proyectos.append(proyecto)
+        if self.ids_proyectos_asignados is SIN_PROYECTOS:
+            self.ids_proyectos_asignados = set()
+        self.ids_proyectos_asignados.add(proyecto.id_proyecto)
+        proyecto.agregar_empleado_proyecto(self)
+    
+    def desenlazar_proyecto(self, proyecto):
+        # Inverso de enlazar_proyecto; se usa al deshacer un lote que no se pudo guardar
+        self.lista_proyectos.remove(proyecto)
+        self.ids_proyectos_asignados.discard(proyecto.id_proyecto)
+        proyecto.quitar_empleado_proyecto(self)
+    
+    def obtener_cantidad_proyectos(self):
+        return len(self.lista_proyectos)
+    
+    def obtener_informacion_empleado(self):
+        return (f"ID: {self.id_empleado}, Nombre: {self.nombre_completo}, "
+                f"Proyectos: {self.obtener_cantidad_proyectos()}")
+    
+    def obtener_informacion_completa(self):
+        return "".join(self.generar_lineas_informacion())
+    
+    def generar_lineas_informacion(self):
+        # Las subclases agregan sus líneas con yield from super()
+        yield f"ID: {self.id_empleado}\n"
+        yield f"Nombre completo: {self.nombre_completo}\n"
+        yield f"Salario base: ${self.salario_base:,.2f}\n"
+        yield f"Salario total: ${self.calcular_salario_total():,.2f}\n"
+        yield f"Proyectos asignados: {self.obtener_cantidad_proyectos()}\n"
+        
+        if self.lista_proyectos:
+            yield "Proyectos:\n"
+            for proyecto in self.lista_proyectos:
+                yield f"  - {proyecto.nombre_proyecto}\n"
+        else:
+            yield "Proyectos: Ninguno asignado\n"
+
+
+class Desarrollador(Empleado):
+    __slots__ = ("lenguajes_programacion", "_nivel_experiencia")
+    tipo_empleado = "Desarrollador"
+    nombre_categoria = "nivel"
+    atributo_categoria = "nivel_experiencia"
+    
+    def __init__(self, nombre_completo, salario_base, lenguajes_programacion, nivel_experiencia,
+                 id_empleado=None):
+        super().__init__(nombre_completo, salario_base, id_empleado)
+        self.lenguajes_programacion = [sys.intern(lenguaje.strip()) for lenguaje in lenguajes_programacion]
+        self._nivel_experiencia = sys.intern(nivel_experiencia)
+        self.resolver_compensacion()
+    
+    @property
+    def nivel_experiencia(self):
+        return self._nivel_experiencia
+    
+    @nivel_experiencia.setter
+    def nivel_experiencia(self, valor):
+        self.cambiar_dato_salarial("_nivel_experiencia", sys.intern(valor), resolver_regla=True)
+    
+    def obtener_categoria_compensacion(self):
+        return self._nivel_experiencia
+    
+    def obtener_perfil_habilidades(self):
+        return self.lenguajes_programacion, self.nivel_experiencia
+    
+    def generar_lineas_informacion(self):
+        yield from super().generar_lineas_informacion()
+        yield f"Tipo de empleado: {self.tipo_empleado}\n"
+        yield f"Nivel de experiencia: {self.nivel_experiencia}\n"
+        yield f"Lenguajes: {', '.join(self.lenguajes_programacion)}\n"
+        yield f"Bonificación aplicada: {self.obtener_porcentaje_bonificacion():g}%\n"
+
+
+class Diseñador(Empleado):
+    __slots__ = ("herramientas_diseno", "_especialidad_diseno")
+    tipo_empleado = "Diseñador"
+    nombre_categoria = "especialidad"
+    atributo_categoria = "especialidad_diseno"
+    
+    def __init__(self, nombre_completo, salario_base, herramientas_diseno, especialidad_diseno,
+                 id_empleado=None):
+        super().__init__(nombre_completo, salario_base, id_empleado)
+        self.herramientas_diseno = [sys.intern(herramienta.strip()) for herramienta in herramientas_diseno]
+        self._especialidad_diseno = sys.intern(especialidad_diseno)
+        self.resolver_compensacion()
+    
+    @property
+    def especialidad_diseno(self):
+        return self._especialidad_diseno
+    
+    @especialidad_diseno.setter
+    def especialidad_diseno(self, valor):
+        self.cambiar_dato_salarial("_especialidad_diseno", sys.intern(valor), resolver_regla=True)
+    
+    def obtener_categoria_compensacion(self):
+        return self._especialidad_diseno
+    
+    def obtener_perfil_habilidades(self):
+        return self.herramientas_diseno, self.especialidad_diseno
+    
+    def generar_lineas_informacion(self):
+        yield from super().generar_lineas_informacion()
+        yield f"Tipo de empleado: {self.tipo_empleado}\n"
+        yield f"Especialidad: {self.especialidad_diseno}\n"
+        yield f"Herramientas: {', '.join(self.herramientas_diseno)}\n"
+        yield f"Bonificación aplicada: {self.obtener_porcentaje_bonificacion():g}%\n"
+
+
+class Gerente(Empleado):
+    __slots__ = ("departamento_gerencia",)
+    tipo_empleado = "Gerente"
+    nombre_categoria = "departamento"
+    
+    def __init__(self, nombre_completo, salario_base, departamento_gerencia, id_empleado=None):
+        super().__init__(nombre_completo, salario_base, id_empleado)
+        self.departamento_gerencia = sys.intern(departamento_gerencia)
+        self.resolver_compensacion()
+    
+    def obtener_perfil_habilidades(self):
+        return [], self.departamento_gerencia
+    
+    def generar_lineas_informacion(self):
+        yield from super().generar_lineas_informacion()
+        yield f"Tipo de empleado: {self.tipo_empleado}\n"
+        yield f"Departamento: {self.departamento_gerencia}\n"
+        yield f"Bonificación aplicada: {self.obtener_porcentaje_bonificacion():g}%\n"
+
+
+class Proyecto:
+    __slots__ = ("id_proyecto", "nombre_proyecto", "presupuesto_asignado",
+                 "lista_empleados_asignados", "ids_empleados_asignados", "costo_total_acumulado",
+                 "estado_proyecto")
+    asignador_ids = AsignadorIds()
+    # Si está activo, cada lectura del costo se compara con un recálculo completo
+    verificar_consistencia_costos = False
+    
+    def __init__(self, nombre_proyecto, presupuesto_asignado, id_proyecto=None):
+        # id_proyecto solo se indica al restaurar un proyecto ya registrado
+        if id_proyecto is None:
+            id_proyecto = Proyecto.asignador_ids.obtener_id()
+        else:
+            Proyecto.asignador_ids.avanzar_hasta(id_proyecto + 1)
+        self.id_proyecto = id_proyecto
+        self.nombre_proyecto = nombre_proyecto
+        self.presupuesto_asignado = presupuesto_asignado
+        self.lista_empleados_asignados = []
+        self.ids_empleados_asignados = set()
+        self.costo_total_acumulado = 0
+        self.estado_proyecto = sys.intern("Planificación")
+    
+    def agregar_empleado_proyecto(self, empleado):
+        self.lista_empleados_asignados.append(empleado)
+        self.ids_empleados_asignados.add(empleado.id_empleado)
+        self.costo_total_acumulado += empleado.calcular_salario_total()
+        return self.lista_empleados_asignados
+    
+    def quitar_empleado_proyecto(self, empleado):
+        self.lista_empleados_asignados.remove(empleado)
+        self.ids_empleados_asignados.discard(empleado.id_empleado)
+        self.costo_total_acumulado -= empleado.calcular_salario_total()
+        return self.lista_empleados_asignados
+    
+    def tiene_empleado(self, empleado):
+        return empleado.id_empleado in self.ids_empleados_asignados
+    
+    def ajustar_costo_total_proyecto(self, diferencia):
+        self.costo_total_acumulado += diferencia
+    
+    def recalcular_costo_total_proyecto(self):
+        costo_total = 0
+        for empleado in self.lista_empleados_asignados:
+            costo_total += empleado.calcular_salario_total()
+        return costo_total
+    
+    def verificar_consistencia_costo(self):
+        return math.isclose(self.costo_total_acumulado, self.recalcular_costo_total_proyecto(),
+                            rel_tol=1e-9, abs_tol=1e-6)
+    
+    def calcular_costo_total_proyecto(self):
+        if Proyecto.verificar_consistencia_costos and not self.verificar_consistencia_costo():
+            raise ValueError(f"Costo acumulado inconsistente en el proyecto '{self.nombre_proyecto}': "
+                             f"{self.costo_total_acumulado} != {self.recalcular_costo_total_proyecto()}")
+        return self.costo_total_acumulado
+    
+    def calcular_margen_proyecto(self):
+        # Positivo: margen disponible. Negativo: déficit presupuestario
+        return self.presupuesto_asignado - self.calcular_costo_total_proyecto()
+    
+    def verificar_factibilidad_proyecto(self):
+        return self.calcular_margen_proyecto() >= 0
+    
+    def obtener_informacion_proyecto(self):
+        return (f"ID: {self.id_proyecto}, Nombre: {self.nombre_proyecto}, "
+                f"Empleados: {len(self.lista_empleados_asignados)}, "
+                f"Presupuesto: ${self.presupuesto_asignado:,.2f}")
+
+
+class Registro(abc.ABC):
+    # Colección ordenada con índice hash por ID: búsqueda O(1) en lugar de recorrer la lista
+    def __init__(self):
+        self.lista_elementos = []
+        self.indice_por_id = {}
+        # El índice de nombres se construye en la primera búsqueda y después
+        # se actualiza con cada registro agregado
+        self.indice_nombres = None
+
+    @abc.abstractmethod
+    def obtener_id(self, elemento):
+        pass
+
+    @abc.abstractmethod
+    def obtener_nombre(self, elemento):
+        pass
+
+    def agregar(self, elemento):
+        id_elemento = self.obtener_id(elemento)
+        if id_elemento in self.indice_por_id:
+            raise ValueError(f"Ya existe un registro con ID {id_elemento}")
+        self.lista_elementos.append(elemento)
+        self.indice_por_id[id_elemento] = elemento
+        self.indexar([elemento])
+        return self
+
+    def extender(self, elementos):
+        for elemento in elementos:
+            self.agregar(elemento)
+        return self
+
+    def buscar_por_id(self, id_elemento):
+        return self.indice_por_id.get(id_elemento)
+
+    def registrar_asignacion(self, empleado, proyecto):
+        self.registrar_asignaciones([(empleado, proyecto)])
+
+    def registrar_asignaciones(self, asignaciones):
+        # Punto de extensión para registros que deben guardar las asignaciones
+        self.indexar_asignaciones(asignaciones)
+
+    def indexar_asignaciones(self, asignaciones):
+        pass
+
+    def nombres_registrados(self):
+        for elemento in self.lista_elementos:
+            yield self.obtener_id(elemento), self.obtener_nombre(elemento)
+
+    def indexar(self, elementos):
+        # Mantiene al día los índices que ya se construyeron
+        if self.indice_nombres is not None:
+            for elemento in elementos:
+                self.indice_nombres.agregar(self.obtener_id(elemento), self.obtener_nombre(elemento))
+
+    def buscar_por_nombre(self, consulta, cantidad=10):
+        if self.indice_nombres is None:
+            self.indice_nombres = IndiceNombres()
+            self.indice_nombres.agregar_varios(self.nombres_registrados())
+        return [self.buscar_por_id(id_elemento) for id_elemento in self.indice_nombres.buscar(consulta, cantidad)]
+
+    def __len__(self):
+        return len(self.lista_elementos)
+
+    def __iter__(self):
+        return iter(self.lista_elementos)
+
+    def __getitem__(self, posicion):
+        return self.lista_elementos[posicion]
+
+    def __contains__(self, elemento):
+        return self.indice_por_id.get(self.obtener_id(elemento)) is elemento
+
+
+class RegistroEmpleados(Registro):
+    def __init__(self):
+        super().__init__()
+        # Igual que el de nombres: se construye en la primera consulta
+        self.indice_habilidades = None
+
+    def obtener_id(self, empleado):
+        return empleado.obtener_id_empleado()
+
+    def obtener_nombre(self, empleado):
+        return empleado.nombre_completo
+
+    def perfiles_registrados(self):
+        return (obtener_perfil_empleado(empleado) for empleado in self.lista_elementos)
+
+    def empleados_de_tipo(self, tipo_empleado):
+        tipo_normalizado = tipo_empleado.lower()
+        return (empleado for empleado in self if getattr(empleado, "tipo_empleado", "").lower() == tipo_normalizado)
+
+    def indexar(self, empleados):
+        super().indexar(empleados)
+        if self.indice_habilidades is not None:
+            for empleado in empleados:
+                self.indice_habilidades.agregar(*obtener_perfil_empleado(empleado))
+
+    def indexar_asignaciones(self, asignaciones):
+        if self.indice_habilidades is not None:
+            for empleado, _ in asignaciones:
+                self.indice_habilidades.actualizar_capacidad(
+                    empleado.obtener_id_empleado(), empleado.obtener_cantidad_proyectos(), empleado.limite_proyectos)
+
+    def buscar_por_habilidades(self, habilidades=(), tipo_empleado=None, nivel=None, especialidad=None,
+                               departamento=None, solo_disponibles=False):
+        # Empleados que cumplen todos los criterios indicados, ordenados por ID.
+        # solo_disponibles excluye a quienes ya alcanzaron su límite de proyectos
+        if self.indice_habilidades is None:
+            self.indice_habilidades = IndiceHabilidades()
+            for perfil in self.perfiles_registrados():
+                self.indice_habilidades.agregar(*perfil)
+        claves = [("habilidad", habilidad) for habilidad in habilidades]
+        for categoria, valor in (("tipo", tipo_empleado), ("nivel", nivel), ("especialidad", especialidad),
+                                 ("departamento", departamento)):
+            if valor:
+                claves.append((categoria, valor))
+        ids_encontrados = self.indice_habilidades.buscar(claves, solo_disponibles)
+        return [self.buscar_por_id(id_empleado) for id_empleado in ids_encontrados]
+
+
+class RegistroProyectos(Registro):
+    def obtener_id(self, proyecto):
+        return proyecto.id_proyecto
+
+    def obtener_nombre(self, proyecto):
+        return proyecto.nombre_proyecto
+
+
+# ================================
+# BÚSQUEDA POR NOMBRE
+# ================================
+
+def normalizar_texto(texto):
+    # Minúsculas y sin tildes: "José Núñez" y "jose nunez" se buscan igual
+    descompuesto = unicodedata.normalize("NFKD", texto.lower())
+    return "".join(caracter for caracter in descompuesto if not unicodedata.combining(caracter))
+
+
+def obtener_trigramas(palabra):
+    rellena = f" {palabra} "
+    return {rellena[posicion:posicion + 3] for posicion in range(len(rellena) - 2)}
+
+
+class PalabrasOrdenadas:
+    # Lista ordenada en bloques: un alta solo inserta en su bloque
+    tamano_bloque = 512
+
+    def __init__(self, palabras=()):
+        ordenadas = sorted(palabras)
+        self.bloques = [ordenadas[desde:desde + self.tamano_bloque]
+                        for desde in range(0, len(ordenadas), self.tamano_bloque)]
+        # Última palabra de cada bloque, para ubicar el bloque por búsqueda binaria
+        self.maximos = [bloque[-1] for bloque in self.bloques]
+
+    def __len__(self):
+        return sum(len(bloque) for bloque in self.bloques)
+
+    def __iter__(self):
+        for bloque in self.bloques:
+            yield from bloque
+
+    def agregar(self, palabra):
+        if not self.bloques:
+            self.bloques.append([palabra])
+            self.maximos.append(palabra)
+            return
+        posicion_bloque = min(bisect.bisect_left(self.maximos, palabra), len(self.bloques) - 1)
+        bloque = self.bloques[posicion_bloque]
+        bisect.insort(bloque, palabra)
+        self.maximos[posicion_bloque] = bloque[-1]
+        if len(bloque) > 2 * self.tamano_bloque:
+            mitad = bloque[self.tamano_bloque:]
+            del bloque[self.tamano_bloque:]
+            self.bloques.insert(posicion_bloque + 1, mitad)
+            self.maximos[posicion_bloque] = bloque[-1]
+            self.maximos.insert(posicion_bloque + 1, mitad[-1])
+
+    def desde(self, palabra):
+        # Recorre en orden las palabras mayores o iguales a palabra
+        posicion_bloque = bisect.bisect_left(self.maximos, palabra)
+        if posicion_bloque < len(self.bloques):
+            bloque = self.bloques[posicion_bloque]
+            yield from itertools.islice(bloque, bisect.bisect_left(bloque, palabra), None)
+            for bloque in itertools.islice(self.bloques, posicion_bloque + 1, None):
+                yield from bloque
+
+
+class IndiceNombres:
+    # Índice invertido de palabras a IDs: prefijos por búsqueda binaria, errores de tipeo por trigramas
+    similitud_minima = 0.5
+
+    def __init__(self):
+        self.ids_por_palabra = {}
+        self.palabras_ordenadas = PalabrasOrdenadas()
+        self.palabras_por_trigrama = {}
+        # Conjuntos de IDs por palabra para las consultas de varias palabras
+        self.conjuntos_por_palabra = {}
+
+    def agregar(self, id_elemento, nombre):
+        for palabra in set(normalizar_texto(nombre).split()):
+            ids_palabra = self.ids_por_palabra.get(palabra)
+            if ids_palabra is None:
+                self.ids_por_palabra[palabra] = [id_elemento]
+                self.conjuntos_por_palabra[palabra] = {id_elemento}
+                self.palabras_ordenadas.agregar(palabra)
+                self.indexar_trigramas(palabra)
+            else:
+                ids_palabra.append(id_elemento)
+                self.conjuntos_por_palabra[palabra].add(id_elemento)
+
+    def agregar_varios(self, pares):
+        # Carga inicial: las palabras nuevas se ordenan una sola vez al final
+        palabras_nuevas = []
+        for id_elemento, nombre in pares:
+            for palabra in set(normalizar_texto(nombre).split()):
+                ids_palabra = self.ids_por_palabra.get(palabra)
+                if ids_palabra is None:
+                    self.ids_por_palabra[palabra] = [id_elemento]
+                    self.conjuntos_por_palabra[palabra] = {id_elemento}
+                    palabras_nuevas.append(palabra)
+                else:
+                    ids_palabra.append(id_elemento)
+                    self.conjuntos_por_palabra[palabra].add(id_elemento)
+        for palabra in palabras_nuevas:
+            self.indexar_trigramas(palabra)
+        self.palabras_ordenadas = PalabrasOrdenadas(itertools.chain(self.palabras_ordenadas, palabras_nuevas))
+
+    def indexar_trigramas(self, palabra):
+        # Las palabras solo numéricas no se indexan: no tiene sentido buscarlas por parecido
+        if palabra.isdigit():
+            return
+        for trigrama in obtener_trigramas(palabra):
+            self.palabras_por_trigrama.setdefault(trigrama, []).append(palabra)
+
+    def palabras_con_prefijo(self, prefijo):
+        # La palabra exacta, si existe, queda primera por el orden alfabético
+        return itertools.takewhile(lambda palabra: palabra.startswith(prefijo),
+                                   self.palabras_ordenadas.desde(prefijo))
+
+    def palabras_parecidas(self, palabra):
+        # Coeficiente de Dice entre trigramas, de la más parecida a la menos
+        trigramas = obtener_trigramas(palabra)
+        comunes = collections.Counter()
+        for trigrama in trigramas:
+            comunes.update(self.palabras_por_trigrama.get(trigrama, ()))
+        similitudes = []
+        for candidata, cantidad_comunes in comunes.items():
+            similitud = 2 * cantidad_comunes / (len(trigramas) + len(obtener_trigramas(candidata)))
+            if similitud >= self.similitud_minima:
+                similitudes.append((-similitud, candidata))
+        similitudes.sort()
+        return [candidata for _, candidata in similitudes]
+
+    def palabras_candidatas(self, palabra):
+        palabras = self.palabras_con_prefijo(palabra)
+        primera = next(palabras, None)
+        if primera is not None:
+            return itertools.chain((primera,), palabras)
+        return self.palabras_parecidas(palabra) if len(palabra) >= 3 else []
+
+    def ids_candidatos(self, palabras):
+        for palabra in palabras:
+            yield from self.ids_por_palabra[palabra]
+
+    def buscar(self, consulta, cantidad=10):
+        # Orden: palabra exacta, prefijos en orden alfabético y palabras parecidas
+        palabras_consulta = normalizar_texto(consulta).split()
+        if not palabras_consulta:
+            return []
+
+        if len(palabras_consulta) == 1:
+            return self.primeros_distintos(self.ids_candidatos(self.palabras_candidatas(palabras_consulta[0])),
+                                           cantidad)
+
+        # Se recorre la palabra de la consulta con menos IDs y cada ID se
+        # verifica contra los conjuntos de las demás, sin construir intersecciones
+        candidatas_por_palabra = [list(self.palabras_candidatas(palabra)) for palabra in palabras_consulta]
+        candidatas_por_palabra.sort(key=lambda palabras: sum(len(self.ids_por_palabra[palabra])
+                                                             for palabra in palabras))
+        conjuntos_restantes = [[self.conjuntos_por_palabra[palabra] for palabra in palabras]
+                               for palabras in candidatas_por_palabra[1:]]
+
+        return self.primeros_distintos(
+            (id_elemento for id_elemento in self.ids_candidatos(candidatas_por_palabra[0])
+             if all(any(id_elemento in conjunto for conjunto in conjuntos) for conjuntos in conjuntos_restantes)),
+            cantidad)
+
+    def primeros_distintos(self, ids, cantidad):
+        # Un nombre con dos palabras que empiezan igual aparece dos veces
+        resultado = []
+        vistos = set()
+        for id_elemento in ids:
+            if id_elemento not in vistos:
+                vistos.add(id_elemento)
+                resultado.append(id_elemento)
+                if len(resultado) >= cantidad:
+                    break
+        return resultado
+
+
+# ================================
+# ÍNDICE DE HABILIDADES
+# ================================
+
+def obtener_perfil_empleado(empleado):
+    # (ID, tipo, habilidades, categoría, proyectos asignados, límite de proyectos)
+    habilidades, categoria = empleado.obtener_perfil_habilidades()
+    return (empleado.obtener_id_empleado(), type(empleado), habilidades, categoria,
+            empleado.obtener_cantidad_proyectos(), empleado.limite_proyectos)
+
+
+def obtener_clave_categoria(clase, categoria):
+    return (clase.nombre_categoria, normalizar_texto(categoria).strip()) if categoria else None
+
+
+def obtener_claves_habilidad(clase, habilidades, categoria):
+    # Claves normalizadas (categoría, valor) con las que se indexa un empleado
+    claves = {("habilidad", normalizar_texto(habilidad).strip()) for habilidad in habilidades}
+    claves.discard(("habilidad", ""))
+    if hasattr(clase, "tipo_empleado"):
+        claves.add(("tipo", normalizar_texto(clase.tipo_empleado)))
+    if categoria:
+        claves.add(obtener_clave_categoria(clase, categoria))
+    return claves
+
+
+def registrar_observador_debil(metodo):
+    # Observa los cambios de empleados sin mantener vivo al objeto del método
+    referencia = weakref.WeakMethod(metodo)
+    
+    def observador(empleado, campo):
+        metodo_vivo = referencia()
+        if metodo_vivo is not None:
+            metodo_vivo(empleado, campo)
+    Empleado.observadores_cambios.append(observador)
+    weakref.finalize(metodo.__self__, Empleado.observadores_cambios.remove, observador)
+
+
+class IndiceHabilidades:
+    # (categoría, valor) -> IDs de empleado; las consultas intersectan desde el conjunto más chico
+    def __init__(self):
+        self.ids_por_clave = {}
+        self.ids_sin_capacidad = set()
+        # Clave de categoría (o None) de cada empleado cuya categoría puede cambiar
+        self.claves_categoria = {}
+        registrar_observador_debil(self.actualizar_categoria)
+
+    def agregar(self, id_empleado, clase, habilidades, categoria, cantidad_proyectos, limite_proyectos):
+        for clave in obtener_claves_habilidad(clase, habilidades, categoria):
+            self.ids_por_clave.setdefault(clave, set()).add(id_empleado)
+        if clase.atributo_categoria is not None:
+            self.claves_categoria[id_empleado] = obtener_clave_categoria(clase, categoria)
+        self.actualizar_capacidad(id_empleado, cantidad_proyectos, limite_proyectos)
+
+    def actualizar_categoria(self, empleado, campo):
+        # Mueve el ID a la clave de su nueva categoría (nivel o especialidad)
+        if campo != empleado.atributo_categoria or empleado.id_empleado not in self.claves_categoria:
+            return
+        anterior = self.claves_categoria[empleado.id_empleado]
+        if anterior is not None:
+            self.ids_por_clave[anterior].discard(empleado.id_empleado)
+        nueva = obtener_clave_categoria(type(empleado), getattr(empleado, campo))
+        if nueva is not None:
+            self.ids_por_clave.setdefault(nueva, set()).add(empleado.id_empleado)
+        self.claves_categoria[empleado.id_empleado] = nueva
+
+    def actualizar_capacidad(self, id_empleado, cantidad_proyectos, limite_proyectos):
+        if cantidad_proyectos >= limite_proyectos:
+            self.ids_sin_capacidad.add(id_empleado)
+        else:
+            self.ids_sin_capacidad.discard(id_empleado)
+
+    def buscar(self, claves, solo_disponibles=False):
+        if not claves:
+            raise ValueError("Debe indicar al menos un criterio de búsqueda")
+        conjuntos = sorted((self.ids_por_clave.get((categoria, normalizar_texto(valor).strip()), SIN_PROYECTOS)
+                            for categoria, valor in claves), key=len)
+        ids_encontrados = conjuntos[0].intersection(*conjuntos[1:])
+        if solo_disponibles:
+            ids_encontrados -= self.ids_sin_capacidad
+        return sorted(ids_encontrados)
+
+
+# ================================
+# ESTADÍSTICAS DEL SISTEMA
+# ================================
+
+# Contadores enteros que el reporte paralelo transfiere y suma; el costo total
+# se transfiere aparte como los costos de cada proyecto
+CAMPOS_CONTADORES_ESTADISTICAS = ("total_empleados", "total_desarrolladores", "total_diseñadores",
+                                  "total_gerentes", "empleados_con_proyectos", "total_proyectos",
+                                  "proyectos_factibles", "proyectos_no_factibles", "proyectos_sin_empleados")
+
+# Registros que heredan los procesos del reporte paralelo al crearse con fork
+datos_reporte_paralelo = None
+
+
+class EstadisticasSistema:
+    # Contadores del reporte general, calculados en un solo recorrido
+    def __init__(self):
+        self.total_empleados = 0
+        self.total_desarrolladores = 0
+        self.total_diseñadores = 0
+        self.total_gerentes = 0
+        self.empleados_con_proyectos = 0
+        self.total_proyectos = 0
+        self.proyectos_factibles = 0
+        self.proyectos_no_factibles = 0
+        self.proyectos_sin_empleados = 0
+        self.costo_total_proyectos = 0.0
+    
+    def acumular_empleado(self, empleado):
+        self.total_empleados += 1
+        if isinstance(empleado, Desarrollador):
+            self.total_desarrolladores += 1
+        elif isinstance(empleado, Diseñador):
+            self.total_diseñadores += 1
+        elif isinstance(empleado, Gerente):
+            self.total_gerentes += 1
+        if empleado.obtener_cantidad_proyectos() > 0:
+            self.empleados_con_proyectos += 1
+    
+    def acumular_proyecto(self, proyecto):
+        # Retorna el costo acumulado para que el reporte paralelo lo transfiera
+        costo = proyecto.calcular_costo_total_proyecto()
+        self.total_proyectos += 1
+        self.costo_total_proyectos += costo
+        # Mismo criterio que verificar_factibilidad_proyecto, sin volver a calcular el costo
+        if proyecto.presupuesto_asignado - costo >= 0:
+            self.proyectos_factibles += 1
+        else:
+            self.proyectos_no_factibles += 1
+        if not proyecto.lista_empleados_asignados:
+            self.proyectos_sin_empleados += 1
+        return costo
+    
+    def obtener_contadores(self):
+        return tuple(getattr(self, campo) for campo in CAMPOS_CONTADORES_ESTADISTICAS)
+    
+    def combinar_parcial(self, contadores, costos):
+        # Los costos se suman uno por uno en el orden de los proyectos, igual
+        # que en el recorrido serial, para que el total sea idéntico
+        for campo, valor in zip(CAMPOS_CONTADORES_ESTADISTICAS, contadores):
+            setattr(self, campo, getattr(self, campo) + valor)
+        for costo in costos:
+            self.costo_total_proyectos += costo
+
+
+def calcular_estadisticas_sistema(empleados, proyectos):
+    estadisticas = EstadisticasSistema()
+    for empleado in empleados:
+        estadisticas.acumular_empleado(empleado)
+    for proyecto in proyectos:
+        estadisticas.acumular_proyecto(proyecto)
+    return estadisticas
+
+
+def calcular_fragmento_estadisticas(clase_fragmento, inicio, fin):
+    # Se ejecuta en un proceso hijo sobre los registros heredados; solo
+    # devuelve los contadores y los costos empaquetados como array de doubles
+    empleados, proyectos = datos_reporte_paralelo
+    estadisticas = EstadisticasSistema()
+    costos = array("d")
+    if clase_fragmento == "empleados":
+        for empleado in empleados[inicio:fin]:
+            estadisticas.acumular_empleado(empleado)
+    else:
+        for proyecto in proyectos[inicio:fin]:
+            costos.append(estadisticas.acumular_proyecto(proyecto))
+    return estadisticas.obtener_contadores(), costos.tobytes()
+
+
+def calcular_estadisticas_en_paralelo(empleados, proyectos, procesos, fragmentos_por_proceso=4):
+    # Los hijos heredan los registros por fork: solo viajan rangos y contadores
+    global datos_reporte_paralelo
+    if procesos <= 1 or "fork" not in multiprocessing.get_all_start_methods():
+        return calcular_estadisticas_sistema(empleados, proyectos)
+    
+    empleados = list(empleados)
+    proyectos = list(proyectos)
+    tareas = []
+    for clase_fragmento, cantidad in (("empleados", len(empleados)), ("proyectos", len(proyectos))):
+        tamano_fragmento = max(1, -(-cantidad // (procesos * fragmentos_por_proceso)))
+        tareas += [(clase_fragmento, inicio, inicio + tamano_fragmento)
+                   for inicio in range(0, cantidad, tamano_fragmento)]
+    
+    datos_reporte_paralelo = (empleados, proyectos)
+    # gc.freeze evita que el recolector de cada hijo recorra los objetos
+    # heredados y fuerce la copia de sus páginas de memoria
+    gc.freeze()
+    try:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=procesos,
+                                                    mp_context=multiprocessing.get_context("fork")) as ejecutor:
+            parciales = list(ejecutor.map(calcular_fragmento_estadisticas, *zip(*tareas)))
+    finally:
+        gc.unfreeze()
+        datos_reporte_paralelo = None
+    
+    estadisticas = EstadisticasSistema()
+    for contadores, costos in parciales:
+        estadisticas.combinar_parcial(contadores, array("d", costos))
+    return estadisticas
+
+
+# ================================
+# ASIGNACIÓN EN LOTE
+# ================================
+
+# Resultado de un par del lote; motivo es None si se aplicó
+ResultadoAsignacion = collections.namedtuple("ResultadoAsignacion",
+                                             ["id_empleado", "id_proyecto", "aplicada", "motivo"])
+
+
+def validar_asignaciones_en_lote(registro_empleados, registro_proyectos, pares):
+    # Mismas reglas que asignar_proyecto_empleado, contando también los pares ya aceptados del lote
+    resultados = []
+    aceptadas = []
+    proyectos_por_empleado = {}
+
+    for id_empleado, id_proyecto in pares:
+        empleado = registro_empleados.buscar_por_id(id_empleado)
+        proyecto = registro_proyectos.buscar_por_id(id_proyecto)
+        motivo = None
+
+        if empleado is None:
+            motivo = "No existe un empleado con ese ID"
+        elif proyecto is None:
+            motivo = "No existe un proyecto con ese ID"
+        else:
+            ids_en_lote = proyectos_por_empleado.get(empleado.id_empleado, ())
+            motivo = empleado.obtener_motivo_rechazo(proyecto, ids_en_lote)
+            if motivo is None:
+                proyectos_por_empleado[empleado.id_empleado] = ids_en_lote + (proyecto.id_proyecto,)
+                aceptadas.append((empleado, proyecto))
+
+        resultados.append(ResultadoAsignacion(id_empleado, id_proyecto, motivo is None, motivo))
+
+    return resultados, aceptadas
+
+
+def asignar_proyectos_en_lote(registro_empleados, registro_proyectos, pares, todo_o_nada=False):
+    # Aplica los pares válidos de una vez; si falla el guardado se deshacen los enlaces hechos
+    resultados, aceptadas = validar_asignaciones_en_lote(registro_empleados, registro_proyectos, pares)
+
+    if todo_o_nada and len(aceptadas) < len(resultados):
+        return [resultado._replace(aplicada=False, motivo="Lote cancelado por pares inválidos")
+                if resultado.aplicada else resultado for resultado in resultados]
+
+    # Los enlaces hechos son siempre un prefijo de aceptadas: basta contarlos
+    cantidad_enlazadas = 0
+    try:
+        for empleado, proyecto in aceptadas:
+            empleado.enlazar_proyecto(proyecto)
+            cantidad_enlazadas += 1
+        registro_empleados.registrar_asignaciones(aceptadas)
+    except Exception:
+        for empleado, proyecto in reversed(aceptadas[:cantidad_enlazadas]):
+            empleado.desenlazar_proyecto(proyecto)
+        # Los índices que ya contaron esos enlaces vuelven a la capacidad real
+        registro_empleados.indexar_asignaciones(aceptadas[:cantidad_enlazadas])
+        raise
+
+    return resultados
+
+
+# ================================
+# VALIDACIÓN DE FILAS DE EMPLEADOS
+# ================================
+
+# Acepta tanto el número del menú como el nombre del tipo
+TIPOS_EMPLEADO_IMPORTACION = {
+    "1": "1", "desarrollador": "1",
+    "2": "2", "diseñador": "2", "disenador": "2",
+    "3": "3", "gerente": "3",
+}
+
+
+def interpretar_fila(fila):
+    if isinstance(fila, UnicodeDecodeError):
+        raise ValueError(f"La línea no está en UTF-8 ({fila.reason})")
+    if isinstance(fila, str):
+        try:
+            fila = json.loads(fila)
+        except json.JSONDecodeError as error:
+            raise ValueError(f"JSON inválido: {error.msg}")
+        if not isinstance(fila, dict):
+            raise ValueError("Cada línea debe ser un objeto JSON")
+    return fila
+
+
+def separar_lista(valor):
+    if isinstance(valor, list):
+        return [str(elemento) for elemento in valor]
+    return str(valor or "").split(",")
+
+
+def construir_empleado_desde_fila(fila):
+    # Mismas reglas de validación que crear_nuevo_empleado
+    nombre_completo = str(fila.get("nombre_completo") or "").strip()
+    if len(nombre_completo) < 3:
+        raise ValueError("El nombre debe tener al menos 3 caracteres")
+
+    try:
+        salario_base = float(fila.get("salario_base"))
+    except (TypeError, ValueError):
+        raise ValueError("El salario debe ser un valor numérico válido")
+    if not salario_base > 0:
+        raise ValueError("El salario debe ser un valor positivo")
+
+    tipo_empleado = TIPOS_EMPLEADO_IMPORTACION.get(str(fila.get("tipo_empleado") or "").strip().lower())
+    if tipo_empleado is None:
+        raise ValueError("Tipo de empleado no válido")
+
+    if tipo_empleado == "1":
+        lenguajes = separar_lista(fila.get("lenguajes_programacion"))
+        nivel_experiencia = str(fila.get("nivel_experiencia") or "").strip()
+        return Desarrollador(nombre_completo, salario_base, lenguajes, nivel_experiencia)
+    elif tipo_empleado == "2":
+        herramientas = separar_lista(fila.get("herramientas_diseno"))
+        especialidad = str(fila.get("especialidad_diseno") or "").strip()
+        return Diseñador(nombre_completo, salario_base, herramientas, especialidad)
+    else:
+        departamento = str(fila.get("departamento_gerencia") or "").strip()
+        return Gerente(nombre_completo, salario_base, departamento)
@@ -0,0 +1,1164 @@
+# ================================
+# PERSISTENCIA DEL SISTEMA DE RRHH Y PROYECTOS
+# ================================
+
+# Almacenes en SQLite, instantánea binaria y diario de eventos de los registros del modelo
+
+import abc
+import heapq
+import json
+import mmap
+import os
+import sqlite3
+import struct
+import sys
+import threading
+from array import array
+
+from modelo import (Desarrollador, Diseñador, Empleado, Gerente, Proyecto, Registro, RegistroEmpleados,
+                    RegistroProyectos, obtener_perfil_empleado)
+
+
+# ================================
+# PERSISTENCIA EN SQLITE
+# ================================
+
+ESQUEMA_SQLITE = """
+CREATE TABLE IF NOT EXISTS empleados (
+    id_empleado INTEGER PRIMARY KEY,
+    tipo_empleado TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_empleados_tipo ON empleados (tipo_empleado);
+
+CREATE TABLE IF NOT EXISTS desarrolladores (
+    id_empleado INTEGER PRIMARY KEY REFERENCES empleados (id_empleado),
+    nombre_completo TEXT NOT NULL,
+    salario_base REAL NOT NULL,
+    activo INTEGER NOT NULL,
+    lenguajes_programacion TEXT NOT NULL,
+    nivel_experiencia TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS disenadores (
+    id_empleado INTEGER PRIMARY KEY REFERENCES empleados (id_empleado),
+    nombre_completo TEXT NOT NULL,
+    salario_base REAL NOT NULL,
+    activo INTEGER NOT NULL,
+    herramientas_diseno TEXT NOT NULL,
+    especialidad_diseno TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS gerentes (
+    id_empleado INTEGER PRIMARY KEY REFERENCES empleados (id_empleado),
+    nombre_completo TEXT NOT NULL,
+    salario_base REAL NOT NULL,
+    activo INTEGER NOT NULL,
+    departamento_gerencia TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS proyectos (
+    id_proyecto INTEGER PRIMARY KEY,
+    nombre_proyecto TEXT NOT NULL,
+    presupuesto_asignado REAL NOT NULL,
+    estado_proyecto TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_proyectos_nombre ON proyectos (nombre_proyecto);
+
+CREATE TABLE IF NOT EXISTS asignaciones (
+    id_empleado INTEGER NOT NULL REFERENCES empleados (id_empleado),
+    id_proyecto INTEGER NOT NULL REFERENCES proyectos (id_proyecto),
+    PRIMARY KEY (id_empleado, id_proyecto)
+);
+CREATE INDEX IF NOT EXISTS idx_asignaciones_proyecto ON asignaciones (id_proyecto);
+"""
+
+# tipo_empleado -> (clase, tabla, columnas propias en el orden del constructor, columnas guardadas como JSON)
+TABLAS_POR_TIPO_EMPLEADO = {
+    "Desarrollador": (Desarrollador, "desarrolladores",
+                      ("lenguajes_programacion", "nivel_experiencia"), ("lenguajes_programacion",)),
+    "Diseñador": (Diseñador, "disenadores",
+                  ("herramientas_diseno", "especialidad_diseno"), ("herramientas_diseno",)),
+    "Gerente": (Gerente, "gerentes", ("departamento_gerencia",), ()),
+}
+
+
+class AlmacenSQLite:
+    # SQLite en modo WAL; cada objeto se carga al pedirlo junto con lo asignado a él
+    TAMANO_LOTE_CONSULTA = 500
+
+    def __init__(self, ruta_base_datos):
+        # El servicio HTTP usa la conexión desde su hilo de operaciones; el
+        # acceso sigue siendo de un hilo por vez
+        self.conexion = sqlite3.connect(ruta_base_datos, check_same_thread=False)
+        self.conexion.execute("PRAGMA journal_mode=WAL")
+        self.conexion.execute("PRAGMA synchronous=NORMAL")
+        self.conexion.execute("PRAGMA foreign_keys=ON")
+        self.conexion.executescript(ESQUEMA_SQLITE)
+        self.empleados_cargados = {}
+        self.proyectos_cargados = {}
+        # Última (posición, ID) pedida por tabla, para recorrer por índice sin OFFSET
+        self.ultimas_posiciones = {}
+        self.actualizar_contadores()
+        Empleado.observadores_cambios.append(self.guardar_cambio_empleado)
+
+    def actualizar_contadores(self):
+        # Los IDs nuevos continúan después de los ya guardados
+        (maximo_empleado,) = self.conexion.execute(
+            "SELECT COALESCE(MAX(id_empleado), 0) FROM empleados").fetchone()
+        (maximo_proyecto,) = self.conexion.execute(
+            "SELECT COALESCE(MAX(id_proyecto), 0) FROM proyectos").fetchone()
+        Empleado.asignador_ids.avanzar_hasta(maximo_empleado + 1)
+        Proyecto.asignador_ids.avanzar_hasta(maximo_proyecto + 1)
+
+    def cerrar(self):
+        Empleado.observadores_cambios.remove(self.guardar_cambio_empleado)
+        self.conexion.close()
+
+    def consultar_por_lotes(self, consulta, ids):
+        # Ejecuta una consulta con "IN ({marcadores})" en lotes de IDs
+        ids = list(ids)
+        for inicio in range(0, len(ids), self.TAMANO_LOTE_CONSULTA):
+            lote = ids[inicio:inicio + self.TAMANO_LOTE_CONSULTA]
+            marcadores = ", ".join("?" * len(lote))
+            yield from self.conexion.execute(consulta.format(marcadores=marcadores), lote)
+
+    # ---------- Escritura (una transacción por lote) ----------
+
+    def guardar_empleados(self, empleados):
+        filas_empleados = []
+        filas_por_tabla = {}
+        for empleado in empleados:
+            if empleado.obtener_id_empleado() in self.empleados_cargados:
+                raise ValueError(f"Ya existe un registro con ID {empleado.obtener_id_empleado()}")
+            tipo_empleado = getattr(empleado, "tipo_empleado", None)
+            if tipo_empleado not in TABLAS_POR_TIPO_EMPLEADO:
+                raise ValueError(f"Tipo de empleado no persistible: {tipo_empleado}")
+            _, tabla, columnas, columnas_json = TABLAS_POR_TIPO_EMPLEADO[tipo_empleado]
+            fila = [empleado.obtener_id_empleado(), empleado.nombre_completo,
+                    empleado.salario_base, int(empleado.activo)]
+            for columna in columnas:
+                valor = getattr(empleado, columna)
+                fila.append(json.dumps(valor) if columna in columnas_json else valor)
+            filas_empleados.append((empleado.obtener_id_empleado(), tipo_empleado))
+            filas_por_tabla.setdefault(tabla, (columnas, []))[1].append(fila)
+
+        try:
+            with self.conexion:
+                self.conexion.executemany(
+                    "INSERT INTO empleados (id_empleado, tipo_empleado) VALUES (?, ?)", filas_empleados)
+                for tabla, (columnas, filas) in filas_por_tabla.items():
+                    nombres = ", ".join(("id_empleado", "nombre_completo", "salario_base", "activo") + columnas)
+                    marcadores = ", ".join("?" * (4 + len(columnas)))
+                    self.conexion.executemany(f"INSERT INTO {tabla} ({nombres}) VALUES ({marcadores})", filas)
+        except sqlite3.IntegrityError as error:
+            raise ValueError(f"No se pudo guardar el lote de empleados: {error}")
+
+        self.ultimas_posiciones.pop("empleados", None)
+        for empleado in empleados:
+            self.empleados_cargados[empleado.obtener_id_empleado()] = empleado
+
+    def guardar_cambio_empleado(self, empleado, campo):
+        # Los empleados que se están construyendo o leyendo, o que son de otro
+        # almacén, todavía no están en empleados_cargados y se ignoran
+        if self.empleados_cargados.get(empleado.id_empleado) is not empleado:
+            return
+        _, tabla, _, _ = TABLAS_POR_TIPO_EMPLEADO[empleado.tipo_empleado]
+        valor = getattr(empleado, campo)
+        with self.conexion:
+            self.conexion.execute(f"UPDATE {tabla} SET {campo} = ? WHERE id_empleado = ?",
+                                  (int(valor) if campo == "activo" else valor, empleado.id_empleado))
+
+    def guardar_proyectos(self, proyectos):
+        for proyecto in proyectos:
+            if proyecto.id_proyecto in self.proyectos_cargados:
+                raise ValueError(f"Ya existe un registro con ID {proyecto.id_proyecto}")
+        try:
+            with self.conexion:
+                self.conexion.executemany(
+                    "INSERT INTO proyectos (id_proyecto, nombre_proyecto, presupuesto_asignado, estado_proyecto) "
+                    "VALUES (?, ?, ?, ?)",
+                    [(proyecto.id_proyecto, proyecto.nombre_proyecto, proyecto.presupuesto_asignado,
+                      proyecto.estado_proyecto) for proyecto in proyectos])
+        except sqlite3.IntegrityError as error:
+            raise ValueError(f"No se pudo guardar el lote de proyectos: {error}")
+
+        self.ultimas_posiciones.pop("proyectos", None)
+        for proyecto in proyectos:
+            self.proyectos_cargados[proyecto.id_proyecto] = proyecto
+
+    def guardar_asignaciones(self, asignaciones):
+        with self.conexion:
+            self.conexion.executemany(
+                "INSERT INTO asignaciones (id_empleado, id_proyecto) VALUES (?, ?)",
+                [(empleado.obtener_id_empleado(), proyecto.id_proyecto) for empleado, proyecto in asignaciones])
+
+    # ---------- Lectura perezosa ----------
+
+    def contar_empleados(self):
+        return self.conexion.execute("SELECT COUNT(*) FROM empleados").fetchone()[0]
+
+    def contar_proyectos(self):
+        return self.conexion.execute("SELECT COUNT(*) FROM proyectos").fetchone()[0]
+
+    def ids_empleados(self):
+        for (id_empleado,) in self.conexion.execute("SELECT id_empleado FROM empleados ORDER BY id_empleado"):
+            yield id_empleado
+
+    def ids_proyectos(self):
+        for (id_proyecto,) in self.conexion.execute("SELECT id_proyecto FROM proyectos ORDER BY id_proyecto"):
+            yield id_proyecto
+
+    def id_en_posicion(self, tabla, columna, posicion):
+        # Recorrido secuencial: se sigue desde el último ID por clave primaria, sin OFFSET
+        anterior = self.ultimas_posiciones.get(tabla)
+        if anterior is not None and anterior[0] == posicion - 1:
+            fila = self.conexion.execute(f"SELECT {columna} FROM {tabla} WHERE {columna} > ? "
+                                         f"ORDER BY {columna} LIMIT 1", (anterior[1],)).fetchone()
+        else:
+            fila = self.conexion.execute(f"SELECT {columna} FROM {tabla} ORDER BY {columna} LIMIT 1 OFFSET ?",
+                                         (posicion,)).fetchone()
+        if fila is None:
+            return None
+        self.ultimas_posiciones[tabla] = (posicion, fila[0])
+        return fila[0]
+
+    def id_empleado_en_posicion(self, posicion):
+        return self.id_en_posicion("empleados", "id_empleado", posicion)
+
+    def id_proyecto_en_posicion(self, posicion):
+        return self.id_en_posicion("proyectos", "id_proyecto", posicion)
+
+    def nombres_empleados(self):
+        # Pares (ID, nombre) sin materializar los empleados
+        consulta = " UNION ALL ".join(f"SELECT id_empleado, nombre_completo FROM {tabla}"
+                                      for _, tabla, _, _ in TABLAS_POR_TIPO_EMPLEADO.values())
+        yield from self.conexion.execute(consulta + " ORDER BY id_empleado")
+
+    def nombres_proyectos(self):
+        yield from self.conexion.execute("SELECT id_proyecto, nombre_proyecto FROM proyectos ORDER BY id_proyecto")
+
+    def perfiles_empleados(self):
+        # Perfiles para el índice de habilidades, con la cantidad de proyectos contada en SQL
+        for clase, tabla, columnas, columnas_json in TABLAS_POR_TIPO_EMPLEADO.values():
+            consulta = (f"SELECT e.id_empleado, {', '.join(columnas)}, "
+                        f"(SELECT COUNT(*) FROM asignaciones a WHERE a.id_empleado = e.id_empleado) "
+                        f"FROM {tabla} e")
+            for id_empleado, *valores, cantidad_proyectos in self.conexion.execute(consulta):
+                empleado = self.empleados_cargados.get(id_empleado)
+                if empleado is not None:
+                    yield obtener_perfil_empleado(empleado)
+                    continue
+                habilidades, categoria = [], None
+                for columna, valor in zip(columnas, valores):
+                    if columna in columnas_json:
+                        habilidades = json.loads(valor)
+                    else:
+                        categoria = valor
+                yield id_empleado, clase, habilidades, categoria, cantidad_proyectos, clase.limite_proyectos
+
+    def ids_empleados_por_tipo(self, tipo_empleado):
+        consulta = "SELECT id_empleado FROM empleados WHERE tipo_empleado = ? ORDER BY id_empleado"
+        return [id_empleado for (id_empleado,) in self.conexion.execute(consulta, (tipo_empleado,))]
+
+    def ids_proyectos_por_nombre(self, nombre_proyecto):
+        consulta = "SELECT id_proyecto FROM proyectos WHERE nombre_proyecto = ? ORDER BY id_proyecto"
+        return [id_proyecto for (id_proyecto,) in self.conexion.execute(consulta, (nombre_proyecto,))]
+
+    def cargar_empleado(self, id_empleado):
+        if id_empleado not in self.empleados_cargados:
+            self.cargar_componente(ids_empleados=[id_empleado])
+        return self.empleados_cargados.get(id_empleado)
+
+    def cargar_proyecto(self, id_proyecto):
+        if id_proyecto not in self.proyectos_cargados:
+            self.cargar_componente(ids_proyectos=[id_proyecto])
+        return self.proyectos_cargados.get(id_proyecto)
+
+    def leer_empleados(self, ids_empleados):
+        nuevos_empleados = {}
+        for clase, tabla, columnas, columnas_json in TABLAS_POR_TIPO_EMPLEADO.values():
+            nombres = ", ".join(("id_empleado", "nombre_completo", "salario_base", "activo") + columnas)
+            consulta = f"SELECT {nombres} FROM {tabla} WHERE id_empleado IN ({{marcadores}})"
+            for id_empleado, nombre_completo, salario_base, activo, *valores in self.consultar_por_lotes(
+                    consulta, ids_empleados):
+                datos = [json.loads(valor) if columna in columnas_json else valor
+                         for columna, valor in zip(columnas, valores)]
+                empleado = clase(nombre_completo, salario_base, *datos, id_empleado=id_empleado)
+                empleado.activo = bool(activo)
+                nuevos_empleados[id_empleado] = empleado
+        return nuevos_empleados
+
+    def leer_proyectos(self, ids_proyectos):
+        consulta = ("SELECT id_proyecto, nombre_proyecto, presupuesto_asignado, estado_proyecto "
+                    "FROM proyectos WHERE id_proyecto IN ({marcadores})")
+        nuevos_proyectos = {}
+        for id_proyecto, nombre_proyecto, presupuesto_asignado, estado_proyecto in self.consultar_por_lotes(
+                consulta, ids_proyectos):
+            proyecto = Proyecto(nombre_proyecto, presupuesto_asignado, id_proyecto=id_proyecto)
+            proyecto.estado_proyecto = sys.intern(estado_proyecto)
+            nuevos_proyectos[id_proyecto] = proyecto
+        return nuevos_proyectos
+
+    def cargar_componente(self, ids_empleados=(), ids_proyectos=()):
+        # Carga los registros pedidos y todos los conectados por asignaciones
+        nuevos_empleados = {}
+        nuevos_proyectos = {}
+        empleados_pendientes = {i for i in ids_empleados if i not in self.empleados_cargados}
+        proyectos_pendientes = {i for i in ids_proyectos if i not in self.proyectos_cargados}
+
+        while empleados_pendientes or proyectos_pendientes:
+            if empleados_pendientes:
+                nuevos_empleados.update(self.leer_empleados(empleados_pendientes))
+                consulta = "SELECT id_proyecto FROM asignaciones WHERE id_empleado IN ({marcadores})"
+                for (id_proyecto,) in self.consultar_por_lotes(consulta, empleados_pendientes):
+                    if id_proyecto not in self.proyectos_cargados and id_proyecto not in nuevos_proyectos:
+                        proyectos_pendientes.add(id_proyecto)
+                empleados_pendientes = set()
+            if proyectos_pendientes:
+                nuevos_proyectos.update(self.leer_proyectos(proyectos_pendientes))
+                consulta = "SELECT id_empleado FROM asignaciones WHERE id_proyecto IN ({marcadores})"
+                for (id_empleado,) in self.consultar_por_lotes(consulta, proyectos_pendientes):
+                    if id_empleado not in self.empleados_cargados and id_empleado not in nuevos_empleados:
+                        empleados_pendientes.add(id_empleado)
+                proyectos_pendientes = set()
+
+        # Enlaza las asignaciones en el mismo orden en que se hicieron
+        consulta = "SELECT rowid, id_empleado, id_proyecto FROM asignaciones WHERE id_empleado IN ({marcadores})"
+        for _, id_empleado, id_proyecto in sorted(self.consultar_por_lotes(consulta, nuevos_empleados)):
+            empleado = nuevos_empleados[id_empleado]
+            proyecto = nuevos_proyectos[id_proyecto]
+            empleado.enlazar_proyecto(proyecto)
+
+        self.empleados_cargados.update(nuevos_empleados)
+        self.proyectos_cargados.update(nuevos_proyectos)
+
+
+class RegistroPersistente(Registro):
+    # Registro respaldado por un AlmacenSQLite: agrega con escritura en lote
+    # y materializa cada registro la primera vez que se consulta
+    def __init__(self, almacen):
+        super().__init__()
+        self.almacen = almacen
+
+    @abc.abstractmethod
+    def guardar_en_almacen(self, elementos):
+        pass
+
+    @abc.abstractmethod
+    def cargar_de_almacen(self, id_elemento):
+        pass
+
+    @abc.abstractmethod
+    def ids_en_almacen(self):
+        pass
+
+    @abc.abstractmethod
+    def id_en_posicion(self, posicion):
+        pass
+
+    def agregar(self, elemento):
+        self.guardar_en_almacen([elemento])
+        self.indexar([elemento])
+        return self
+
+    def extender(self, elementos):
+        elementos = list(elementos)
+        self.guardar_en_almacen(elementos)
+        self.indexar(elementos)
+        return self
+
+    def buscar_por_id(self, id_elemento):
+        return self.cargar_de_almacen(id_elemento)
+
+    def registrar_asignaciones(self, asignaciones):
+        # Un solo lote en el almacén: una transacción en SQLite, un evento en el diario
+        self.almacen.guardar_asignaciones(asignaciones)
+        self.indexar_asignaciones(asignaciones)
+
+    def __iter__(self):
+        for id_elemento in self.ids_en_almacen():
+            yield self.cargar_de_almacen(id_elemento)
+
+    def __getitem__(self, posicion):
+        # El almacén ubica el ID por su posición sin armar la lista de todos los IDs
+        if posicion < 0:
+            posicion += len(self)
+        id_elemento = self.id_en_posicion(posicion) if posicion >= 0 else None
+        if id_elemento is None:
+            raise IndexError("posición fuera del registro")
+        return self.cargar_de_almacen(id_elemento)
+
+    def __contains__(self, elemento):
+        return self.cargar_de_almacen(self.obtener_id(elemento)) is elemento
+
+
+class RegistroEmpleadosPersistente(RegistroPersistente, RegistroEmpleados):
+    def guardar_en_almacen(self, empleados):
+        self.almacen.guardar_empleados(empleados)
+
+    def cargar_de_almacen(self, id_empleado):
+        return self.almacen.cargar_empleado(id_empleado)
+
+    def ids_en_almacen(self):
+        return self.almacen.ids_empleados()
+
+    def id_en_posicion(self, posicion):
+        return self.almacen.id_empleado_en_posicion(posicion)
+
+    def nombres_registrados(self):
+        return self.almacen.nombres_empleados()
+
+    def perfiles_registrados(self):
+        return self.almacen.perfiles_empleados()
+
+    def empleados_de_tipo(self, tipo_empleado):
+        # SQLite responde con su índice por tipo sin cargar a los demás empleados
+        ids_empleados_por_tipo = getattr(self.almacen, "ids_empleados_por_tipo", None)
+        if ids_empleados_por_tipo is None:
+            return super().empleados_de_tipo(tipo_empleado)
+        tipo = next((tipo for tipo in TABLAS_POR_TIPO_EMPLEADO if tipo.lower() == tipo_empleado.lower()), None)
+        ids_empleados = ids_empleados_por_tipo(tipo) if tipo else []
+        return (self.cargar_de_almacen(id_empleado) for id_empleado in ids_empleados)
+
+    def __len__(self):
+        return self.almacen.contar_empleados()
+
+
+class RegistroProyectosPersistente(RegistroPersistente, RegistroProyectos):
+    def guardar_en_almacen(self, proyectos):
+        self.almacen.guardar_proyectos(proyectos)
+
+    def cargar_de_almacen(self, id_proyecto):
+        return self.almacen.cargar_proyecto(id_proyecto)
+
+    def ids_en_almacen(self):
+        return self.almacen.ids_proyectos()
+
+    def id_en_posicion(self, posicion):
+        return self.almacen.id_proyecto_en_posicion(posicion)
+
+    def nombres_registrados(self):
+        return self.almacen.nombres_proyectos()
+
+    def buscar_por_nombre(self, consulta, cantidad=10):
+        # Un nombre exacto se resuelve con el índice de SQLite, sin leer todos los nombres
+        ids_proyectos_por_nombre = getattr(self.almacen, "ids_proyectos_por_nombre", None)
+        ids_proyectos = ids_proyectos_por_nombre(consulta) if ids_proyectos_por_nombre else []
+        if ids_proyectos:
+            return [self.cargar_de_almacen(id_proyecto) for id_proyecto in ids_proyectos[:cantidad]]
+        return super().buscar_por_nombre(consulta, cantidad)
+
+    def __len__(self):
+        return self.almacen.contar_proyectos()
+
+
+# ================================
+# INSTANTÁNEA BINARIA
+# ================================
+
+TIPO_EMPLEADO_BASE = 0
+TIPO_DESARROLLADOR = 1
+TIPO_DISEÑADOR = 2
+TIPO_GERENTE = 3
+
+# cabecera | empleados | proyectos | IDs por empleado | IDs por proyecto | textos UTF-8 (little-endian)
+MAGICO_INSTANTANEA = b"RRHHSNAP"
+VERSION_INSTANTANEA = 1
+ESTRUCTURA_CABECERA = struct.Struct("<8sI4xqqqqqq")
+# id, salario_base, tipo, activo, nombre, campo_a, campo_b, (inicio, cantidad) de proyectos
+ESTRUCTURA_EMPLEADO = struct.Struct("<qdBB6xIIIIIIII")
+# id, presupuesto, nombre, estado, (inicio, cantidad) de empleados
+ESTRUCTURA_PROYECTO = struct.Struct("<qdIIIIII")
+ESTRUCTURA_ID = struct.Struct("<q")
+
+CLASES_POR_TIPO = {
+    TIPO_EMPLEADO_BASE: Empleado,
+    TIPO_DESARROLLADOR: Desarrollador,
+    TIPO_DISEÑADOR: Diseñador,
+    TIPO_GERENTE: Gerente,
+}
+
+
+def obtener_campos_instantanea(empleado):
+    # Retorna (tipo, campo_a, campo_b) con los datos propios de cada subclase
+    if isinstance(empleado, Desarrollador):
+        return TIPO_DESARROLLADOR, json.dumps(empleado.lenguajes_programacion), empleado.nivel_experiencia
+    elif isinstance(empleado, Diseñador):
+        return TIPO_DISEÑADOR, json.dumps(empleado.herramientas_diseno), empleado.especialidad_diseno
+    elif isinstance(empleado, Gerente):
+        return TIPO_GERENTE, empleado.departamento_gerencia, ""
+    return TIPO_EMPLEADO_BASE, "", ""
+
+
+def construir_empleado_desde_campos(tipo, id_empleado, nombre_completo, salario_base, activo, campo_a, campo_b):
+    # Inverso de obtener_campos_instantanea
+    clase = CLASES_POR_TIPO[tipo]
+    if clase is Desarrollador or clase is Diseñador:
+        empleado = clase(nombre_completo, salario_base, json.loads(campo_a), campo_b, id_empleado=id_empleado)
+    elif clase is Gerente:
+        empleado = clase(nombre_completo, salario_base, campo_a, id_empleado=id_empleado)
+    else:
+        empleado = clase(nombre_completo, salario_base, id_empleado=id_empleado)
+    empleado.activo = bool(activo)
+    return empleado
+
+
+def obtener_registro_empleado(empleado):
+    # Registro plano de la instantánea:
+    # (id, salario_base, tipo, activo, nombre, campo_a, campo_b, IDs de proyectos)
+    tipo, campo_a, campo_b = obtener_campos_instantanea(empleado)
+    return (empleado.obtener_id_empleado(), empleado.salario_base, tipo, empleado.activo,
+            empleado.nombre_completo, campo_a, campo_b,
+            [proyecto.id_proyecto for proyecto in empleado.lista_proyectos])
+
+
+def obtener_registro_proyecto(proyecto):
+    # (id, presupuesto, nombre, estado, IDs de empleados)
+    return (proyecto.id_proyecto, proyecto.presupuesto_asignado, proyecto.nombre_proyecto,
+            proyecto.estado_proyecto,
+            [empleado.obtener_id_empleado() for empleado in proyecto.lista_empleados_asignados])
+
+
+def guardar_instantanea(ruta_archivo, registro_empleados, registro_proyectos):
+    empleados = sorted(registro_empleados, key=Empleado.obtener_id_empleado)
+    proyectos = sorted(registro_proyectos, key=lambda proyecto: proyecto.id_proyecto)
+    # Se escribe en un archivo temporal y se reemplaza al final para no dejar instantáneas a medias
+    ruta_temporal = ruta_archivo + ".tmp"
+    escribir_archivo_instantanea(ruta_temporal, map(obtener_registro_empleado, empleados),
+                                 map(obtener_registro_proyecto, proyectos),
+                                 Empleado.asignador_ids.siguiente, Proyecto.asignador_ids.siguiente)
+    os.replace(ruta_temporal, ruta_archivo)
+    sincronizar_directorio(ruta_archivo)
+
+
+def escribir_archivo_instantanea(ruta_archivo, registros_empleados, registros_proyectos,
+                                 siguiente_empleado, siguiente_proyecto):
+    # Los registros llegan ordenados por ID; el archivo queda en disco (fsync) al volver
+    textos = bytearray()
+    posiciones_textos = {}
+
+    def agregar_texto(texto):
+        # Los textos repetidos (niveles, especialidades, estados) se guardan una sola vez
+        if texto not in posiciones_textos:
+            codificado = texto.encode("utf-8")
+            if len(textos) + len(codificado) > 0xFFFFFFFF:
+                raise ValueError("La instantánea supera el límite de 4 GB de textos")
+            posiciones_textos[texto] = (len(textos), len(codificado))
+            textos.extend(codificado)
+        return posiciones_textos[texto]
+
+    bloque_empleados = bytearray()
+    proyectos_por_empleado = array("q")
+    cantidad_empleados = 0
+    for id_empleado, salario_base, tipo, activo, nombre, campo_a, campo_b, ids_proyectos in registros_empleados:
+        bloque_empleados += ESTRUCTURA_EMPLEADO.pack(
+            id_empleado, salario_base, tipo, activo,
+            *agregar_texto(nombre), *agregar_texto(campo_a), *agregar_texto(campo_b),
+            len(proyectos_por_empleado), len(ids_proyectos))
+        proyectos_por_empleado.extend(ids_proyectos)
+        cantidad_empleados += 1
+
+    bloque_proyectos = bytearray()
+    empleados_por_proyecto = array("q")
+    cantidad_proyectos = 0
+    for id_proyecto, presupuesto_asignado, nombre, estado, ids_empleados in registros_proyectos:
+        bloque_proyectos += ESTRUCTURA_PROYECTO.pack(
+            id_proyecto, presupuesto_asignado, *agregar_texto(nombre), *agregar_texto(estado),
+            len(empleados_por_proyecto), len(ids_empleados))
+        empleados_por_proyecto.extend(ids_empleados)
+        cantidad_proyectos += 1
+
+    cabecera = ESTRUCTURA_CABECERA.pack(
+        MAGICO_INSTANTANEA, VERSION_INSTANTANEA, siguiente_empleado, siguiente_proyecto,
+        cantidad_empleados, cantidad_proyectos, len(proyectos_por_empleado), len(empleados_por_proyecto))
+
+    with open(ruta_archivo, "wb") as archivo:
+        archivo.write(cabecera)
+        archivo.write(bloque_empleados)
+        archivo.write(bloque_proyectos)
+        archivo.write(proyectos_por_empleado.tobytes())
+        archivo.write(empleados_por_proyecto.tobytes())
+        archivo.write(textos)
+        # El contenido tiene que estar en disco antes del reemplazo; si no, una
+        # caída puede dejar el nombre apuntando a un archivo vacío
+        archivo.flush()
+        os.fsync(archivo.fileno())
+
+
+def sincronizar_directorio(ruta_archivo):
+    # El cambio de nombre vive en el directorio; en Windows os.replace ya es durable
+    if os.name == "nt":
+        return
+    descriptor = os.open(os.path.dirname(os.path.abspath(ruta_archivo)), os.O_RDONLY)
+    try:
+        os.fsync(descriptor)
+    finally:
+        os.close(descriptor)
+
+
+class InstantaneaBinaria:
+    # Misma interfaz que AlmacenSQLite sobre un mmap; cada registro se decodifica al pedirlo
+    def __init__(self, ruta_archivo):
+        self.archivo = open(ruta_archivo, "rb")
+        self.datos = mmap.mmap(self.archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        (magico, version, contador_empleados, contador_proyectos, self.cantidad_empleados,
+         self.cantidad_proyectos, cantidad_proyectos_por_empleado,
+         cantidad_empleados_por_proyecto) = ESTRUCTURA_CABECERA.unpack_from(self.datos, 0)
+        if magico != MAGICO_INSTANTANEA or version != VERSION_INSTANTANEA:
+            raise ValueError(f"El archivo {ruta_archivo} no es una instantánea válida")
+
+        self.inicio_empleados = ESTRUCTURA_CABECERA.size
+        self.inicio_proyectos = self.inicio_empleados + self.cantidad_empleados * ESTRUCTURA_EMPLEADO.size
+        self.inicio_proyectos_por_empleado = (self.inicio_proyectos
+                                              + self.cantidad_proyectos * ESTRUCTURA_PROYECTO.size)
+        self.inicio_empleados_por_proyecto = (self.inicio_proyectos_por_empleado
+                                              + cantidad_proyectos_por_empleado * ESTRUCTURA_ID.size)
+        self.inicio_textos = (self.inicio_empleados_por_proyecto
+                              + cantidad_empleados_por_proyecto * ESTRUCTURA_ID.size)
+
+        Empleado.asignador_ids.avanzar_hasta(contador_empleados)
+        Proyecto.asignador_ids.avanzar_hasta(contador_proyectos)
+        self.empleados_cargados = {}
+        self.proyectos_cargados = {}
+        self.ids_empleados_nuevos = []
+        self.ids_proyectos_nuevos = []
+
+    def cerrar(self):
+        self.datos.close()
+        self.archivo.close()
+
+    def leer_texto(self, desplazamiento, longitud):
+        inicio = self.inicio_textos + desplazamiento
+        return self.datos[inicio:inicio + longitud].decode("utf-8")
+
+    def leer_ids(self, inicio_zona, inicio, cantidad):
+        desde = inicio_zona + inicio * ESTRUCTURA_ID.size
+        return array("q", self.datos[desde:desde + cantidad * ESTRUCTURA_ID.size])
+
+    def buscar_posicion(self, id_buscado, inicio_zona, estructura, cantidad):
+        # Búsqueda binaria sobre los registros ordenados por ID (el ID es el primer campo)
+        inferior, superior = 0, cantidad
+        while inferior < superior:
+            medio = (inferior + superior) // 2
+            (id_medio,) = ESTRUCTURA_ID.unpack_from(self.datos, inicio_zona + medio * estructura.size)
+            if id_medio < id_buscado:
+                inferior = medio + 1
+            else:
+                superior = medio
+        if inferior < cantidad:
+            (id_encontrado,) = ESTRUCTURA_ID.unpack_from(self.datos, inicio_zona + inferior * estructura.size)
+            if id_encontrado == id_buscado:
+                return inferior
+        return None
+
+    def decodificar_empleado(self, posicion):
+        (id_empleado, salario_base, tipo, activo, nombre_desde, nombre_largo, campo_a_desde, campo_a_largo,
+         campo_b_desde, campo_b_largo, inicio_proyectos, cantidad_proyectos) = ESTRUCTURA_EMPLEADO.unpack_from(
+            self.datos, self.inicio_empleados + posicion * ESTRUCTURA_EMPLEADO.size)
+        nombre_completo = self.leer_texto(nombre_desde, nombre_largo)
+        campo_a = self.leer_texto(campo_a_desde, campo_a_largo)
+        campo_b = self.leer_texto(campo_b_desde, campo_b_largo)
+        empleado = construir_empleado_desde_campos(tipo, id_empleado, nombre_completo, salario_base,
+                                                   activo, campo_a, campo_b)
+        ids_proyectos = self.leer_ids(self.inicio_proyectos_por_empleado, inicio_proyectos, cantidad_proyectos)
+        return empleado, ids_proyectos
+
+    def decodificar_proyecto(self, posicion):
+        (id_proyecto, presupuesto_asignado, nombre_desde, nombre_largo, estado_desde, estado_largo,
+         inicio_empleados, cantidad_empleados) = ESTRUCTURA_PROYECTO.unpack_from(
+            self.datos, self.inicio_proyectos + posicion * ESTRUCTURA_PROYECTO.size)
+        nombre_proyecto = self.leer_texto(nombre_desde, nombre_largo)
+        proyecto = Proyecto(nombre_proyecto, presupuesto_asignado, id_proyecto=id_proyecto)
+        proyecto.estado_proyecto = sys.intern(self.leer_texto(estado_desde, estado_largo))
+        ids_empleados = self.leer_ids(self.inicio_empleados_por_proyecto, inicio_empleados, cantidad_empleados)
+        return proyecto, ids_empleados
+
+    def registros_empleados(self):
+        # Registros planos del archivo (ver obtener_registro_empleado), sin construir objetos
+        for posicion in range(self.cantidad_empleados):
+            (id_empleado, salario_base, tipo, activo, nombre_desde, nombre_largo, campo_a_desde, campo_a_largo,
+             campo_b_desde, campo_b_largo, inicio_proyectos, cantidad_proyectos) = ESTRUCTURA_EMPLEADO.unpack_from(
+                self.datos, self.inicio_empleados + posicion * ESTRUCTURA_EMPLEADO.size)
+            yield (id_empleado, salario_base, tipo, activo, self.leer_texto(nombre_desde, nombre_largo),
+                   self.leer_texto(campo_a_desde, campo_a_largo), self.leer_texto(campo_b_desde, campo_b_largo),
+                   self.leer_ids(self.inicio_proyectos_por_empleado, inicio_proyectos, cantidad_proyectos))
+
+    def registros_proyectos(self):
+        for posicion in range(self.cantidad_proyectos):
+            (id_proyecto, presupuesto_asignado, nombre_desde, nombre_largo, estado_desde, estado_largo,
+             inicio_empleados, cantidad_empleados) = ESTRUCTURA_PROYECTO.unpack_from(
+                self.datos, self.inicio_proyectos + posicion * ESTRUCTURA_PROYECTO.size)
+            yield (id_proyecto, presupuesto_asignado, self.leer_texto(nombre_desde, nombre_largo),
+                   self.leer_texto(estado_desde, estado_largo),
+                   self.leer_ids(self.inicio_empleados_por_proyecto, inicio_empleados, cantidad_empleados))
+
+    def cargar_componente(self, ids_empleados=(), ids_proyectos=()):
+        # Decodifica los registros pedidos y todos los conectados por asignaciones
+        nuevos_empleados = {}
+        nuevos_proyectos = {}
+        pendientes = [("empleado", id_empleado) for id_empleado in ids_empleados]
+        pendientes += [("proyecto", id_proyecto) for id_proyecto in ids_proyectos]
+        while pendientes:
+            clase_registro, id_registro = pendientes.pop()
+            if clase_registro == "empleado":
+                if id_registro in self.empleados_cargados or id_registro in nuevos_empleados:
+                    continue
+                posicion = self.buscar_posicion(id_registro, self.inicio_empleados, ESTRUCTURA_EMPLEADO,
+                                                self.cantidad_empleados)
+                if posicion is None:
+                    continue
+                empleado, ids_proyectos_empleado = self.decodificar_empleado(posicion)
+                nuevos_empleados[id_registro] = (empleado, ids_proyectos_empleado)
+                pendientes += [("proyecto", id_proyecto) for id_proyecto in ids_proyectos_empleado]
+            else:
+                if id_registro in self.proyectos_cargados or id_registro in nuevos_proyectos:
+                    continue
+                posicion = self.buscar_posicion(id_registro, self.inicio_proyectos, ESTRUCTURA_PROYECTO,
+                                                self.cantidad_proyectos)
+                if posicion is None:
+                    continue
+                proyecto, ids_empleados_proyecto = self.decodificar_proyecto(posicion)
+                nuevos_proyectos[id_registro] = (proyecto, ids_empleados_proyecto)
+                pendientes += [("empleado", id_empleado) for id_empleado in ids_empleados_proyecto]
+
+        # Las listas se enlazan en el orden guardado en cada lado de la asignación
+        for empleado, ids_proyectos_empleado in nuevos_empleados.values():
+            empleado.lista_proyectos.extend(nuevos_proyectos[id_proyecto][0] for id_proyecto in ids_proyectos_empleado)
+            if ids_proyectos_empleado:
+                empleado.ids_proyectos_asignados = set(ids_proyectos_empleado)
+        for proyecto, ids_empleados_proyecto in nuevos_proyectos.values():
+            for id_empleado in ids_empleados_proyecto:
+                proyecto.agregar_empleado_proyecto(nuevos_empleados[id_empleado][0])
+
+        self.empleados_cargados.update((id_empleado, empleado) for id_empleado, (empleado, _)
+                                       in nuevos_empleados.items())
+        self.proyectos_cargados.update((id_proyecto, proyecto) for id_proyecto, (proyecto, _)
+                                       in nuevos_proyectos.items())
+
+    def cargar_empleado(self, id_empleado):
+        if id_empleado not in self.empleados_cargados:
+            self.cargar_componente(ids_empleados=[id_empleado])
+        return self.empleados_cargados.get(id_empleado)
+
+    def cargar_proyecto(self, id_proyecto):
+        if id_proyecto not in self.proyectos_cargados:
+            self.cargar_componente(ids_proyectos=[id_proyecto])
+        return self.proyectos_cargados.get(id_proyecto)
+
+    def ids_empleados(self):
+        for posicion in range(self.cantidad_empleados):
+            yield ESTRUCTURA_ID.unpack_from(self.datos, self.inicio_empleados + posicion * ESTRUCTURA_EMPLEADO.size)[0]
+        yield from self.ids_empleados_nuevos
+
+    def ids_proyectos(self):
+        for posicion in range(self.cantidad_proyectos):
+            yield ESTRUCTURA_ID.unpack_from(self.datos, self.inicio_proyectos + posicion * ESTRUCTURA_PROYECTO.size)[0]
+        yield from self.ids_proyectos_nuevos
+
+    def id_empleado_en_posicion(self, posicion):
+        # Los registros son de tamaño fijo: la posición da el desplazamiento
+        if posicion < self.cantidad_empleados:
+            return ESTRUCTURA_ID.unpack_from(self.datos, self.inicio_empleados + posicion * ESTRUCTURA_EMPLEADO.size)[0]
+        posicion -= self.cantidad_empleados
+        return self.ids_empleados_nuevos[posicion] if posicion < len(self.ids_empleados_nuevos) else None
+
+    def id_proyecto_en_posicion(self, posicion):
+        if posicion < self.cantidad_proyectos:
+            return ESTRUCTURA_ID.unpack_from(self.datos, self.inicio_proyectos + posicion * ESTRUCTURA_PROYECTO.size)[0]
+        posicion -= self.cantidad_proyectos
+        return self.ids_proyectos_nuevos[posicion] if posicion < len(self.ids_proyectos_nuevos) else None
+
+    def nombres_empleados(self):
+        # Solo decodifica el nombre de cada registro, sin construir el empleado
+        for posicion in range(self.cantidad_empleados):
+            campos = ESTRUCTURA_EMPLEADO.unpack_from(self.datos, self.inicio_empleados
+                                                     + posicion * ESTRUCTURA_EMPLEADO.size)
+            yield campos[0], self.leer_texto(campos[4], campos[5])
+        for id_empleado in self.ids_empleados_nuevos:
+            yield id_empleado, self.empleados_cargados[id_empleado].nombre_completo
+
+    def perfiles_empleados(self):
+        # Los empleados ya cargados pueden tener asignaciones posteriores a la instantánea
+        for posicion in range(self.cantidad_empleados):
+            (id_empleado, _, tipo, _, _, _, campo_a_desde, campo_a_largo, campo_b_desde, campo_b_largo,
+             _, cantidad_proyectos) = ESTRUCTURA_EMPLEADO.unpack_from(
+                self.datos, self.inicio_empleados + posicion * ESTRUCTURA_EMPLEADO.size)
+            empleado = self.empleados_cargados.get(id_empleado)
+            if empleado is not None:
+                yield obtener_perfil_empleado(empleado)
+                continue
+            clase = CLASES_POR_TIPO[tipo]
+            campo_a = self.leer_texto(campo_a_desde, campo_a_largo)
+            campo_b = self.leer_texto(campo_b_desde, campo_b_largo)
+            if clase is Desarrollador or clase is Diseñador:
+                habilidades, categoria = json.loads(campo_a), campo_b
+            else:
+                habilidades, categoria = [], campo_a
+            yield id_empleado, clase, habilidades, categoria, cantidad_proyectos, clase.limite_proyectos
+        for id_empleado in self.ids_empleados_nuevos:
+            yield obtener_perfil_empleado(self.empleados_cargados[id_empleado])
+
+    def nombres_proyectos(self):
+        for posicion in range(self.cantidad_proyectos):
+            campos = ESTRUCTURA_PROYECTO.unpack_from(self.datos, self.inicio_proyectos
+                                                     + posicion * ESTRUCTURA_PROYECTO.size)
+            yield campos[0], self.leer_texto(campos[2], campos[3])
+        for id_proyecto in self.ids_proyectos_nuevos:
+            yield id_proyecto, self.proyectos_cargados[id_proyecto].nombre_proyecto
+
+    def contar_empleados(self):
+        return self.cantidad_empleados + len(self.ids_empleados_nuevos)
+
+    def contar_proyectos(self):
+        return self.cantidad_proyectos + len(self.ids_proyectos_nuevos)
+
+    def guardar_empleados(self, empleados):
+        for empleado in empleados:
+            if self.cargar_empleado(empleado.obtener_id_empleado()) is not None:
+                raise ValueError(f"Ya existe un registro con ID {empleado.obtener_id_empleado()}")
+        for empleado in empleados:
+            self.empleados_cargados[empleado.obtener_id_empleado()] = empleado
+            self.ids_empleados_nuevos.append(empleado.obtener_id_empleado())
+
+    def guardar_proyectos(self, proyectos):
+        for proyecto in proyectos:
+            if self.cargar_proyecto(proyecto.id_proyecto) is not None:
+                raise ValueError(f"Ya existe un registro con ID {proyecto.id_proyecto}")
+        for proyecto in proyectos:
+            self.proyectos_cargados[proyecto.id_proyecto] = proyecto
+            self.ids_proyectos_nuevos.append(proyecto.id_proyecto)
+
+    def guardar_asignaciones(self, asignaciones):
+        # Las asignaciones ya quedan en los objetos en memoria y se escriben al guardar la instantánea
+        pass
+
+
+# ================================
+# DIARIO DE EVENTOS
+# ================================
+
+class DiarioEventos:
+    # Eventos JSON de solo anexado; un solo fsync confirma todo lo pendiente de varios hilos
+    def __init__(self, ruta_archivo):
+        self.ruta_archivo = ruta_archivo
+        self.archivo = open(ruta_archivo, "ab")
+        self.pendientes = []
+        self.eventos_registrados = 0
+        self.eventos_confirmados = 0
+        # Eventos en el archivo desde el último reinicio, escritos o pendientes
+        self.eventos_escritos = 0
+        self.escribiendo = False
+        self.error_escritura = None
+        self.condicion = threading.Condition()
+
+    def registrar(self, evento):
+        # Retorna el número del evento para esperar_confirmacion
+        linea = json.dumps(evento, ensure_ascii=False).encode("utf-8") + b"\n"
+        with self.condicion:
+            self.pendientes.append(linea)
+            self.eventos_registrados += 1
+            self.eventos_escritos += 1
+            return self.eventos_registrados
+
+    def esperar_confirmacion(self, numero):
+        while True:
+            with self.condicion:
+                while self.escribiendo and self.eventos_confirmados < numero and self.error_escritura is None:
+                    self.condicion.wait()
+                if self.error_escritura is not None:
+                    raise OSError(f"No se pudo escribir el diario: {self.error_escritura}")
+                if self.eventos_confirmados >= numero:
+                    return
+                lineas, self.pendientes = self.pendientes, []
+                hasta = self.eventos_registrados
+                self.escribiendo = True
+            # La escritura y el fsync van sin el bloqueo: mientras tanto otros
+            # hilos siguen registrando eventos para el grupo siguiente
+            try:
+                self.archivo.write(b"".join(lineas))
+                self.archivo.flush()
+                os.fsync(self.archivo.fileno())
+            except OSError as error:
+                # No se sabe qué parte llegó al disco: el diario deja de aceptar confirmaciones
+                with self.condicion:
+                    self.error_escritura = error
+                    self.escribiendo = False
+                    self.condicion.notify_all()
+                raise
+            with self.condicion:
+                self.eventos_confirmados = hasta
+                self.escribiendo = False
+                self.condicion.notify_all()
+
+    def confirmar(self):
+        with self.condicion:
+            numero = self.eventos_registrados
+        self.esperar_confirmacion(numero)
+
+    def marcar_corte(self):
+        # (bytes, eventos) del diario hasta ahora, todo ya en disco. El
+        # llamador impide que se registren eventos mientras tanto
+        self.confirmar()
+        with self.condicion:
+            while self.escribiendo:
+                self.condicion.wait()
+            return self.archivo.tell(), self.eventos_escritos
+
+    def descartar_hasta(self, corte):
+        # Lo posterior al corte reemplaza al diario de una vez; una caída nunca lo deja a medias
+        desplazamiento, eventos = corte
+        self.confirmar()
+        with self.condicion:
+            while self.escribiendo:
+                self.condicion.wait()
+            with open(self.ruta_archivo, "rb") as archivo:
+                archivo.seek(desplazamiento)
+                resto = archivo.read()
+            ruta_temporal = self.ruta_archivo + ".tmp"
+            with open(ruta_temporal, "wb") as archivo:
+                archivo.write(resto)
+                archivo.flush()
+                os.fsync(archivo.fileno())
+            self.archivo.close()
+            os.replace(ruta_temporal, self.ruta_archivo)
+            sincronizar_directorio(self.ruta_archivo)
+            self.archivo = open(self.ruta_archivo, "ab")
+            self.eventos_escritos -= eventos
+
+    def cerrar(self):
+        self.confirmar()
+        self.archivo.close()
+
+    @staticmethod
+    def leer_eventos(ruta_archivo):
+        # Una última línea incompleta (caída durante la escritura) se descarta
+        # y se recorta del archivo para que los nuevos eventos no queden detrás de ella
+        if not os.path.exists(ruta_archivo):
+            return
+        with open(ruta_archivo, "rb+") as archivo:
+            desplazamiento = 0
+            for numero_linea, linea in enumerate(archivo, start=1):
+                try:
+                    evento = json.loads(linea)
+                except ValueError:
+                    if archivo.read(1):
+                        raise ValueError(f"Diario dañado en la línea {numero_linea}")
+                    archivo.truncate(desplazamiento)
+                    return
+                if not linea.endswith(b"\n"):
+                    archivo.truncate(desplazamiento)
+                    return
+                desplazamiento += len(linea)
+                yield evento
+
+
+def combinar_registros(registros_archivo, registros_cargados):
+    # Mezcla por ID dos secuencias de registros ordenadas; el registro del
+    # objeto cargado reemplaza al del archivo, que puede estar desactualizado
+    ids_cargados = {registro[0] for registro in registros_cargados}
+    return heapq.merge((registro for registro in registros_archivo if registro[0] not in ids_cargados),
+                       registros_cargados, key=lambda registro: registro[0])
+
+
+def crear_evento_empleado(empleado):
+    tipo, campo_a, campo_b = obtener_campos_instantanea(empleado)
+    return {"evento": "crear_empleado", "id": empleado.obtener_id_empleado(), "tipo": tipo,
+            "nombre": empleado.nombre_completo, "salario": empleado.salario_base,
+            "activo": empleado.activo, "campo_a": campo_a, "campo_b": campo_b}
+
+
+def crear_evento_proyecto(proyecto):
+    return {"evento": "crear_proyecto", "id": proyecto.id_proyecto, "nombre": proyecto.nombre_proyecto,
+            "presupuesto": proyecto.presupuesto_asignado, "estado": proyecto.estado_proyecto}
+
+
+class AlmacenConDiario:
+    # Instantánea más diario; cada eventos_para_compactar eventos se compacta en segundo plano
+    def __init__(self, ruta_base, eventos_para_compactar=100000):
+        self.ruta_instantanea = ruta_base + ".instantanea"
+        self.ruta_diario = ruta_base + ".diario"
+        if not os.path.exists(self.ruta_instantanea):
+            guardar_instantanea(self.ruta_instantanea, [], [])
+        self.instantanea = InstantaneaBinaria(self.ruta_instantanea)
+        # Mientras se reproduce el diario los cambios no se vuelven a registrar
+        self.reproduciendo = False
+        self.reproducir_diario()
+        self.diario = DiarioEventos(self.ruta_diario)
+        self.eventos_para_compactar = eventos_para_compactar
+        # Lo toma el menú durante cada operación y la compactación mientras toma
+        # su corte y cuando reemplaza la instantánea
+        self.bloqueo_estado = threading.RLock()
+        self.hilo_compactacion = None
+        self.confirmaciones_diferidas = threading.local()
+        Empleado.observadores_cambios.append(self.guardar_cambio_empleado)
+
+    def reproducir_diario(self):
+        # La reproducción es idempotente: si el programa cayó después de
+        # compactar pero antes de vaciar el diario, los eventos repetidos se ignoran
+        self.reproduciendo = True
+        try:
+            for evento in DiarioEventos.leer_eventos(self.ruta_diario):
+                self.reproducir_evento(evento)
+        finally:
+            self.reproduciendo = False
+
+    def reproducir_evento(self, evento):
+        if evento["evento"] == "crear_empleado":
+            if self.instantanea.cargar_empleado(evento["id"]) is None:
+                self.instantanea.guardar_empleados([construir_empleado_desde_campos(
+                    evento["tipo"], evento["id"], evento["nombre"], evento["salario"],
+                    evento["activo"], evento["campo_a"], evento["campo_b"])])
+        elif evento["evento"] == "crear_proyecto":
+            if self.instantanea.cargar_proyecto(evento["id"]) is None:
+                proyecto = Proyecto(evento["nombre"], evento["presupuesto"], id_proyecto=evento["id"])
+                proyecto.estado_proyecto = sys.intern(evento["estado"])
+                self.instantanea.guardar_proyectos([proyecto])
+        elif evento["evento"] == "asignar":
+            self.reproducir_asignacion(evento["id_empleado"], evento["id_proyecto"])
+        elif evento["evento"] == "asignar_lote":
+            for id_empleado, id_proyecto in evento["pares"]:
+                self.reproducir_asignacion(id_empleado, id_proyecto)
+        elif evento["evento"] == "actualizar_empleado":
+            # Reaplicar un valor es idempotente
+            setattr(self.instantanea.cargar_empleado(evento["id"]), evento["campo"], evento["valor"])
+
+    def reproducir_asignacion(self, id_empleado, id_proyecto):
+        empleado = self.instantanea.cargar_empleado(id_empleado)
+        proyecto = self.instantanea.cargar_proyecto(id_proyecto)
+        if not empleado.tiene_proyecto(proyecto):
+            empleado.enlazar_proyecto(proyecto)
+
+    def cargar_empleado(self, id_empleado):
+        return self.instantanea.cargar_empleado(id_empleado)
+
+    def cargar_proyecto(self, id_proyecto):
+        return self.instantanea.cargar_proyecto(id_proyecto)
+
+    def ids_empleados(self):
+        return self.instantanea.ids_empleados()
+
+    def ids_proyectos(self):
+        return self.instantanea.ids_proyectos()
+
+    def id_empleado_en_posicion(self, posicion):
+        return self.instantanea.id_empleado_en_posicion(posicion)
+
+    def id_proyecto_en_posicion(self, posicion):
+        return self.instantanea.id_proyecto_en_posicion(posicion)
+
+    def nombres_empleados(self):
+        return self.instantanea.nombres_empleados()
+
+    def nombres_proyectos(self):
+        return self.instantanea.nombres_proyectos()
+
+    def perfiles_empleados(self):
+        return self.instantanea.perfiles_empleados()
+
+    def contar_empleados(self):
+        return self.instantanea.contar_empleados()
+
+    def contar_proyectos(self):
+        return self.instantanea.contar_proyectos()
+
+    def guardar_empleados(self, empleados):
+        self.instantanea.guardar_empleados(empleados)
+        numero = 0
+        for empleado in empleados:
+            numero = self.diario.registrar(crear_evento_empleado(empleado))
+        self.confirmar_evento(numero)
+
+    def guardar_proyectos(self, proyectos):
+        self.instantanea.guardar_proyectos(proyectos)
+        numero = 0
+        for proyecto in proyectos:
+            numero = self.diario.registrar(crear_evento_proyecto(proyecto))
+        self.confirmar_evento(numero)
+
+    def guardar_cambio_empleado(self, empleado, campo):
+        # Solo los empleados cargados de esta instantánea; los que se están
+        # construyendo o son de otro almacén se ignoran
+        if self.reproduciendo or self.instantanea.empleados_cargados.get(empleado.id_empleado) is not empleado:
+            return
+        numero = self.diario.registrar({"evento": "actualizar_empleado", "id": empleado.id_empleado,
+                                        "campo": campo, "valor": getattr(empleado, campo)})
+        self.confirmar_evento(numero)
+
+    def guardar_asignaciones(self, asignaciones):
+        numero = 0
+        if len(asignaciones) == 1:
+            empleado, proyecto = asignaciones[0]
+            numero = self.diario.registrar({"evento": "asignar", "id_empleado": empleado.obtener_id_empleado(),
+                                            "id_proyecto": proyecto.id_proyecto})
+        elif asignaciones:
+            # Un lote es una sola línea: si se corta al escribirla se descarta completo
+            numero = self.diario.registrar({"evento": "asignar_lote", "pares": [
+                [empleado.obtener_id_empleado(), proyecto.id_proyecto] for empleado, proyecto in asignaciones]})
+        self.confirmar_evento(numero)
+
+    def confirmar_evento(self, numero):
+        # Un guardar_* vuelve con sus eventos en disco, salvo dentro de
+        # ejecutar_con_confirmacion_diferida, que solo anota el último número
+        if getattr(self.confirmaciones_diferidas, "activas", False):
+            self.confirmaciones_diferidas.ultimo_evento = max(self.confirmaciones_diferidas.ultimo_evento, numero)
+        else:
+            self.diario.esperar_confirmacion(numero)
+        self.revisar_compactacion()
+
+    def ejecutar_con_confirmacion_diferida(self, funcion, *argumentos):
+        # (resultado, número de evento): el llamador espera su confirmación fuera de la sección exclusiva
+        self.confirmaciones_diferidas.activas = True
+        self.confirmaciones_diferidas.ultimo_evento = 0
+        try:
+            resultado = funcion(*argumentos)
+        finally:
+            self.confirmaciones_diferidas.activas = False
+        return resultado, self.confirmaciones_diferidas.ultimo_evento
+
+    def revisar_compactacion(self):
+        if self.diario.eventos_escritos < self.eventos_para_compactar:
+            return
+        if self.hilo_compactacion is None or not self.hilo_compactacion.is_alive():
+            self.hilo_compactacion = threading.Thread(target=self.compactar, daemon=True)
+            self.hilo_compactacion.start()
+
+    def compactar(self):
+        # Bajo bloqueo solo se toma el corte; la instantánea nueva se arma después sin él
+        with self.bloqueo_estado:
+            corte = self.diario.marcar_corte()
+            instantanea = self.instantanea
+            empleados_cargados = sorted(map(obtener_registro_empleado, instantanea.empleados_cargados.values()))
+            proyectos_cargados = sorted(map(obtener_registro_proyecto, instantanea.proyectos_cargados.values()))
+            contadores = (Empleado.asignador_ids.siguiente, Proyecto.asignador_ids.siguiente)
+            # Los IDs nuevos anteriores al corte quedan dentro del archivo nuevo
+            nuevos_al_corte = (len(instantanea.ids_empleados_nuevos), len(instantanea.ids_proyectos_nuevos))
+        
+        ruta_temporal = self.ruta_instantanea + ".tmp"
+        escribir_archivo_instantanea(ruta_temporal,
+                                     combinar_registros(instantanea.registros_empleados(), empleados_cargados),
+                                     combinar_registros(instantanea.registros_proyectos(), proyectos_cargados),
+                                     *contadores)
+        del empleados_cargados, proyectos_cargados
+        
+        with self.bloqueo_estado:
+            # La instantánea anterior se cierra antes de reemplazar el archivo
+            # (Windows no permite reemplazar un archivo mapeado)
+            instantanea.cerrar()
+            os.replace(ruta_temporal, self.ruta_instantanea)
+            sincronizar_directorio(self.ruta_instantanea)
+            self.diario.descartar_hasta(corte)
+            # Los objetos ya entregados siguen siendo los vigentes (y ya tienen
+            # lo posterior al corte): pasan a la instantánea nueva
+            nueva = InstantaneaBinaria(self.ruta_instantanea)
+            nueva.empleados_cargados = instantanea.empleados_cargados
+            nueva.proyectos_cargados = instantanea.proyectos_cargados
+            nueva.ids_empleados_nuevos = instantanea.ids_empleados_nuevos[nuevos_al_corte[0]:]
+            nueva.ids_proyectos_nuevos = instantanea.ids_proyectos_nuevos[nuevos_al_corte[1]:]
+            self.instantanea = nueva
+
+    def cerrar(self):
+        Empleado.observadores_cambios.remove(self.guardar_cambio_empleado)
+        if self.hilo_compactacion is not None:
+            self.hilo_compactacion.join()
+        self.diario.cerrar()
+        self.instantanea.cerrar()
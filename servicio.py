@@ -0,0 +1,402 @@
+# ================================
+# SERVICIO HTTP DEL SISTEMA DE RRHH Y PROYECTOS
+# ================================
+
+# Servicio asyncio sobre los almacenes persistentes y cliente para su prueba de carga
+
+import asyncio
+import concurrent.futures
+import contextlib
+import json
+import math
+import threading
+import time
+
+from modelo import (Proyecto, asignar_proyectos_en_lote, calcular_estadisticas_sistema, construir_empleado_desde_fila,
+                    interpretar_fila)
+from persistencia import TIPO_EMPLEADO_BASE, AlmacenConDiario, RegistroPersistente, obtener_campos_instantanea
+
+
+# ================================
+# SERVICIO HTTP
+# ================================
+
+# HTTP/1.1 con cuerpos JSON; las rutas están en ServicioRRHH.rutas
+RAZONES_ESTADO_HTTP = {200: "OK", 201: "Created", 400: "Bad Request", 404: "Not Found",
+                       405: "Method Not Allowed", 409: "Conflict", 413: "Payload Too Large",
+                       500: "Internal Server Error"}
+MAXIMO_CUERPO_SOLICITUD = 1 << 20
+
+
+class ErrorServicio(Exception):
+    def __init__(self, estado, mensaje):
+        super().__init__(mensaje)
+        self.estado = estado
+
+
+class BloqueoLecturaEscritura:
+    # Por fases, para que ni las lecturas posterguen a las escrituras ni al revés
+    def __init__(self):
+        self.condicion = asyncio.Condition()
+        self.lectores = 0
+        self.escribiendo = False
+        self.escritores_en_espera = 0
+        self.lectores_en_espera = 0
+        self.lectores_admitidos = 0
+
+    @contextlib.asynccontextmanager
+    async def lectura(self):
+        async with self.condicion:
+            self.lectores_en_espera += 1
+            await self.condicion.wait_for(lambda: not self.escribiendo
+                                          and (not self.escritores_en_espera or self.lectores_admitidos))
+            self.lectores_en_espera -= 1
+            self.lectores_admitidos = max(0, self.lectores_admitidos - 1)
+            self.lectores += 1
+        try:
+            yield
+        finally:
+            async with self.condicion:
+                self.lectores -= 1
+                self.condicion.notify_all()
+
+    @contextlib.asynccontextmanager
+    async def escritura(self):
+        async with self.condicion:
+            self.escritores_en_espera += 1
+            await self.condicion.wait_for(lambda: not self.escribiendo and not self.lectores
+                                          and not self.lectores_admitidos)
+            self.escritores_en_espera -= 1
+            self.escribiendo = True
+        try:
+            yield
+        finally:
+            async with self.condicion:
+                self.escribiendo = False
+                self.lectores_admitidos = self.lectores_en_espera
+                self.condicion.notify_all()
+
+
+def serializar_empleado(empleado):
+    tipo, campo_a, campo_b = obtener_campos_instantanea(empleado)
+    return {"id_empleado": empleado.id_empleado, "nombre_completo": empleado.nombre_completo,
+            "tipo_empleado": empleado.tipo_empleado if tipo != TIPO_EMPLEADO_BASE else "Empleado",
+            "salario_base": empleado.salario_base, "salario_total": empleado.calcular_salario_total(),
+            "ids_proyectos": [proyecto.id_proyecto for proyecto in empleado.lista_proyectos]}
+
+
+def serializar_proyecto(proyecto):
+    return {"id_proyecto": proyecto.id_proyecto, "nombre_proyecto": proyecto.nombre_proyecto,
+            "presupuesto_asignado": proyecto.presupuesto_asignado, "estado_proyecto": proyecto.estado_proyecto,
+            "cantidad_empleados": len(proyecto.lista_empleados_asignados)}
+
+
+def construir_proyecto_desde_datos(datos):
+    # Mismas reglas de validación que crear_nuevo_proyecto
+    nombre_proyecto = str(datos.get("nombre_proyecto") or "").strip()
+    if len(nombre_proyecto) < 2:
+        raise ValueError("El nombre del proyecto debe tener al menos 2 caracteres")
+    try:
+        presupuesto_asignado = float(datos.get("presupuesto_asignado"))
+    except (TypeError, ValueError):
+        raise ValueError("Debe ingresar un valor numérico válido")
+    if not presupuesto_asignado > 0:
+        raise ValueError("El presupuesto debe ser un valor positivo")
+    return Proyecto(nombre_proyecto, presupuesto_asignado)
+
+
+class ServicioRRHH:
+    # Escrituras de a una en un solo hilo; lecturas en paralelo salvo con almacén persistente
+    def __init__(self, registro_empleados, registro_proyectos, bloqueo_estado=None):
+        self.registro_empleados = registro_empleados
+        self.registro_proyectos = registro_proyectos
+        self.bloqueo_estado = bloqueo_estado or threading.RLock()
+        self.bloqueo = BloqueoLecturaEscritura()
+        self.ejecutor_escrituras = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self.lecturas_en_paralelo = not isinstance(registro_empleados, RegistroPersistente)
+        # (método, partes de la ruta con None en lugar del ID) -> (función, es_escritura)
+        self.rutas = {
+            ("POST", ("empleados",)): (self.crear_empleado, True),
+            ("POST", ("proyectos",)): (self.crear_proyecto, True),
+            ("POST", ("asignaciones",)): (self.asignar, True),
+            ("GET", ("empleados", None)): (self.consultar_empleado, False),
+            ("GET", ("proyectos", None)): (self.consultar_proyecto, False),
+            ("GET", ("proyectos", None, "factibilidad")): (self.consultar_factibilidad, False),
+            ("GET", ("reporte",)): (self.consultar_reporte, False),
+        }
+
+    def cerrar(self):
+        self.ejecutor_escrituras.shutdown()
+
+    # ---------- Operaciones (se ejecutan fuera del bucle de eventos) ----------
+
+    def crear_empleado(self, datos):
+        empleado = construir_empleado_desde_fila(datos)
+        self.registro_empleados.agregar(empleado)
+        return 201, serializar_empleado(empleado)
+
+    def crear_proyecto(self, datos):
+        proyecto = construir_proyecto_desde_datos(datos)
+        self.registro_proyectos.agregar(proyecto)
+        return 201, serializar_proyecto(proyecto)
+
+    def asignar(self, datos):
+        if "pares" in datos:
+            try:
+                pares = [(int(id_empleado), int(id_proyecto)) for id_empleado, id_proyecto in datos["pares"]]
+            except (TypeError, ValueError):
+                raise ValueError("pares debe ser una lista de [id_empleado, id_proyecto]")
+            todo_o_nada = bool(datos.get("todo_o_nada", False))
+        else:
+            pares = [(self.leer_id(datos.get("id_empleado")), self.leer_id(datos.get("id_proyecto")))]
+            todo_o_nada = True
+        resultados = asignar_proyectos_en_lote(self.registro_empleados, self.registro_proyectos, pares, todo_o_nada)
+        respuesta = {"resultados": [resultado._asdict() for resultado in resultados]}
+        if "pares" not in datos and not resultados[0].aplicada:
+            raise ErrorServicio(409, resultados[0].motivo)
+        return 200, respuesta
+
+    def consultar_empleado(self, datos, id_empleado):
+        return 200, serializar_empleado(self.buscar(self.registro_empleados, id_empleado, "empleado"))
+
+    def consultar_proyecto(self, datos, id_proyecto):
+        return 200, serializar_proyecto(self.buscar(self.registro_proyectos, id_proyecto, "proyecto"))
+
+    def consultar_factibilidad(self, datos, id_proyecto):
+        proyecto = self.buscar(self.registro_proyectos, id_proyecto, "proyecto")
+        costo_total = proyecto.calcular_costo_total_proyecto()
+        margen = proyecto.presupuesto_asignado - costo_total
+        return 200, {"id_proyecto": proyecto.id_proyecto, "presupuesto_asignado": proyecto.presupuesto_asignado,
+                     "costo_total": costo_total, "margen": margen, "factible": margen >= 0,
+                     "cantidad_empleados": len(proyecto.lista_empleados_asignados)}
+
+    def consultar_reporte(self, datos):
+        return 200, vars(calcular_estadisticas_sistema(self.registro_empleados, self.registro_proyectos))
+
+    def leer_id(self, valor):
+        try:
+            return int(valor)
+        except (TypeError, ValueError):
+            raise ValueError(f"ID inválido: {valor!r}")
+
+    def buscar(self, registro, id_texto, descripcion):
+        elemento = registro.buscar_por_id(self.leer_id(id_texto))
+        if elemento is None:
+            raise ErrorServicio(404, f"No existe un {descripcion} con ese ID")
+        return elemento
+
+    def ejecutar_con_bloqueo_estado(self, funcion, *argumentos):
+        with self.bloqueo_estado:
+            return funcion(*argumentos)
+
+    # ---------- Protocolo ----------
+
+    def resolver_ruta(self, metodo, ruta):
+        partes = tuple(parte for parte in ruta.split("?", 1)[0].split("/") if parte)
+        metodos_validos = False
+        for (metodo_ruta, patron), (funcion, es_escritura) in self.rutas.items():
+            if len(patron) != len(partes) or any(fijo is not None and fijo != parte
+                                                 for fijo, parte in zip(patron, partes)):
+                continue
+            if metodo_ruta != metodo:
+                metodos_validos = True
+                continue
+            parametros = [parte for fijo, parte in zip(patron, partes) if fijo is None]
+            return funcion, es_escritura, parametros
+        if metodos_validos:
+            raise ErrorServicio(405, f"Método {metodo} no permitido en {ruta}")
+        raise ErrorServicio(404, f"Ruta no encontrada: {ruta}")
+
+    async def despachar(self, metodo, ruta, cuerpo):
+        try:
+            funcion, es_escritura, parametros = self.resolver_ruta(metodo, ruta)
+            datos = interpretar_fila(cuerpo.decode("utf-8")) if cuerpo else {}
+            bucle = asyncio.get_running_loop()
+            if es_escritura:
+                almacen = getattr(self.registro_empleados, "almacen", None)
+                if not isinstance(almacen, AlmacenConDiario):
+                    async with self.bloqueo.escritura():
+                        return await bucle.run_in_executor(self.ejecutor_escrituras, self.ejecutar_con_bloqueo_estado,
+                                                           funcion, datos, *parametros)
+                async with self.bloqueo.escritura():
+                    respuesta, numero = await bucle.run_in_executor(
+                        self.ejecutor_escrituras, self.ejecutar_con_bloqueo_estado,
+                        almacen.ejecutar_con_confirmacion_diferida, funcion, datos, *parametros)
+                # Fuera de la sección exclusiva: la escritura siguiente ya puede
+                # correr y su evento entra en el mismo fsync o en el próximo
+                await bucle.run_in_executor(None, almacen.diario.esperar_confirmacion, numero)
+                return respuesta
+            async with self.bloqueo.lectura():
+                if self.lecturas_en_paralelo:
+                    return await bucle.run_in_executor(None, funcion, datos, *parametros)
+                return await bucle.run_in_executor(self.ejecutor_escrituras, self.ejecutar_con_bloqueo_estado,
+                                                   funcion, datos, *parametros)
+        except ErrorServicio as error:
+            return error.estado, {"error": str(error)}
+        except (ValueError, UnicodeDecodeError) as error:
+            return 400, {"error": str(error)}
+        except Exception as error:
+            return 500, {"error": f"Error inesperado: {error}"}
+
+    async def atender_conexion(self, lector, escritor):
+        try:
+            while True:
+                linea_solicitud = await lector.readline()
+                if not linea_solicitud.strip():
+                    break
+                try:
+                    metodo, ruta, version = linea_solicitud.decode("latin-1").split()
+                except ValueError:
+                    break
+                encabezados = {}
+                while True:
+                    linea = await lector.readline()
+                    if not linea.strip():
+                        break
+                    nombre, _, valor = linea.decode("latin-1").partition(":")
+                    encabezados[nombre.strip().lower()] = valor.strip()
+
+                # Solo dígitos ASCII: int() aceptaría signos, espacios o "²" (latin-1)
+                # y un valor inválido dejaría el resto del flujo desalineado
+                longitud_texto = encabezados.get("content-length") or "0"
+                if not (longitud_texto.isascii() and longitud_texto.isdigit()):
+                    estado, respuesta = 400, {"error": "Content-Length inválido"}
+                    cerrar = True
+                elif int(longitud_texto) > MAXIMO_CUERPO_SOLICITUD:
+                    estado, respuesta = 413, {"error": "Cuerpo de la solicitud demasiado grande"}
+                    cerrar = True
+                else:
+                    longitud = int(longitud_texto)
+                    cuerpo = await lector.readexactly(longitud) if longitud else b""
+                    estado, respuesta = await self.despachar(metodo, ruta, cuerpo)
+                    cerrar = (encabezados.get("connection", "").lower() == "close"
+                              or version == "HTTP/1.0")
+
+                contenido = json.dumps(respuesta, ensure_ascii=False).encode("utf-8")
+                lineas = [f"HTTP/1.1 {estado} {RAZONES_ESTADO_HTTP[estado]}",
+                          "Content-Type: application/json; charset=utf-8",
+                          f"Content-Length: {len(contenido)}"]
+                if cerrar:
+                    lineas.append("Connection: close")
+                escritor.write(("\r\n".join(lineas) + "\r\n\r\n").encode("latin-1") + contenido)
+                await escritor.drain()
+                if cerrar:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            escritor.close()
+
+
+async def servir(servicio, host="127.0.0.1", puerto=8080, al_iniciar=None):
+    # Atiende hasta que se cancele la tarea; al_iniciar recibe el puerto real (útil con puerto 0)
+    servidor = await asyncio.start_server(servicio.atender_conexion, host, puerto)
+    async with servidor:
+        if al_iniciar is not None:
+            al_iniciar(servidor.sockets[0].getsockname()[1])
+        await servidor.serve_forever()
+
+
+# ================================
+# CLIENTE DE PRUEBA DE CARGA
+# ================================
+
+def calcular_percentil(valores_ordenados, percentil):
+    # Método del rango más cercano sobre una lista ya ordenada
+    if not valores_ordenados:
+        return 0.0
+    posicion = max(0, math.ceil(percentil / 100 * len(valores_ordenados)) - 1)
+    return valores_ordenados[posicion]
+
+
+async def enviar_solicitud(lector, escritor, metodo, ruta, datos=None, host="127.0.0.1"):
+    cuerpo = json.dumps(datos).encode("utf-8") if datos is not None else b""
+    escritor.write(f"{metodo} {ruta} HTTP/1.1\r\nHost: {host}\r\n"
+                   f"Content-Type: application/json\r\nContent-Length: {len(cuerpo)}\r\n\r\n"
+                   .encode("latin-1") + cuerpo)
+    await escritor.drain()
+    estado = int((await lector.readline()).split()[1])
+    longitud = 0
+    while True:
+        linea = await lector.readline()
+        if not linea.strip():
+            break
+        nombre, _, valor = linea.decode("latin-1").partition(":")
+        if nombre.strip().lower() == "content-length":
+            longitud = int(valor)
+    return estado, json.loads(await lector.readexactly(longitud))
+
+
+async def preparar_datos_carga(host, puerto, cantidad_empleados, cantidad_proyectos):
+    # La prueba crea sus propios empleados y proyectos por la misma API
+    lector, escritor = await asyncio.open_connection(host, puerto)
+    try:
+        ids_empleados = []
+        for numero in range(cantidad_empleados):
+            _, empleado = await enviar_solicitud(lector, escritor, "POST", "/empleados", {
+                "tipo_empleado": "desarrollador", "nombre_completo": f"Prueba de carga {numero}",
+                "salario_base": 1000 + numero % 997, "lenguajes_programacion": "Python",
+                "nivel_experiencia": "Senior" if numero % 2 else "Junior"}, host)
+            ids_empleados.append(empleado["id_empleado"])
+        ids_proyectos = []
+        for numero in range(cantidad_proyectos):
+            _, proyecto = await enviar_solicitud(lector, escritor, "POST", "/proyectos", {
+                "nombre_proyecto": f"Carga {numero}", "presupuesto_asignado": 50000 + numero * 1000}, host)
+            ids_proyectos.append(proyecto["id_proyecto"])
+        return ids_empleados, ids_proyectos
+    finally:
+        escritor.close()
+
+
+def elegir_solicitud_prueba(numero, ids_empleados, ids_proyectos, proporcion_escrituras):
+    # Mezcla determinista: factibilidad y consultas puntuales, algún reporte y
+    # una fracción de escrituras (altas de empleados y asignaciones)
+    if numero % 1000 < proporcion_escrituras * 1000:
+        if numero % 2:
+            return "POST", "/empleados", {"tipo_empleado": "gerente", "nombre_completo": f"Carga {numero}",
+                                          "salario_base": 1000 + numero % 500, "departamento_gerencia": "Ventas"}
+        return "POST", "/asignaciones", {"id_empleado": ids_empleados[numero * 7919 % len(ids_empleados)],
+                                         "id_proyecto": ids_proyectos[numero * 31 % len(ids_proyectos)]}
+    if numero % 500 == 1:
+        return "GET", "/reporte", None
+    if numero % 3 == 0:
+        return "GET", f"/empleados/{ids_empleados[numero * 7919 % len(ids_empleados)]}", None
+    return "GET", f"/proyectos/{ids_proyectos[numero * 31 % len(ids_proyectos)]}/factibilidad", None
+
+
+async def ejecutar_prueba_carga(host="127.0.0.1", puerto=8080, conexiones=32, solicitudes_por_conexion=300,
+                                proporcion_escrituras=0.1, empleados_prueba=200, proyectos_prueba=20):
+    # Cada conexión persistente envía sus solicitudes una tras otra; retorna
+    # (latencias en segundos ordenadas, segundos totales, cantidad de errores 5xx)
+    ids_empleados, ids_proyectos = await preparar_datos_carga(host, puerto, empleados_prueba, proyectos_prueba)
+    latencias = []
+    errores = 0
+
+    async def conexion_cliente(numero_conexion):
+        nonlocal errores
+        lector, escritor = await asyncio.open_connection(host, puerto)
+        try:
+            for numero in range(solicitudes_por_conexion):
+                metodo, ruta, datos = elegir_solicitud_prueba(numero_conexion * solicitudes_por_conexion + numero,
+                                                              ids_empleados, ids_proyectos, proporcion_escrituras)
+                inicio = time.perf_counter()
+                estado, _ = await enviar_solicitud(lector, escritor, metodo, ruta, datos, host)
+                latencias.append(time.perf_counter() - inicio)
+                if estado >= 500:
+                    errores += 1
+        finally:
+            escritor.close()
+
+    inicio = time.perf_counter()
+    await asyncio.gather(*(conexion_cliente(numero_conexion) for numero_conexion in range(conexiones)))
+    segundos = time.perf_counter() - inicio
+    latencias.sort()
+    return latencias, segundos, errores
+
+
+def mostrar_resultado_carga(latencias, segundos, errores):
+    print(f"Solicitudes: {len(latencias):,} en {segundos:.2f} s ({len(latencias) / segundos:,.0f} solicitudes/s)")
+    print(f"Latencia p50: {calcular_percentil(latencias, 50) * 1000:.2f} ms, "
+          f"p99: {calcular_percentil(latencias, 99) * 1000:.2f} ms, "
+          f"máxima: {latencias[-1] * 1000 if latencias else 0.0:.2f} ms")
+    print(f"Errores del servidor: {errores}")
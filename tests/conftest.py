@@ -0,0 +1,25 @@
+import importlib.util
+import os
+import sys
+
+import pytest
+
+RAIZ_PROYECTO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RUTA_PROGRAMA = os.path.join(RAIZ_PROYECTO, "PROYECTO T1 T3 FINAL FINALLLLLLLLLLLLLLLL H.py")
+
+# Los módulos del proyecto se importan por nombre desde la raíz
+if RAIZ_PROYECTO not in sys.path:
+    sys.path.insert(0, RAIZ_PROYECTO)
+
+
+@pytest.fixture(scope="session")
+def rrhh():
+    # El nombre del archivo no es un identificador válido: se carga por ruta
+    # y se registra como "rrhh" para que los procesos hijos lo encuentren
+    if "rrhh" in sys.modules:
+        return sys.modules["rrhh"]
+    especificacion = importlib.util.spec_from_file_location("rrhh", RUTA_PROGRAMA)
+    modulo = importlib.util.module_from_spec(especificacion)
+    sys.modules["rrhh"] = modulo
+    especificacion.loader.exec_module(modulo)
+    return modulo
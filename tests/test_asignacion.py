@@ -0,0 +1,39 @@
+import pytest
+
+import modelo
+
+
+def test_proyectos_con_el_mismo_nombre_no_son_duplicados():
+    empleado = modelo.Gerente("Marta Ruiz", 2000.0, "Ventas")
+    primero = modelo.Proyecto("Portal", 10**5)
+    segundo = modelo.Proyecto("Portal", 10**5)
+    empleado.asignar_proyecto_empleado(primero)
+    empleado.asignar_proyecto_empleado(segundo)
+    
+    assert empleado.lista_proyectos == [primero, segundo]
+    assert empleado.tiene_proyecto(primero) and empleado.tiene_proyecto(segundo)
+    with pytest.raises(ValueError, match="ya está asignado"):
+        empleado.asignar_proyecto_empleado(primero)
+
+
+def test_limite_de_proyectos_cuenta_ids_distintos(monkeypatch):
+    monkeypatch.setattr(modelo.Empleado, "limite_proyectos", 2)
+    empleado = modelo.Gerente("Marta Ruiz", 2000.0, "Ventas")
+    empleado.asignar_proyecto_empleado(modelo.Proyecto("Portal", 10**5))
+    empleado.asignar_proyecto_empleado(modelo.Proyecto("Portal", 10**5))
+    
+    with pytest.raises(ValueError, match="Límite máximo de 2 proyectos"):
+        empleado.asignar_proyecto_empleado(modelo.Proyecto("Portal", 10**5))
+    assert empleado.obtener_cantidad_proyectos() == 2
+
+
+def test_desenlazar_libera_el_id_del_proyecto():
+    empleado = modelo.Gerente("Marta Ruiz", 2000.0, "Ventas")
+    proyecto = modelo.Proyecto("Portal", 10**5)
+    empleado.enlazar_proyecto(proyecto)
+    empleado.desenlazar_proyecto(proyecto)
+    
+    assert not empleado.tiene_proyecto(proyecto)
+    assert empleado.id_empleado not in proyecto.ids_empleados_asignados
+    empleado.asignar_proyecto_empleado(proyecto)
+    assert empleado.tiene_proyecto(proyecto)
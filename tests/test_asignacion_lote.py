@@ -0,0 +1,119 @@
+import pytest
+
+import modelo
+
+
+@pytest.fixture
+def registros():
+    registro_empleados = modelo.RegistroEmpleados()
+    registro_proyectos = modelo.RegistroProyectos()
+    registro_empleados.extender(modelo.Gerente(f"Gerente {i}", 1000.0, "Ventas") for i in range(3))
+    registro_proyectos.extender(modelo.Proyecto(f"Proyecto {i}", 10**5) for i in range(5))
+    return registro_empleados, registro_proyectos
+
+
+def obtener_ids(registro_empleados, registro_proyectos):
+    return ([empleado.id_empleado for empleado in registro_empleados],
+            [proyecto.id_proyecto for proyecto in registro_proyectos])
+
+
+def test_lote_rechaza_pares_invalidos_y_aplica_el_resto(registros):
+    registro_empleados, registro_proyectos = registros
+    ids_empleados, ids_proyectos = obtener_ids(*registros)
+    limite = modelo.Empleado.limite_proyectos
+    pares = [(ids_empleados[0], id_proyecto) for id_proyecto in ids_proyectos[:limite + 1]]
+    pares += [(ids_empleados[1], ids_proyectos[0]), (ids_empleados[1], ids_proyectos[0]),
+              (-1, ids_proyectos[0]), (ids_empleados[2], -1)]
+    
+    resultados = modelo.asignar_proyectos_en_lote(registro_empleados, registro_proyectos, pares)
+    
+    assert [resultado.aplicada for resultado in resultados] == [True] * limite + [False, True, False, False, False]
+    assert resultados[limite].motivo.startswith("Límite máximo")
+    assert resultados[limite + 2].motivo == "El empleado ya está asignado a este proyecto"
+    assert resultados[limite + 3].motivo == "No existe un empleado con ese ID"
+    assert resultados[limite + 4].motivo == "No existe un proyecto con ese ID"
+    assert registro_empleados[0].obtener_cantidad_proyectos() == limite
+    assert registro_empleados[1].obtener_cantidad_proyectos() == 1
+
+
+def test_todo_o_nada_cancela_el_lote_completo(registros):
+    registro_empleados, registro_proyectos = registros
+    ids_empleados, ids_proyectos = obtener_ids(*registros)
+    pares = [(ids_empleados[0], ids_proyectos[0]), (ids_empleados[1], -1)]
+    
+    resultados = modelo.asignar_proyectos_en_lote(registro_empleados, registro_proyectos, pares, todo_o_nada=True)
+    
+    assert not any(resultado.aplicada for resultado in resultados)
+    assert resultados[0].motivo == "Lote cancelado por pares inválidos"
+    assert all(empleado.obtener_cantidad_proyectos() == 0 for empleado in registro_empleados)
+    assert all(proyecto.costo_total_acumulado == 0 for proyecto in registro_proyectos)
+
+
+def test_falla_al_guardar_deshace_los_enlaces(registros, monkeypatch):
+    registro_empleados, registro_proyectos = registros
+    ids_empleados, ids_proyectos = obtener_ids(*registros)
+    
+    def fallar(asignaciones):
+        raise OSError("disco lleno")
+    monkeypatch.setattr(registro_empleados, "registrar_asignaciones", fallar)
+    pares = [(id_empleado, id_proyecto) for id_empleado in ids_empleados for id_proyecto in ids_proyectos[:2]]
+    
+    with pytest.raises(OSError):
+        modelo.asignar_proyectos_en_lote(registro_empleados, registro_proyectos, pares)
+    
+    for empleado in registro_empleados:
+        assert empleado.lista_proyectos == [] and not empleado.ids_proyectos_asignados
+    for proyecto in registro_proyectos:
+        assert proyecto.lista_empleados_asignados == [] and not proyecto.ids_empleados_asignados
+        assert proyecto.costo_total_acumulado == 0
+
+
+def test_falla_a_mitad_de_los_enlaces_deshace_solo_los_hechos(registros, monkeypatch):
+    registro_empleados, registro_proyectos = registros
+    ids_empleados, ids_proyectos = obtener_ids(*registros)
+    fallido = registro_empleados[2]
+    
+    def fallar(proyecto):
+        raise RuntimeError("fallo al enlazar")
+    monkeypatch.setattr(type(fallido), "enlazar_proyecto",
+                        lambda empleado, proyecto, original=type(fallido).enlazar_proyecto:
+                        fallar(proyecto) if empleado is fallido else original(empleado, proyecto))
+    pares = [(id_empleado, ids_proyectos[0]) for id_empleado in ids_empleados]
+    
+    with pytest.raises(RuntimeError):
+        modelo.asignar_proyectos_en_lote(registro_empleados, registro_proyectos, pares)
+    
+    assert all(empleado.obtener_cantidad_proyectos() == 0 for empleado in registro_empleados)
+    assert registro_proyectos[0].lista_empleados_asignados == []
+    assert registro_proyectos[0].costo_total_acumulado == 0
+
+
+def test_asignacion_del_menu_deshace_el_enlace_si_falla_el_guardado(rrhh, registros, monkeypatch):
+    registro_empleados, registro_proyectos = registros
+    empleado, proyecto = registro_empleados[0], registro_proyectos[0]
+    
+    def fallar(asignaciones):
+        raise OSError("fsync fallido")
+    monkeypatch.setattr(registro_empleados, "registrar_asignaciones", fallar)
+    monkeypatch.setattr(rrhh, "seleccionar_por_id_o_nombre",
+                        lambda registro, *argumentos: empleado if registro is registro_empleados else proyecto)
+    monkeypatch.setattr(rrhh, "mostrar_primera_pagina", lambda *argumentos: None)
+    
+    with pytest.raises(OSError):
+        rrhh.asignar_proyecto_empleado(registro_empleados, registro_proyectos)
+    
+    assert empleado.lista_proyectos == [] and not empleado.tiene_proyecto(proyecto)
+    assert proyecto.lista_empleados_asignados == [] and proyecto.costo_total_acumulado == 0
+
+
+def test_asignacion_del_menu_informa_el_rechazo(rrhh, registros, monkeypatch, capsys):
+    registro_empleados, registro_proyectos = registros
+    empleado, proyecto = registro_empleados[0], registro_proyectos[0]
+    empleado.enlazar_proyecto(proyecto)
+    monkeypatch.setattr(rrhh, "seleccionar_por_id_o_nombre",
+                        lambda registro, *argumentos: empleado if registro is registro_empleados else proyecto)
+    
+    rrhh.asignar_proyecto_empleado(registro_empleados, registro_proyectos)
+    
+    assert "Error en asignación: El empleado ya está asignado a este proyecto" in capsys.readouterr().out
+    assert empleado.obtener_cantidad_proyectos() == 1
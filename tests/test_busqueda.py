@@ -0,0 +1,53 @@
+import pytest
+
+import modelo
+
+
+@pytest.fixture
+def registro():
+    registro = modelo.RegistroEmpleados()
+    registro.extender([modelo.Gerente(nombre, 2000.0, "Ventas")
+                       for nombre in ["José Núñez", "Josefina Paz", "María Jose Díaz", "Ana Pérez"]])
+    return registro
+
+
+def test_busqueda_por_prefijo_sin_tildes(registro):
+    jose, josefina, maria, _ = registro
+    
+    assert registro.buscar_por_nombre("jose") == [jose, maria, josefina]
+    assert registro.buscar_por_nombre("JOS", 2) == [jose, maria]
+    assert registro.buscar_por_nombre("nunez") == [jose]
+
+
+def test_busqueda_de_varias_palabras_exige_todas(registro):
+    _, _, maria, _ = registro
+    
+    assert registro.buscar_por_nombre("jose diaz") == [maria]
+    assert registro.buscar_por_nombre("ana diaz") == []
+
+
+def test_busqueda_tolera_errores_de_tipeo(registro):
+    _, _, _, ana = registro
+    
+    assert registro.buscar_por_nombre("perrez") == [ana]
+    assert registro.buscar_por_nombre("xyz") == []
+
+
+def test_indice_incluye_los_agregados_despues_de_construirlo(registro):
+    registro.buscar_por_nombre("ana")
+    nuevo = modelo.Gerente("Anabel Soto", 2000.0, "Ventas")
+    registro.agregar(nuevo)
+    
+    assert registro.buscar_por_nombre("soto") == [nuevo]
+    assert nuevo in registro.buscar_por_nombre("ana")
+
+
+def test_palabras_ordenadas_parten_bloques(monkeypatch):
+    monkeypatch.setattr(modelo.PalabrasOrdenadas, "tamano_bloque", 2)
+    palabras = modelo.PalabrasOrdenadas()
+    for palabra in ["delta", "alfa", "eco", "charlie", "bravo", "foxtrot"]:
+        palabras.agregar(palabra)
+    
+    assert list(palabras) == ["alfa", "bravo", "charlie", "delta", "eco", "foxtrot"]
+    assert len(palabras.bloques) > 1
+    assert list(palabras.desde("c")) == ["charlie", "delta", "eco", "foxtrot"]
@@ -0,0 +1,74 @@
+import json
+
+import pytest
+
+import modelo
+
+
+@pytest.fixture
+def tabla_compensacion():
+    # Los tests cargan otras reglas en la tabla global: al terminar vuelven las predeterminadas
+    yield modelo.tabla_compensacion
+    modelo.tabla_compensacion.compilar(modelo.REGLAS_COMPENSACION_PREDETERMINADAS)
+
+
+@pytest.fixture
+def ejecutar_main(rrhh, tabla_compensacion, monkeypatch):
+    # main() también ajusta atributos de clase: se restauran al terminar
+    monkeypatch.setattr(modelo.Empleado, "limite_proyectos", modelo.Empleado.limite_proyectos)
+    monkeypatch.setattr(modelo.Proyecto, "verificar_consistencia_costos", modelo.Proyecto.verificar_consistencia_costos)
+    
+    def ejecutar(*argumentos, programa=lambda argumentos: 0):
+        monkeypatch.setattr("sys.argv", ["rrhh", *argumentos])
+        monkeypatch.setattr(rrhh, "ejecutar_programa", programa)
+        return rrhh.main()
+    return ejecutar
+
+
+def escribir_reglas(ruta, reglas):
+    ruta.write_text(json.dumps({"version": 1, "reglas": reglas}), encoding="utf-8")
+    return str(ruta)
+
+
+def test_archivo_de_reglas_cambia_los_salarios(ejecutar_main, tmp_path):
+    ruta = escribir_reglas(tmp_path / "reglas.json", [
+        {"tipo": "Desarrollador", "categorias": ["Junior"], "bonificacion": 5},
+        {"tipo": "Desarrollador", "bonificacion": 10},
+        {"tipo": "Gerente", "bonificacion": -10}])
+    salarios = {}
+    
+    def programa(argumentos):
+        salarios["junior"] = modelo.Desarrollador("Ana Pérez", 1000.0, ["Python"], "JUNIOR").calcular_salario_total()
+        salarios["senior"] = modelo.Desarrollador("Ana Pérez", 1000.0, ["Python"], "Senior").calcular_salario_total()
+        salarios["diseno"] = modelo.Diseñador("Luis Gómez", 1000.0, ["Figma"], "UX").calcular_salario_total()
+        salarios["gerente"] = modelo.Gerente("Marta Ruiz", 1000.0, "Ventas").calcular_salario_total()
+        return 0
+    
+    assert ejecutar_main("--reglas-compensacion", ruta, programa=programa) == 0
+    assert salarios == pytest.approx({"junior": 1050.0, "senior": 1100.0, "diseno": 1000.0, "gerente": 900.0})
+
+
+@pytest.mark.parametrize("reglas, mensaje", [
+    ([{"tipo": "Astronauta", "bonificacion": 10}], "tipo de empleado desconocido"),
+    ([{"tipo": "Gerente", "bonificacion": -100}], "mayor que -100"),
+    ([{"tipo": "Gerente", "bonificacion": 5}, {"tipo": "Gerente", "bonificacion": 6}], "ya tiene una regla"),
+    ([{"tipo": "Diseñador", "categorias": ["UX"], "bonificacion": 5},
+      {"tipo": "Diseñador", "categorias": ["ux"], "bonificacion": 6}], "ya tiene regla"),
+])
+def test_archivo_de_reglas_invalido_termina_con_error(ejecutar_main, tmp_path, capsys, reglas, mensaje):
+    ruta = escribir_reglas(tmp_path / "reglas.json", reglas)
+    
+    with pytest.raises(SystemExit) as salida:
+        ejecutar_main("--reglas-compensacion", ruta)
+    assert salida.value.code == 2
+    assert mensaje in capsys.readouterr().err
+    assert modelo.tabla_compensacion.obtener_regla("Gerente", "Ventas").porcentaje == 35
+
+
+def test_empleados_creados_conservan_su_regla(tabla_compensacion, tmp_path):
+    anterior = modelo.Gerente("Marta Ruiz", 1000.0, "Ventas")
+    tabla_compensacion.cargar_archivo(escribir_reglas(tmp_path / "reglas.json",
+                                                      [{"tipo": "Gerente", "bonificacion": 50}]))
+    
+    assert anterior.calcular_salario_total() == pytest.approx(1350.0)
+    assert modelo.Gerente("Luis Gómez", 1000.0, "Ventas").calcular_salario_total() == pytest.approx(1500.0)
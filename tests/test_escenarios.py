@@ -0,0 +1,84 @@
+import math
+import random
+
+import pytest
+
+import modelo
+
+
+@pytest.fixture
+def registros():
+    generador = random.Random(19)
+    registro_empleados = modelo.RegistroEmpleados()
+    registro_proyectos = modelo.RegistroProyectos()
+    for numero in range(30):
+        salario = generador.uniform(800, 1200)
+        if numero % 3 == 0:
+            empleado = modelo.Desarrollador(f"Desarrollador {numero}", salario, ["Python"],
+                                          generador.choice(["Junior", "SemiSenior", "Senior"]))
+        elif numero % 3 == 1:
+            empleado = modelo.Diseñador(f"Diseñador {numero}", salario, ["Figma"], "UX")
+        else:
+            empleado = modelo.Gerente(f"Gerente {numero}", salario, "Ventas")
+        registro_empleados.agregar(empleado)
+    empleados = list(registro_empleados)
+    for numero in range(10):
+        proyecto = modelo.Proyecto(f"Proyecto {numero}", 0.0)
+        registro_proyectos.agregar(proyecto)
+        for empleado in generador.sample(empleados, 3):
+            if empleado.obtener_cantidad_proyectos() < empleado.limite_proyectos:
+                empleado.enlazar_proyecto(proyecto)
+        # Presupuestos cerca del costo para que los cambios crucen el límite en los dos sentidos
+        proyecto.presupuesto_asignado = proyecto.recalcular_costo_total_proyecto() * generador.uniform(0.95, 1.1)
+    return registro_empleados, registro_proyectos
+
+
+@pytest.mark.parametrize("factor_gerentes", [1.1, 0.8])
+def test_escenario_coincide_con_aplicar_los_cambios(rrhh, registros, factor_gerentes):
+    registro_empleados, registro_proyectos = registros
+    empleados = list(registro_empleados)
+    puntual = empleados[1]
+    escenario = rrhh.EscenarioSalarial("Ajuste", {("Desarrollador", "Junior"): 1.25}, {"Gerente": factor_gerentes},
+                                       {puntual.id_empleado: 1500.0})
+    salarios_antes = [empleado.calcular_salario_total() for empleado in empleados]
+    costos_antes = {proyecto.id_proyecto: proyecto.recalcular_costo_total_proyecto() for proyecto in registro_proyectos}
+    (resultado,) = rrhh.evaluar_escenarios([escenario], registro_empleados, procesos=1)
+    
+    # Evaluar no cambia a los empleados reales
+    assert [empleado.calcular_salario_total() for empleado in empleados] == salarios_antes
+    
+    for empleado in empleados:
+        if isinstance(empleado, modelo.Gerente):
+            empleado.salario_base *= factor_gerentes
+        elif isinstance(empleado, modelo.Desarrollador) and empleado.nivel_experiencia == "Junior":
+            empleado.nivel_experiencia = "Senior"
+    puntual.salario_base = 1500.0
+    costos_despues = {proyecto.id_proyecto: proyecto.recalcular_costo_total_proyecto() for proyecto in registro_proyectos}
+    presupuestos = {proyecto.id_proyecto: proyecto.presupuesto_asignado for proyecto in registro_proyectos}
+    
+    assert resultado.diferencia_costo_total == pytest.approx(
+        math.fsum(costos_despues.values()) - math.fsum(costos_antes.values()))
+    assert [id_proyecto for id_proyecto, _ in resultado.proyectos_no_factibles] == sorted(
+        id_proyecto for id_proyecto in costos_antes
+        if costos_antes[id_proyecto] <= presupuestos[id_proyecto] < costos_despues[id_proyecto])
+    assert [id_proyecto for id_proyecto, _ in resultado.proyectos_recuperados] == sorted(
+        id_proyecto for id_proyecto in costos_antes
+        if costos_despues[id_proyecto] <= presupuestos[id_proyecto] < costos_antes[id_proyecto])
+    for id_proyecto, margen in resultado.proyectos_no_factibles + resultado.proyectos_recuperados:
+        assert margen == pytest.approx(presupuestos[id_proyecto] - costos_despues[id_proyecto])
+
+
+def test_escenario_vacio_no_cambia_nada(rrhh, registros):
+    registro_empleados, _ = registros
+    (resultado,) = rrhh.evaluar_escenarios([rrhh.EscenarioSalarial("Sin cambios")], registro_empleados, procesos=1)
+    
+    assert resultado == rrhh.ResultadoEscenario("Sin cambios", 0, 0.0, [], [])
+
+
+def test_escenarios_en_procesos_coinciden_con_la_evaluacion_en_serie(rrhh, registros):
+    registro_empleados, _ = registros
+    escenarios = [rrhh.EscenarioSalarial("Gerentes", factores_salario_base={"Gerente": 1.2}),
+                  rrhh.EscenarioSalarial("Diseño", {("Diseñador", "UX"): 1.0})]
+    
+    assert (rrhh.evaluar_escenarios(escenarios, registro_empleados, procesos=2)
+            == rrhh.evaluar_escenarios(escenarios, registro_empleados, procesos=1))
@@ -0,0 +1,58 @@
+import pytest
+
+import modelo
+
+
+@pytest.fixture
+def registro():
+    registro = modelo.RegistroEmpleados()
+    registro.extender([modelo.Desarrollador("Ana Pérez", 1000.0, ["Python"], "Junior"),
+                       modelo.Diseñador("Luis Gómez", 1000.0, ["Figma"], "UI"),
+                       modelo.Gerente("Marta Ruiz", 2000.0, "Ventas")])
+    return registro
+
+
+def test_busqueda_por_habilidad_y_categoria(registro):
+    desarrollador, disenador, gerente = registro
+    assert registro.buscar_por_habilidades(["python"]) == [desarrollador]
+    assert registro.buscar_por_habilidades(["FIGMA"], especialidad="ui") == [disenador]
+    assert registro.buscar_por_habilidades(departamento="ventas") == [gerente]
+    assert registro.buscar_por_habilidades(["python"], nivel="senior") == []
+
+
+def test_cambio_de_categoria_actualiza_el_indice(registro):
+    desarrollador, disenador, _ = registro
+    registro.buscar_por_habilidades(["python"])
+    desarrollador.nivel_experiencia = "Senior"
+    disenador.especialidad_diseno = "UX"
+    assert registro.buscar_por_habilidades(["python"], nivel="senior") == [desarrollador]
+    assert registro.buscar_por_habilidades(["python"], nivel="junior") == []
+    assert registro.buscar_por_habilidades(especialidad="ux") == [disenador]
+    assert registro.buscar_por_habilidades(especialidad="ui") == []
+
+
+def test_indice_descartado_deja_de_observar(registro):
+    cantidad = len(modelo.Empleado.observadores_cambios)
+    registro.buscar_por_habilidades(["python"])
+    assert len(modelo.Empleado.observadores_cambios) == cantidad + 1
+    registro.indice_habilidades = None
+    assert len(modelo.Empleado.observadores_cambios) == cantidad
+
+
+def test_deshacer_un_lote_restaura_la_capacidad_en_el_indice(registro, monkeypatch):
+    desarrollador = registro[0]
+    registro_proyectos = modelo.RegistroProyectos()
+    registro_proyectos.extender(modelo.Proyecto(f"Proyecto {i}", 10**5) for i in range(3))
+    registro.buscar_por_habilidades(["python"], solo_disponibles=True)
+    
+    def indexar_y_fallar(asignaciones):
+        # Un registro que indexa antes de que falle el guardado
+        registro.indexar_asignaciones(asignaciones)
+        raise OSError("disco lleno")
+    monkeypatch.setattr(registro, "registrar_asignaciones", indexar_y_fallar)
+    pares = [(desarrollador.id_empleado, proyecto.id_proyecto) for proyecto in registro_proyectos]
+    with pytest.raises(OSError):
+        modelo.asignar_proyectos_en_lote(registro, registro_proyectos, pares)
+    
+    assert desarrollador.obtener_cantidad_proyectos() == 0
+    assert registro.buscar_por_habilidades(["python"], solo_disponibles=True) == [desarrollador]
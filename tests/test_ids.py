@@ -0,0 +1,41 @@
+import threading
+
+import modelo
+
+
+def pedir_ids_en_hilos(funcion, hilos, por_hilo):
+    resultados = [None] * hilos
+    barrera = threading.Barrier(hilos)
+    
+    def trabajar(posicion):
+        barrera.wait()
+        resultados[posicion] = [funcion() for _ in range(por_hilo)]
+    
+    trabajadores = [threading.Thread(target=trabajar, args=(posicion,)) for posicion in range(hilos)]
+    for trabajador in trabajadores:
+        trabajador.start()
+    for trabajador in trabajadores:
+        trabajador.join()
+    return [id_nuevo for ids in resultados for id_nuevo in ids]
+
+
+def test_ids_unicos_desde_varios_hilos():
+    asignador = modelo.AsignadorIds(tamano_bloque=16)
+    ids = pedir_ids_en_hilos(asignador.obtener_id, 8, 500)
+    
+    assert len(set(ids)) == len(ids) == 4000
+    assert min(ids) >= 1
+
+
+def test_empleados_creados_en_hilos_no_repiten_id():
+    ids = pedir_ids_en_hilos(lambda: modelo.Gerente("Gerente Hilo", 1000.0, "Ventas").id_empleado, 4, 300)
+    
+    assert len(set(ids)) == len(ids)
+
+
+def test_ids_nuevos_continuan_despues_de_los_restaurados():
+    asignador = modelo.AsignadorIds(tamano_bloque=16)
+    asignador.obtener_id()
+    asignador.avanzar_hasta(100)
+    
+    assert asignador.obtener_id() >= 100
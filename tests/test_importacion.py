@@ -0,0 +1,45 @@
+import modelo
+
+
+def escribir(ruta, contenido):
+    ruta.write_bytes(contenido)
+    return str(ruta)
+
+
+def test_importa_csv_con_bom(rrhh, tmp_path):
+    ruta = escribir(tmp_path / "empleados.csv",
+                    "\ufefftipo_empleado,nombre_completo,salario_base,departamento_gerencia\r\n"
+                    "gerente,Marta Ruiz,2000,Ventas\r\n".encode("utf-8"))
+    registro, resumen = rrhh.importar_empleados_desde_archivo(ruta, modelo.RegistroEmpleados())
+    
+    assert resumen["importados"] == 1
+    assert resumen["rechazados"] == 0
+    assert [empleado.nombre_completo for empleado in registro] == ["Marta Ruiz"]
+
+
+def test_linea_que_no_es_utf8_se_rechaza_y_sigue(rrhh, tmp_path):
+    ruta = escribir(tmp_path / "empleados.jsonl",
+                    b'{"tipo_empleado": "gerente", "nombre_completo": "Mar\xeda Ruiz", "salario_base": 2000}\n'
+                    b'{"tipo_empleado": "gerente", "nombre_completo": "Luis G\xc3\xb3mez", "salario_base": 1500}\n')
+    registro, resumen = rrhh.importar_empleados_desde_archivo(ruta, modelo.RegistroEmpleados())
+    
+    assert resumen["importados"] == 1
+    assert resumen["rechazados"] == 1
+    assert resumen["rechazos"][0][0] == 1
+    assert [empleado.nombre_completo for empleado in registro] == ["Luis Gómez"]
+
+
+def test_importa_por_lotes(rrhh, tmp_path, monkeypatch):
+    monkeypatch.setattr(rrhh, "TAMANO_LOTE_IMPORTACION", 2)
+    lotes = []
+    registro = modelo.RegistroEmpleados()
+    extender = registro.extender
+    monkeypatch.setattr(registro, "extender", lambda empleados: lotes.append(len(empleados)) or extender(empleados))
+    filas = "".join(f"gerente,Gerente {numero},1000\n" for numero in range(5))
+    ruta = escribir(tmp_path / "empleados.csv",
+                    ("tipo_empleado,nombre_completo,salario_base\nx,Sin tipo,1000\n" + filas).encode("utf-8"))
+    registro, resumen = rrhh.importar_empleados_desde_archivo(ruta, registro)
+    
+    assert lotes == [2, 2, 1]
+    assert len(registro) == resumen["importados"] == 5
+    assert resumen["rechazos"] == [(2, "Tipo de empleado no válido")]
@@ -0,0 +1,102 @@
+import json
+import re
+import types
+
+import pytest
+
+import instrumentacion
+import modelo
+
+LINEA_MUESTRA = re.compile(r'^([a-z_]+)\{((?:[a-z]+="[^"]*",?)+)\} (-?[0-9.e+-]+)$')
+
+
+@pytest.fixture
+def medidor():
+    medidor = instrumentacion.Instrumentacion()
+    yield medidor
+    medidor.desactivar()
+
+
+def leer_muestras(texto):
+    muestras = {}
+    for linea in texto.splitlines():
+        if linea.startswith("#"):
+            continue
+        coincidencia = LINEA_MUESTRA.match(linea)
+        assert coincidencia, linea
+        nombre, etiquetas, valor = coincidencia.groups()
+        muestras[(nombre, etiquetas)] = float(valor)
+    return muestras
+
+
+def test_texto_prometheus_tiene_histograma_acumulado(medidor):
+    original = modelo.Empleado.calcular_salario_total
+    medidor.activar()
+    empleado = modelo.Gerente("Marta Ruiz", 2000.0, "Ventas")
+    proyecto = modelo.Proyecto("Portal", 10**5)
+    for _ in range(5):
+        empleado.calcular_salario_total()
+    empleado.asignar_proyecto_empleado(proyecto)
+    with pytest.raises(ValueError):
+        empleado.asignar_proyecto_empleado(proyecto)
+    medidor.desactivar()
+    texto = medidor.generar_texto_prometheus()
+    muestras = leer_muestras(texto)
+    etiqueta = 'operacion="Empleado.calcular_salario_total"'
+    cubetas = [valor for (nombre, etiquetas), valor in muestras.items()
+               if nombre == "rrhh_operacion_segundos_bucket" and etiquetas.startswith(etiqueta)]
+    
+    assert modelo.Empleado.calcular_salario_total is original
+    assert "# TYPE rrhh_operacion_segundos histogram" in texto.splitlines()
+    assert cubetas == sorted(cubetas)
+    # La asignación también calcula el salario al sumarlo al costo del proyecto
+    assert cubetas[-1] == muestras[("rrhh_operacion_segundos_bucket", etiqueta + ',le="+Inf"')] == 6
+    assert muestras[("rrhh_operacion_segundos_count", etiqueta)] == 6
+    assert muestras[("rrhh_operacion_errores_total", 'operacion="Empleado.asignar_proyecto_empleado"')] == 1
+    assert len(cubetas) == len(instrumentacion.LIMITES_LATENCIA_NS) + 1
+
+
+def test_exportar_json_y_prometheus(medidor, tmp_path):
+    medidor.activar()
+    modelo.Proyecto("Portal", 1000.0).calcular_costo_total_proyecto()
+    medidor.desactivar()
+    ruta_json = str(tmp_path / "metricas.json")
+    ruta_texto = str(tmp_path / "metricas.prom")
+    medidor.exportar(ruta_json)
+    medidor.exportar(ruta_texto)
+    
+    with open(ruta_json, encoding="utf-8") as archivo:
+        instantanea = json.load(archivo)
+    assert instantanea["version"] == instrumentacion.VERSION_METRICAS
+    assert instantanea["operaciones"]["Proyecto.calcular_costo_total_proyecto"]["llamadas"] == 1
+    with open(ruta_texto, encoding="utf-8") as archivo:
+        assert archivo.read() == medidor.generar_texto_prometheus()
+
+
+def test_percentil_interpola_dentro_del_intervalo():
+    metrica = instrumentacion.MetricaOperacion("prueba")
+    for nanosegundos in (150, 150, 150, 400):
+        metrica.registrar(nanosegundos, 0, False)
+    
+    # Tres llamadas entre 100 y 200 ns y una entre 200 y 500 ns (máximo observado 400)
+    assert metrica.estimar_percentil(50) == pytest.approx((100 + 100 * 2 / 3) / 1e9)
+    assert metrica.estimar_percentil(99) == pytest.approx((200 + 200 * 0.96) / 1e9)
+
+
+def test_mide_las_acciones_e_input_del_modulo_del_menu(monkeypatch):
+    menu = types.ModuleType("menu")
+    exec("\n".join(f"def {nombre}(*argumentos):\n    return input('> ')"
+                   for nombre in instrumentacion.ACCIONES_MENU_INSTRUMENTADAS), vars(menu))
+    original = menu.crear_nuevo_empleado
+    monkeypatch.setattr("builtins.input", lambda pregunta: "Marta Ruiz")
+    medidor = instrumentacion.Instrumentacion(menu)
+    medidor.activar()
+    try:
+        assert menu.crear_nuevo_empleado() == "Marta Ruiz"
+    finally:
+        medidor.desactivar()
+    operaciones = medidor.obtener_instantanea()["operaciones"]
+    
+    assert operaciones["menu.crear_nuevo_empleado"]["llamadas"] == 1
+    assert operaciones["entrada_usuario"]["llamadas"] == 1
+    assert menu.crear_nuevo_empleado is original and not hasattr(menu, "input")
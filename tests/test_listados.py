@@ -0,0 +1,75 @@
+import io
+
+import pytest
+
+import modelo
+
+
+@pytest.fixture
+def registro():
+    registro = modelo.RegistroEmpleados()
+    registro.extender([modelo.Desarrollador(f"Desarrollador {numero}", 1000.0, ["Python"], "Senior")
+                       for numero in range(3)])
+    registro.extender([modelo.Gerente(f"Gerente {numero}", 2000.0, "Ventas") for numero in range(2)])
+    return registro
+
+
+class DestinoContado(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.escrituras = 0
+    
+    def write(self, texto):
+        self.escrituras += 1
+        return super().write(texto)
+
+
+def test_renderizado_conserva_el_formato_original(rrhh, registro):
+    separador = "-" * 50
+    esperado = "".join(f"\n{separador}\n{empleado.obtener_informacion_completa()}\n{separador}\n"
+                       for empleado in registro)
+    destino = DestinoContado()
+    
+    assert rrhh.escribir_en_bloques(rrhh.renderizar_empleados(registro), destino) == len(registro)
+    assert destino.getvalue() == esperado
+    assert destino.escrituras == 1
+
+
+def test_escritura_en_bloques_respeta_el_tamano_del_buffer(rrhh):
+    destino = DestinoContado()
+    
+    assert rrhh.escribir_en_bloques(["abc", "def", "gh"], destino, tamano_buffer=4) == 3
+    assert destino.getvalue() == "abcdefgh"
+    assert destino.escrituras == 2
+
+
+def test_seleccion_filtra_por_tipo_y_rango(rrhh, registro):
+    desarrolladores = list(registro)[:3]
+    gerentes = list(registro)[3:]
+    primer_id = desarrolladores[0].id_empleado
+    
+    assert list(rrhh.seleccionar_empleados(registro, "gerente")) == gerentes
+    assert list(rrhh.seleccionar_empleados(registro, None, primer_id + 1, primer_id + 3)) == list(registro)[1:4]
+    assert list(rrhh.seleccionar_empleados(registro, "Desarrollador", primer_id + 2)) == desarrolladores[2:]
+
+
+def test_listado_en_pantalla_pagina_hasta_que_se_termina(rrhh, registro, monkeypatch, capsys):
+    monkeypatch.setattr(rrhh, "TAMANO_PAGINA_LISTADO", 2)
+    respuestas = iter([""] * 6)
+    preguntas = []
+    monkeypatch.setattr("builtins.input", lambda pregunta: preguntas.append(pregunta) or next(respuestas))
+    rrhh.mostrar_informacion_empleados(registro)
+    
+    assert [pregunta for pregunta in preguntas if "Página" in pregunta] == [
+        "\nPágina 1. Enter para continuar, 'q' para terminar: ",
+        "\nPágina 2. Enter para continuar, 'q' para terminar: "]
+    assert capsys.readouterr().out.count("Nombre completo: ") == len(registro)
+
+
+def test_listado_en_pantalla_se_detiene_con_q(rrhh, registro, monkeypatch, capsys):
+    monkeypatch.setattr(rrhh, "TAMANO_PAGINA_LISTADO", 2)
+    respuestas = iter(["", "", "", "", "q"])
+    monkeypatch.setattr("builtins.input", lambda pregunta: next(respuestas))
+    rrhh.mostrar_informacion_empleados(registro)
+    
+    assert capsys.readouterr().out.count("Nombre completo: ") == 2
@@ -0,0 +1,254 @@
+import json
+
+import pytest
+
+import modelo
+import persistencia
+
+
+def describir_empleado(empleado):
+    return (empleado.id_empleado, type(empleado).__name__, empleado.nombre_completo, empleado.salario_base,
+            empleado.activo, persistencia.obtener_campos_instantanea(empleado),
+            sorted(proyecto.id_proyecto for proyecto in empleado.lista_proyectos))
+
+
+def describir_proyecto(proyecto):
+    return (proyecto.id_proyecto, proyecto.nombre_proyecto, proyecto.presupuesto_asignado,
+            proyecto.estado_proyecto, proyecto.costo_total_acumulado,
+            sorted(empleado.id_empleado for empleado in proyecto.lista_empleados_asignados))
+
+
+def describir_almacen(almacen):
+    return ([describir_empleado(almacen.cargar_empleado(id_empleado)) for id_empleado in almacen.ids_empleados()],
+            [describir_proyecto(almacen.cargar_proyecto(id_proyecto)) for id_proyecto in almacen.ids_proyectos()])
+
+
+@pytest.fixture
+def estado():
+    empleados = [modelo.Desarrollador("José Pérez", 1500.0, ["Python", "Go"], "Senior"),
+                 modelo.Diseñador("Lucía Gómez", 1200.0, ["Figma"], "UX"),
+                 modelo.Gerente("Ana Torres", 3000.0, "Ventas"),
+                 modelo.Desarrollador("Juan Ruiz", 900.0, [], "Junior")]
+    empleados[3].activo = False
+    proyectos = [modelo.Proyecto("Portal", 50000.0), modelo.Proyecto("App móvil", 20000.0)]
+    proyectos[1].estado_proyecto = "En curso"
+    for empleado in empleados[:3]:
+        empleado.enlazar_proyecto(proyectos[0])
+    empleados[0].enlazar_proyecto(proyectos[1])
+    return empleados, proyectos
+
+
+def test_instantanea_conserva_todo_el_estado(estado, tmp_path):
+    empleados, proyectos = estado
+    ruta = str(tmp_path / "estado.instantanea")
+    persistencia.guardar_instantanea(ruta, reversed(empleados), proyectos)
+    
+    instantanea = persistencia.InstantaneaBinaria(ruta)
+    try:
+        assert instantanea.contar_empleados() == len(empleados)
+        assert describir_almacen(instantanea) == ([describir_empleado(e) for e in empleados],
+                                                        [describir_proyecto(p) for p in proyectos])
+        assert instantanea.cargar_empleado(-1) is None
+    finally:
+        instantanea.cerrar()
+
+
+def test_instantanea_rechaza_archivos_ajenos(tmp_path):
+    ruta = tmp_path / "otro.instantanea"
+    ruta.write_bytes(b"no es una instantanea" * 10)
+    with pytest.raises(ValueError):
+        persistencia.InstantaneaBinaria(str(ruta))
+
+
+def crear_almacen_con_estado(ruta_base, estado, **opciones):
+    empleados, proyectos = estado
+    almacen = persistencia.AlmacenConDiario(ruta_base, **opciones)
+    almacen.guardar_empleados(empleados)
+    almacen.guardar_proyectos(proyectos)
+    almacen.guardar_asignaciones([(empleado, proyecto) for empleado in empleados
+                                  for proyecto in empleado.lista_proyectos])
+    return almacen
+
+
+def test_diario_se_reproduce_al_reabrir(estado, tmp_path):
+    ruta_base = str(tmp_path / "rrhh")
+    almacen = crear_almacen_con_estado(ruta_base, estado)
+    esperado = describir_almacen(almacen)
+    almacen.cerrar()
+    
+    reabierto = persistencia.AlmacenConDiario(ruta_base)
+    try:
+        assert describir_almacen(reabierto) == esperado
+    finally:
+        reabierto.cerrar()
+
+
+def test_diario_registra_los_cambios_de_empleados(estado, tmp_path):
+    ruta_base = str(tmp_path / "rrhh")
+    almacen = crear_almacen_con_estado(ruta_base, estado)
+    empleados, _ = estado
+    empleados[0].salario_base = 1700.0
+    empleados[0].nivel_experiencia = "SemiSenior"
+    empleados[2].activo = False
+    esperado = describir_almacen(almacen)
+    almacen.cerrar()
+    
+    reabierto = persistencia.AlmacenConDiario(ruta_base)
+    try:
+        assert describir_almacen(reabierto) == esperado
+        assert reabierto.cargar_empleado(empleados[0].id_empleado).nivel_experiencia == "SemiSenior"
+    finally:
+        reabierto.cerrar()
+
+
+def test_diario_descarta_la_ultima_linea_incompleta(estado, tmp_path):
+    ruta_base = str(tmp_path / "rrhh")
+    almacen = crear_almacen_con_estado(ruta_base, estado)
+    esperado = describir_almacen(almacen)
+    almacen.cerrar()
+    with open(ruta_base + ".diario", "ab") as archivo:
+        archivo.write(b'{"evento": "crear_proyecto", "id": 99')
+    
+    reabierto = persistencia.AlmacenConDiario(ruta_base)
+    try:
+        assert describir_almacen(reabierto) == esperado
+    finally:
+        reabierto.cerrar()
+    with open(ruta_base + ".diario", "rb") as archivo:
+        assert archivo.read().endswith(b"\n")
+
+
+def test_reproducir_dos_veces_es_idempotente(estado, tmp_path):
+    # Una caída entre el reemplazo de la instantánea y el recorte del diario
+    # deja eventos que ya están en la instantánea
+    ruta_base = str(tmp_path / "rrhh")
+    almacen = crear_almacen_con_estado(ruta_base, estado)
+    esperado = describir_almacen(almacen)
+    almacen.cerrar()
+    with open(ruta_base + ".diario", "rb") as archivo:
+        eventos = archivo.read()
+    
+    almacen = persistencia.AlmacenConDiario(ruta_base)
+    almacen.compactar()
+    almacen.cerrar()
+    with open(ruta_base + ".diario", "wb") as archivo:
+        archivo.write(eventos)
+    
+    reabierto = persistencia.AlmacenConDiario(ruta_base)
+    try:
+        assert describir_almacen(reabierto) == esperado
+    finally:
+        reabierto.cerrar()
+
+
+def test_compactacion_conserva_los_eventos_posteriores_al_corte(estado, tmp_path, monkeypatch):
+    ruta_base = str(tmp_path / "rrhh")
+    almacen = crear_almacen_con_estado(ruta_base, estado)
+    empleados, proyectos = estado
+    nuevo = modelo.Gerente("Marta Díaz", 2500.0, "Finanzas")
+    escribir_archivo_instantanea = persistencia.escribir_archivo_instantanea
+    
+    def escribir_con_cambios(*argumentos):
+        # Mientras se escribe la instantánea nueva llegan más cambios
+        almacen.cargar_empleado(empleados[1].id_empleado).salario_base = 1300.0
+        almacen.guardar_empleados([nuevo])
+        nuevo.enlazar_proyecto(proyectos[1])
+        almacen.guardar_asignaciones([(nuevo, proyectos[1])])
+        escribir_archivo_instantanea(*argumentos)
+    monkeypatch.setattr(persistencia, "escribir_archivo_instantanea", escribir_con_cambios)
+    
+    almacen.compactar()
+    monkeypatch.undo()
+    esperado_empleados = [describir_empleado(empleado) for empleado in empleados + [nuevo]]
+    
+    with open(ruta_base + ".diario", encoding="utf-8") as archivo:
+        eventos = [json.loads(linea)["evento"] for linea in archivo]
+    assert eventos == ["actualizar_empleado", "crear_empleado", "asignar"]
+    # Los objetos ya entregados siguen siendo los del almacén
+    assert almacen.cargar_empleado(empleados[0].id_empleado) is empleados[0]
+    assert almacen.cargar_empleado(empleados[1].id_empleado).salario_base == 1300.0
+    assert describir_almacen(almacen)[0] == esperado_empleados
+    almacen.cerrar()
+    
+    reabierto = persistencia.AlmacenConDiario(ruta_base)
+    try:
+        assert describir_almacen(reabierto)[0] == esperado_empleados
+        reabierto.compactar()
+        with open(ruta_base + ".diario", "rb") as archivo:
+            assert archivo.read() == b""
+    finally:
+        reabierto.cerrar()
+    reabierto = persistencia.AlmacenConDiario(ruta_base)
+    try:
+        assert describir_almacen(reabierto)[0] == esperado_empleados
+    finally:
+        reabierto.cerrar()
+
+
+def test_objetos_entregados_siguen_registrando_cambios_tras_compactar(tmp_path):
+    ruta_base = str(tmp_path / "rrhh")
+    almacen = persistencia.AlmacenConDiario(ruta_base, eventos_para_compactar=3)
+    empleados = [modelo.Gerente(f"Gerente {i}", 1000.0, "Ventas") for i in range(5)]
+    almacen.guardar_empleados(empleados)
+    almacen.hilo_compactacion.join()
+    
+    empleados[2].salario_base = 9999.0
+    assert almacen.cargar_empleado(empleados[2].id_empleado) is empleados[2]
+    assert almacen.contar_empleados() == 5
+    almacen.cerrar()
+    
+    reabierto = persistencia.AlmacenConDiario(ruta_base)
+    try:
+        assert reabierto.cargar_empleado(empleados[2].id_empleado).salario_base == 9999.0
+        assert reabierto.contar_empleados() == 5
+    finally:
+        reabierto.cerrar()
+
+
+def test_sqlite_conserva_estado_y_cambios(estado, tmp_path):
+    ruta = str(tmp_path / "rrhh.db")
+    empleados, proyectos = estado
+    almacen = persistencia.AlmacenSQLite(ruta)
+    almacen.guardar_empleados(empleados)
+    almacen.guardar_proyectos(proyectos)
+    almacen.guardar_asignaciones([(empleado, proyecto) for empleado in empleados
+                                  for proyecto in empleado.lista_proyectos])
+    empleados[1].salario_base = 1250.0
+    esperado = describir_almacen(almacen)
+    almacen.cerrar()
+    
+    reabierto = persistencia.AlmacenSQLite(ruta)
+    try:
+        assert describir_almacen(reabierto) == esperado
+    finally:
+        reabierto.cerrar()
+
+
+def test_sqlite_filtra_por_tipo_y_nombre_con_sus_indices(rrhh, estado, tmp_path, monkeypatch):
+    empleados, proyectos = estado
+    almacen = persistencia.AlmacenSQLite(str(tmp_path / "rrhh.db"))
+    registro_empleados = persistencia.RegistroEmpleadosPersistente(almacen)
+    registro_proyectos = persistencia.RegistroProyectosPersistente(almacen)
+    registro_empleados.extender(empleados)
+    registro_proyectos.extender(proyectos)
+    
+    def sin_recorrido():
+        raise AssertionError("se recorrió todo el registro")
+    monkeypatch.setattr(almacen, "ids_empleados", sin_recorrido)
+    monkeypatch.setattr(almacen, "nombres_proyectos", sin_recorrido)
+    try:
+        desarrolladores = list(rrhh.seleccionar_empleados(registro_empleados, "desarrollador"))
+        assert desarrolladores == [empleados[0], empleados[3]]
+        assert registro_proyectos.buscar_por_nombre("App móvil") == [proyectos[1]]
+        assert registro_proyectos.indice_nombres is None
+    finally:
+        almacen.cerrar()
+
+
+def test_registro_persistente_base_es_abstracto(tmp_path):
+    almacen = persistencia.AlmacenSQLite(str(tmp_path / "rrhh.db"))
+    try:
+        with pytest.raises(TypeError):
+            persistencia.RegistroPersistente(almacen)
+    finally:
+        almacen.cerrar()
@@ -0,0 +1,89 @@
+import math
+
+import pytest
+
+import modelo
+
+
+def test_buscar_por_id_usa_el_indice():
+    registro = modelo.RegistroEmpleados()
+    empleados = [modelo.Gerente(f"Empleado {i}", 1000.0, "General") for i in range(100)]
+    registro.extender(empleados)
+    assert registro.buscar_por_id(empleados[50].id_empleado) is empleados[50]
+    assert registro.buscar_por_id(-1) is None
+    assert empleados[10] in registro and modelo.Gerente("Otro", 1.0, "General") not in registro
+
+
+def test_agregar_rechaza_id_repetido():
+    registro = modelo.RegistroEmpleados()
+    empleado = modelo.Gerente("Ana", 1000.0, "General")
+    registro.agregar(empleado)
+    with pytest.raises(ValueError):
+        registro.agregar(empleado)
+    assert len(registro) == 1
+
+
+def test_inserciones_agregan_sin_copiar_las_listas():
+    # Cada inserción agrega en su lugar: las listas no se reconstruyen al crecer
+    registro = modelo.RegistroEmpleados()
+    proyecto = modelo.Proyecto("Proyecto", 10**6)
+    lista_registro = registro.lista_elementos
+    lista_proyecto = proyecto.lista_empleados_asignados
+    empleados = [modelo.Gerente(f"Empleado {i}", 1000.0, "General") for i in range(1000)]
+    listas_empleados = [empleado.lista_proyectos for empleado in empleados]
+    for empleado in empleados:
+        registro.agregar(empleado)
+        empleado.enlazar_proyecto(proyecto)
+    assert registro.lista_elementos is lista_registro and list(registro) == empleados
+    assert proyecto.lista_empleados_asignados is lista_proyecto and lista_proyecto == empleados
+    assert all(empleado.lista_proyectos is lista for empleado, lista in zip(empleados, listas_empleados))
+
+
+def test_costo_acumulado_coincide_con_recalculo():
+    proyecto = modelo.Proyecto("Proyecto", 10**6)
+    empleados = [modelo.Desarrollador("Dev", 1000.0 + i, ["Python"], "SemiSenior") for i in range(20)]
+    empleados += [modelo.Diseñador("Diseño", 900.0 + i, ["Figma"], "UX") for i in range(10)]
+    empleados += [modelo.Gerente("Gerencia", 2000.0 + i, "Ventas") for i in range(5)]
+    for empleado in empleados:
+        empleado.enlazar_proyecto(proyecto)
+    
+    # Cambios de salario, de categoría de compensación y bajas del proyecto
+    for posicion, empleado in enumerate(empleados):
+        if posicion % 3 == 0:
+            empleado.salario_base = empleado.salario_base * 1.1
+    for empleado in empleados[:20:4]:
+        empleado.nivel_experiencia = "Senior"
+    for empleado in empleados[::7]:
+        empleado.desenlazar_proyecto(proyecto)
+    
+    assert proyecto.verificar_consistencia_costo()
+    assert math.isclose(proyecto.costo_total_acumulado,
+                        math.fsum(empleado.calcular_salario_total() for empleado in proyecto.lista_empleados_asignados))
+
+
+def test_verificacion_de_costos_detecta_inconsistencias(monkeypatch):
+    monkeypatch.setattr(modelo.Proyecto, "verificar_consistencia_costos", True)
+    proyecto = modelo.Proyecto("Proyecto", 10**6)
+    modelo.Gerente("Gerencia", 2000.0, "Ventas").enlazar_proyecto(proyecto)
+    assert proyecto.calcular_costo_total_proyecto() == proyecto.recalcular_costo_total_proyecto()
+    proyecto.costo_total_acumulado += 1
+    with pytest.raises(ValueError):
+        proyecto.calcular_costo_total_proyecto()
+
+
+def test_registro_base_es_abstracto():
+    with pytest.raises(TypeError):
+        modelo.Registro()
+
+
+def test_nomina_columnar_coincide_con_cada_empleado(rrhh):
+    empleados = [modelo.Desarrollador("Ana Pérez", 1000.0, ["Python"], "Senior"),
+                 modelo.Diseñador("Luis Gómez", 1500.0, ["Figma"], "UX"),
+                 modelo.Gerente("Marta Ruiz", 2000.0, "Ventas"),
+                 modelo.Empleado("Juan Díaz", 800.0)]
+    nomina = rrhh.NominaColumnar.desde_empleados(empleados)
+    
+    assert len(nomina) == len(empleados)
+    assert list(nomina.calcular_salarios_totales()) == [e.calcular_salario_total() for e in empleados]
+    assert nomina.calcular_total_nomina() == pytest.approx(math.fsum(e.calcular_salario_total()
+                                                                     for e in empleados))
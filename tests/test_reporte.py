@@ -0,0 +1,49 @@
+import random
+
+import pytest
+
+import modelo
+
+
+@pytest.fixture
+def registros():
+    generador = random.Random(20)
+    registro_empleados = modelo.RegistroEmpleados()
+    registro_proyectos = modelo.RegistroProyectos()
+    constructores = [lambda numero: modelo.Desarrollador(f"Desarrollador {numero}", 1000.0 + numero,
+                                                       ["Python"], "Senior"),
+                     lambda numero: modelo.Diseñador(f"Diseñador {numero}", 1000.0 + numero, ["Figma"], "UX"),
+                     lambda numero: modelo.Gerente(f"Gerente {numero}", 1000.0 + numero, "Ventas")]
+    registro_empleados.extender(constructores[numero % 3](numero) for numero in range(101))
+    registro_proyectos.extender(modelo.Proyecto(f"Proyecto {numero}", generador.uniform(0, 5000))
+                                for numero in range(37))
+    empleados = list(registro_empleados)
+    for proyecto in registro_proyectos:
+        for empleado in generador.sample(empleados, generador.randint(0, 4)):
+            if empleado.obtener_cantidad_proyectos() < empleado.limite_proyectos:
+                empleado.enlazar_proyecto(proyecto)
+    return registro_empleados, registro_proyectos
+
+
+def test_estadisticas_en_paralelo_son_identicas_a_las_seriales(registros):
+    serial = modelo.calcular_estadisticas_sistema(*registros)
+    paralelo = modelo.calcular_estadisticas_en_paralelo(*registros, procesos=3, fragmentos_por_proceso=2)
+    
+    assert serial.total_empleados == 101
+    assert 0 < serial.proyectos_no_factibles < serial.total_proyectos
+    assert vars(paralelo) == vars(serial)
+
+
+def test_reporte_general_no_depende_de_los_procesos(rrhh, registros, capsys):
+    rrhh.generar_reporte_general(*registros)
+    serial = capsys.readouterr().out
+    rrhh.generar_reporte_general(*registros, procesos=2)
+    
+    assert capsys.readouterr().out == serial
+
+
+def test_reporte_paralelo_sin_proyectos(registros):
+    registro_empleados, _ = registros
+    paralelo = modelo.calcular_estadisticas_en_paralelo(registro_empleados, modelo.RegistroProyectos(), procesos=2)
+    
+    assert vars(paralelo) == vars(modelo.calcular_estadisticas_sistema(registro_empleados, []))
@@ -0,0 +1,59 @@
+import itertools
+import random
+
+import pytest
+
+import modelo
+
+
+@pytest.fixture
+def candidatos():
+    # El voraz toma al de mayor valor por costo y ya no entra nadie más
+    return [modelo.Empleado("Ana Pérez", 600.0), modelo.Empleado("Luis Gómez", 500.0),
+            modelo.Empleado("Marta Ruiz", 500.0)]
+
+
+def valorar_por_salario(valores):
+    return lambda empleado: valores[empleado.salario_base]
+
+
+def test_exacto_supera_al_voraz_en_un_grupo_chico(rrhh, candidatos):
+    proyecto = modelo.Proyecto("Portal", 1000.0)
+    valorar = valorar_por_salario({600.0: 7.0, 500.0: 5.0})
+    exacta = rrhh.seleccionar_equipo(proyecto, candidatos, valorar)
+    voraz = rrhh.seleccionar_equipo(proyecto, candidatos, valorar, tamano_maximo_exacto=0)
+    
+    assert exacta.es_optimo
+    assert exacta.empleados == candidatos[1:]
+    assert (exacta.costo_total, exacta.valor_total) == (1000.0, 10.0)
+    assert not voraz.es_optimo
+    assert voraz.empleados == candidatos[:1]
+    assert voraz.valor_total == 7.0
+
+
+def test_exacto_coincide_con_fuerza_bruta(rrhh):
+    generador = random.Random(17)
+    for _ in range(20):
+        costos = [generador.uniform(100, 1000) for _ in range(10)]
+        valores = [generador.uniform(1, 10) for _ in range(10)]
+        presupuesto = generador.uniform(500, 3000)
+        mejor_valor = max(sum(valores[posicion] for posicion in combinacion)
+                          for tamano in range(len(costos) + 1)
+                          for combinacion in itertools.combinations(range(len(costos)), tamano)
+                          if sum(costos[posicion] for posicion in combinacion) <= presupuesto)
+        seleccion, valor, es_optimo = rrhh.seleccionar_exacto(costos, valores, presupuesto, float("inf"))
+        
+        assert es_optimo
+        assert valor == pytest.approx(mejor_valor)
+        assert sum(costos[posicion] for posicion in seleccion) <= presupuesto
+        assert rrhh.seleccionar_voraz(costos, valores, presupuesto)[1] >= mejor_valor / 2
+
+
+def test_seleccion_omite_asignados_y_sin_capacidad(rrhh, candidatos, monkeypatch):
+    monkeypatch.setattr(modelo.Empleado, "limite_proyectos", 1)
+    proyecto = modelo.Proyecto("Portal", 10**5)
+    candidatos[0].enlazar_proyecto(proyecto)
+    candidatos[1].enlazar_proyecto(modelo.Proyecto("Otro", 10**5))
+    seleccion = rrhh.seleccionar_equipo(proyecto, candidatos + [candidatos[2]], lambda empleado: 1.0)
+    
+    assert seleccion.empleados == [candidatos[2]]
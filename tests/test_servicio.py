@@ -0,0 +1,90 @@
+import asyncio
+
+import pytest
+
+import modelo
+import servicio
+
+
+@pytest.fixture
+def servicio_rrhh():
+    servicio_rrhh = servicio.ServicioRRHH(modelo.RegistroEmpleados(), modelo.RegistroProyectos())
+    yield servicio_rrhh
+    servicio_rrhh.cerrar()
+
+
+async def con_servidor(servicio_rrhh, conversacion):
+    # Levanta el servicio en un puerto libre y ejecuta la conversación en una conexión
+    iniciado = asyncio.get_running_loop().create_future()
+    tarea = asyncio.create_task(servicio.servir(servicio_rrhh, puerto=0, al_iniciar=iniciado.set_result))
+    try:
+        lector, escritor = await asyncio.open_connection("127.0.0.1", await iniciado)
+        try:
+            return await conversacion(lector, escritor)
+        finally:
+            escritor.close()
+    finally:
+        tarea.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await tarea
+
+
+def solicitar(servicio_rrhh, solicitudes):
+    async def conversacion(lector, escritor):
+        return [await servicio.enviar_solicitud(lector, escritor, *solicitud) for solicitud in solicitudes]
+    return asyncio.run(con_servidor(servicio_rrhh, conversacion))
+
+
+def enviar_crudo(servicio_rrhh, solicitud):
+    async def conversacion(lector, escritor):
+        escritor.write(solicitud)
+        await escritor.drain()
+        return await lector.read()
+    return asyncio.run(con_servidor(servicio_rrhh, conversacion))
+
+
+def test_crear_consultar_y_asignar(servicio_rrhh):
+    (estado_empleado, empleado), (estado_proyecto, proyecto) = solicitar(servicio_rrhh, [
+        ("POST", "/empleados", {"tipo_empleado": "gerente", "nombre_completo": "Marta Ruiz",
+                                "salario_base": 2000, "departamento_gerencia": "Ventas"}),
+        ("POST", "/proyectos", {"nombre_proyecto": "Portal", "presupuesto_asignado": 10000})])
+    pares = {"id_empleado": empleado["id_empleado"], "id_proyecto": proyecto["id_proyecto"]}
+    (estado_asignacion, _), (estado_repetida, repetida), (_, factibilidad) = solicitar(servicio_rrhh, [
+        ("POST", "/asignaciones", pares), ("POST", "/asignaciones", pares),
+        ("GET", f"/proyectos/{proyecto['id_proyecto']}/factibilidad")])
+    
+    assert (estado_empleado, estado_proyecto, estado_asignacion) == (201, 201, 200)
+    assert estado_repetida == 409
+    assert repetida["error"] == "El empleado ya está asignado a este proyecto"
+    assert factibilidad["cantidad_empleados"] == 1 and factibilidad["factible"]
+
+
+def test_errores_de_solicitud(servicio_rrhh):
+    respuestas = solicitar(servicio_rrhh, [
+        ("POST", "/empleados", {"tipo_empleado": "astronauta", "nombre_completo": "Marta Ruiz",
+                                "salario_base": 2000}),
+        ("POST", "/proyectos", ["no", "es", "un", "objeto"]),
+        ("GET", "/empleados/abc"),
+        ("GET", "/empleados/999999"),
+        ("GET", "/desconocida"),
+        ("DELETE", "/reporte")])
+    
+    assert [estado for estado, _ in respuestas] == [400, 400, 400, 404, 404, 405]
+    assert respuestas[0][1] == {"error": "Tipo de empleado no válido"}
+
+
+def test_cuerpo_demasiado_grande_responde_413_y_cierra(servicio_rrhh):
+    respuesta = enviar_crudo(servicio_rrhh, (f"POST /proyectos HTTP/1.1\r\n"
+                                             f"Content-Length: {servicio.MAXIMO_CUERPO_SOLICITUD + 1}\r\n\r\n").encode())
+    
+    assert respuesta.startswith(b"HTTP/1.1 413 Payload Too Large\r\n")
+    assert b"Connection: close" in respuesta
+
+
+@pytest.mark.parametrize("longitud", ["-1", "12abc", "\xb2"])
+def test_content_length_invalido_responde_400_y_cierra(servicio_rrhh, longitud):
+    respuesta = enviar_crudo(servicio_rrhh, (f"POST /proyectos HTTP/1.1\r\n"
+                                             f"Content-Length: {longitud}\r\n\r\n{{}}").encode("latin-1"))
+    
+    assert respuesta.startswith(b"HTTP/1.1 400 Bad Request\r\n")
+    assert b"Connection: close" in respuesta